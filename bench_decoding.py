@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+"""
+Mesure du décodage des réponses ListerRencontres : ancienne lecture (json + dicts
+par match) contre le décodage actuel en enregistrements Match, via les dicts
+(decoding.loads + parse_rencontres) et typé (decoding.decode_rencontres).
+
+Utilise les réponses enregistrées par ffh_standin.py (recordings/ffh/ListerRencontres),
+ou une réponse générée si aucun enregistrement n'est disponible.
+
+Usage:
+    python bench_decoding.py [--scale 10] [--repeat 20]
+"""
+
+import argparse
+import glob
+import json
+import os
+import time
+
+from decoding import decode_rencontres, json_backend, loads, parse_rencontres
+from ffh_standin import RECORDINGS_DIR, _scale_rencontres
+
+
+def legacy_parse(data):
+    """Lecture d'origine : chaînes de .get() et un dict de 7 clés par match."""
+    matches_list = []
+    for match_id, match_data in data.get("Response", {}).get("RencontresArray", {}).items():
+        scores = match_data.get("Scores", {})
+        but1 = int(scores.get("RencButsEqp1") or 0) if scores.get("RencButsEqp1") else None
+        but2 = int(scores.get("RencButsEqp2") or 0) if scores.get("RencButsEqp2") else None
+        if scores.get("RencScoresSaisieDate"):
+            statut = "FINISHED"
+        elif match_data.get("RencNonJoue") == "O":
+            statut = "NOT_PLAYED"
+        else:
+            statut = "SCHEDULED"
+        matches_list.append({
+            "rencId": str(match_data.get("RencId", "")),
+            "date": str(match_data.get("RencDateDerog", "")),
+            "equipe_domicile": str(match_data.get("Equipe1", {}).get("EquipeNom", "")),
+            "equipe_exterieur": str(match_data.get("Equipe2", {}).get("EquipeNom", "")),
+            "score_domicile": but1,
+            "score_exterieur": but2,
+            "statut": statut
+        })
+    return matches_list
+
+
+def public(matches):
+    """Matchs au format public, réduits aux champs de la lecture d'origine."""
+    return [{key: value for key, value in m.to_dict().items() if not key.endswith("_id")} for m in matches]
+
+
+def synthetic_body(count=400):
+    """Réponse ListerRencontres générée (10 équipes, 2/3 des matchs joués)."""
+    teams = [f"EQUIPE {i} HC" for i in range(10)]
+    rencontres = {}
+    for i in range(count):
+        played = i % 3 != 0
+        rencontres[str(100000 + i)] = {
+            "RencId": str(100000 + i),
+            "RencDateDerog": f"2026-{1 + i % 12:02d}-{1 + i % 28:02d} 15:00:00",
+            "RencNonJoue": "N",
+            "Equipe1": {"EquipeId": str(i % 10), "EquipeNom": teams[i % 10], "EquipeCode": "X"},
+            "Equipe2": {"EquipeId": str((i + 3) % 10), "EquipeNom": teams[(i + 3) % 10], "EquipeCode": "Y"},
+            "Scores": {
+                "RencButsEqp1": str(i % 5) if played else "",
+                "RencButsEqp2": str(i % 4) if played else "",
+                "RencScoresSaisieDate": "2026-01-01" if played else ""
+            },
+            "Poule": {"PouleId": "1", "PouleLib": "Poule A"},
+            "Terrain": {"TerrainNom": "Stade", "TerrainVille": "Ville"}
+        }
+    return json.dumps({"ResponseCode": "200", "Response": {"RencontresArray": rencontres}}).encode("utf-8")
+
+
+def load_bodies(scale):
+    """Corps des réponses enregistrées (texte JSON d'origine), agrandis si scale > 1."""
+    bodies = []
+    for path in sorted(glob.glob(os.path.join(RECORDINGS_DIR, "ListerRencontres", "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            bodies.append((os.path.basename(path), json.load(f)["body"].encode("utf-8")))
+    if not bodies:
+        bodies = [("synthétique", synthetic_body())]
+    if scale > 1:
+        bodies = [(name, _scale_rencontres(body, scale)) for name, body in bodies]
+    return bodies
+
+
+def bench(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--scale", type=int, default=1, help="multiplie le nombre de rencontres")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"Décodeurs: {json_backend()}")
+    print(f"{'réponse':<40} {'matchs':>7} {'taille':>9} {'ancien':>9} {'dicts':>9} {'typé':>9} {'gain':>6}")
+    for name, body in load_bodies(args.scale):
+        old = legacy_parse(json.loads(body.decode("utf-8")))
+        assert public(parse_rencontres(loads(body))) == old, f"résultats différents pour {name}"
+        assert public(decode_rencontres(body)[2]) == old, f"résultats différents pour {name}"
+
+        legacy = bench(lambda: legacy_parse(json.loads(body.decode("utf-8"))), args.repeat)
+        dicts = bench(lambda: parse_rencontres(loads(body)), args.repeat)
+        typed = bench(lambda: decode_rencontres(body), args.repeat)
+        print(f"{name[:40]:<40} {len(old):>7} {len(body) // 1024:>7}Ko "
+              f"{legacy:>7.2f}ms {dicts:>7.2f}ms {typed:>7.2f}ms {legacy / typed:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
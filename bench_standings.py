@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+"""
+Mesure du calcul complet d'un classement (standings.py) : boucle Python d'une
+StandingsTable contre le calcul vectorisé NumPy (np.add.at, np.lexsort), pour des
+ensembles de résultats de taille croissante (un championnat, plusieurs saisons...).
+
+Le calcul vectorisé est choisi automatiquement à partir de VECTORIZE_MIN_RESULTS
+résultats (variable d'environnement STANDINGS_VECTORIZE_MIN) : ce banc permet de
+placer ce seuil.
+
+Usage:
+    python bench_standings.py [--repeat 20] [--tiebreakers difference,buts_pour]
+"""
+
+import argparse
+import random
+import time
+
+from standings import (
+    TIEBREAK_GOAL_DIFF, TIEBREAK_GOALS_FOR, VECTORIZE_MIN_RESULTS, compute_standings, standings_backend
+)
+
+# (nombre de résultats, nombre d'équipes)
+SIZES = [(45, 10), (90, 10), (250, 20), (500, 20), (1000, 40), (5000, 100), (20000, 200), (100000, 500)]
+
+
+def synthetic_results(count, teams, seed=0):
+    """Résultats générés : équipes tirées au hasard, 0 à 5 buts par équipe."""
+    rnd = random.Random(seed)
+    names = [f"EQUIPE {i} HC" for i in range(teams)]
+    results = []
+    for _ in range(count):
+        home, away = rnd.sample(names, 2)
+        results.append((home, away, rnd.randrange(6), rnd.randrange(6)))
+    return results
+
+
+def bench(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--tiebreakers", default=f"{TIEBREAK_GOAL_DIFF},{TIEBREAK_GOALS_FOR}",
+                        help="critères de départage, séparés par des virgules")
+    args = parser.parse_args()
+    tiebreakers = tuple(rule for rule in args.tiebreakers.split(",") if rule)
+
+    if standings_backend() != "numpy":
+        print("NumPy n'est pas installé : seul le calcul en boucle est disponible")
+        return
+    print(f"Critères: {', '.join(tiebreakers) or 'aucun'} ; seuil actuel: {VECTORIZE_MIN_RESULTS} résultats")
+    print(f"{'résultats':>9} {'équipes':>8} {'boucle':>10} {'numpy':>10} {'gain':>6}")
+    for count, teams in SIZES:
+        results = synthetic_results(count, teams)
+        scalar_rows = compute_standings(results, tiebreakers, vectorized=False)
+        vector_rows = compute_standings(results, tiebreakers, vectorized=True)
+        assert [r.to_dict() for r in scalar_rows] == [r.to_dict() for r in vector_rows], \
+            f"résultats différents pour {count} résultats"
+
+        repeat = max(3, args.repeat if count <= 5000 else args.repeat // 4)
+        scalar = bench(lambda: compute_standings(results, tiebreakers, vectorized=False), repeat)
+        vector = bench(lambda: compute_standings(results, tiebreakers, vectorized=True), repeat)
+        print(f"{count:>9} {teams:>8} {scalar:>8.2f}ms {vector:>8.2f}ms {scalar / vector:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+"""
+Cache stale-while-revalidate pour les données FFH
+Sert immédiatement la dernière valeur connue et la rafraîchit en arrière-plan,
+et ne recalcule les données dérivées que si leur source a changé
+"""
+
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from cachetools import LRUCache
+
+
+# Lectures de cache effectuées pendant la requête HTTP en cours.
+# Le middleware place une liste dans ce contexte ; le cache y ajoute ses lectures.
+_request_reads: ContextVar[Optional[List[Dict]]] = ContextVar("cache_reads", default=None)
+
+
+def track_cache_reads() -> List[Dict]:
+    """
+    Commence le suivi des lectures de cache pour la requête en cours.
+
+    Returns:
+        List[Dict]: Liste remplie par le cache ({"key", "status", "age"}) au fil des lectures.
+        "FALLBACK" signale une valeur servie parce que son rechargement a échoué.
+    """
+    reads: List[Dict] = []
+    _request_reads.set(reads)
+    return reads
+
+
+def current_cache_reads() -> Optional[List[Dict]]:
+    """Lectures de cache de la requête en cours (None hors d'une requête suivie)."""
+    return _request_reads.get()
+
+
+def _record_read(key: str, status: str, age: float, version: int = 0) -> None:
+    """
+    Enregistre une lecture ("HIT", "STALE", "MISS" ou "FALLBACK") pour la requête en cours,
+    avec la version de la valeur lue.
+    """
+    reads = _request_reads.get()
+    if reads is not None:
+        reads.append({"key": key, "status": status, "age": age, "version": version})
+
+
+# Données dérivées des réponses FFH : nom -> (source, résultat).
+# fetch_rencontres() retourne le même objet tant que le contenu téléchargé est identique,
+# le résultat est donc réutilisé tant que la source est le même objet.
+_derived: LRUCache = LRUCache(maxsize=300)
+
+
+def derive(name: Any, source: Any, compute: Callable[[Any], Any]) -> Any:
+    """
+    Calcule compute(source), ou réutilise le résultat précédent si la source n'a pas changé.
+    Le résultat est partagé entre les appels et ne doit pas être modifié.
+
+    Args:
+        name: Identifiant de la donnée dérivée (ex: ("matchs_manif", "4317"))
+        source: Donnée d'entrée (réponse brute ou donnée déjà dérivée)
+        compute: Fonction de calcul
+
+    Returns:
+        Le résultat de compute(source)
+    """
+    entry = _derived.get(name)
+    if entry is not None and entry[0] is source:
+        return entry[1]
+    result = compute(source)
+    _derived[name] = (source, result)
+    return result
+
+
+class SWRCache:
+    """
+    Cache avec politique stale-while-revalidate.
+
+    - age < soft_ttl : la valeur est fraîche et servie directement
+    - soft_ttl <= age < hard_ttl : la valeur est servie immédiatement (marquée stale)
+      et un seul rafraîchissement est lancé en arrière-plan
+    - age >= hard_ttl ou absente : l'appelant attend le chargement
+
+    Les durées soft_ttl / hard_ttl peuvent être redéfinies par clé (set_ttl).
+
+    Les valeurs restaurées depuis le disque au démarrage (restore) sont servies immédiatement,
+    quel que soit leur âge, et rafraîchies en arrière-plan.
+
+    Si un chargement échoue, la dernière valeur connue est conservée (quel que soit son âge)
+    et continue d'être servie, marquée "FALLBACK", jusqu'au prochain chargement réussi.
+    Une erreur n'est propagée que si aucune valeur n'a jamais été chargée.
+
+    Un rechargement qui retourne le même objet que la valeur en cache (donnée dérivée
+    réutilisée par derive()) ne compte pas comme un changement : seuls les vrais
+    changements incrémentent la version de la clé et notifient les abonnés.
+
+    Avec une fonction digest, chaque valeur a une empreinte de son contenu (etag),
+    calculée une fois par version : deux versions au contenu identique ont la même.
+    """
+
+    def __init__(self, soft_ttl: float, hard_ttl: float, maxsize: int = 100,
+                 background: Optional[Callable[[Callable[[], Awaitable[Any]]], Awaitable[Any]]] = None,
+                 digest: Optional[Callable[[Any], str]] = None):
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self._digest = digest
+        # key -> (version, empreinte du contenu)
+        self._etags: Dict[str, Tuple[int, str]] = {}
+        # Enveloppe des rafraîchissements en arrière-plan (ex: priorité basse vers la FFH)
+        self._background = background
+        # key -> (valeur, timestamp de stockage)
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+        # Chargements en cours par clé (un seul à la fois)
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        # key -> (version, timestamp du dernier changement)
+        self._versions: Dict[str, Tuple[int, float]] = {}
+        self._listeners: List[Callable[[str, Any], None]] = []
+        # key -> (timestamp, message) du dernier chargement échoué, tant qu'il n'a pas réussi depuis
+        self._failures: Dict[str, Tuple[float, str]] = {}
+        # Clés restaurées depuis le disque et pas encore rechargées
+        self._restored: set = set()
+        self._store_listeners: List[Callable[[str, Any, float, float, bool], None]] = []
+        # key -> (soft_ttl, hard_ttl) propres à la clé
+        self._ttls: Dict[str, Tuple[float, float]] = {}
+
+    def set_ttl(self, key: str, soft_ttl: float, hard_ttl: float) -> None:
+        """Définit les durées de fraîcheur et de conservation propres à key."""
+        self._ttls[key] = (soft_ttl, hard_ttl)
+
+    def ttl(self, key: str) -> Tuple[float, float]:
+        """(soft_ttl, hard_ttl) applicables à key."""
+        return self._ttls.get(key, (self.soft_ttl, self.hard_ttl))
+
+    async def get(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Retourne la valeur associée à key en appliquant la politique stale-while-revalidate.
+
+        Args:
+            key: Clé de cache
+            loader: Fonction retournant la coroutine qui recalcule la valeur
+
+        Returns:
+            La valeur en cache (éventuellement stale) ou fraîchement chargée
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = time.time() - stored_at
+            soft_ttl, hard_ttl = self.ttl(key)
+            if age < soft_ttl:
+                _record_read(key, "HIT", age, self.version(key))
+                return value
+            if age < hard_ttl or key in self._restored:
+                self._start_refresh(key, self._in_background(loader))
+                _record_read(key, "FALLBACK" if key in self._failures else "STALE", age, self.version(key))
+                return value
+
+        value = await asyncio.shield(self._start_refresh(key, loader))
+        if key in self._failures:
+            _record_read(key, "FALLBACK", self.age(key) or 0.0, self.version(key))
+        else:
+            _record_read(key, "MISS", 0.0, self.version(key))
+        return value
+
+    async def refresh(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Force le rechargement de key, quel que soit son âge (utilisé par le planificateur).
+        Si un chargement est déjà en cours pour cette clé, il est réutilisé.
+
+        Args:
+            key: Clé de cache
+            loader: Fonction retournant la coroutine qui recalcule la valeur
+
+        Returns:
+            La nouvelle valeur (ou la précédente si le chargement a échoué)
+        """
+        return await asyncio.shield(self._start_refresh(key, loader))
+
+    def _in_background(self, loader: Callable[[], Awaitable[Any]]) -> Callable[[], Awaitable[Any]]:
+        """Enveloppe un chargement que personne n'attend (rafraîchissement d'une valeur stale)."""
+        if self._background is None:
+            return loader
+        return lambda: self._background(loader)
+
+    def _start_refresh(self, key: str, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """Lance (ou réutilise) le chargement de key et retourne la tâche associée."""
+        task = self._refreshing.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh(key, loader))
+            self._refreshing[key] = task
+            task.add_done_callback(lambda t: self._refresh_done(key, t))
+        return task
+
+    def _refresh_done(self, key: str, task: asyncio.Task) -> None:
+        self._refreshing.pop(key, None)
+        # Un rafraîchissement en arrière-plan n'a personne pour récupérer son exception
+        if not task.cancelled():
+            task.exception()
+
+    async def _refresh(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Charge la valeur et la stocke. En cas d'erreur, la dernière valeur connue est conservée."""
+        try:
+            value = await loader()
+        except Exception as e:
+            self._failures[key] = (time.time(), str(e))
+            entry = self._entries.get(key)
+            if entry is None:
+                raise
+            print(f"⚠️  Rafraîchissement de '{key}' échoué, dernière valeur connue conservée: {e}")
+            return entry[0]
+        self._failures.pop(key, None)
+        self._store(key, value)
+        return value
+
+    def _store(self, key: str, value: Any) -> None:
+        """Stocke la valeur ; si elle a changé, incrémente la version et notifie les abonnés."""
+        now = time.time()
+        entry = self._entries.get(key)
+        self._entries[key] = (value, now)
+        self._restored.discard(key)
+        changed = entry is None or entry[0] is not value
+        if changed:
+            version = self._versions.get(key, (0, now))[0] + 1
+            self._versions[key] = (version, now)
+
+        for callback in self._store_listeners:
+            try:
+                callback(key, value, now, self._versions[key][1], changed)
+            except Exception as e:
+                print(f"⚠️  Erreur lors de l'enregistrement de '{key}': {e}")
+
+        if not changed or entry is None:
+            return
+        for callback in self._listeners:
+            try:
+                callback(key, value)
+            except Exception as e:
+                print(f"⚠️  Erreur dans un abonné aux changements de '{key}': {e}")
+
+    def on_change(self, callback: Callable[[str, Any], None]) -> None:
+        """
+        Enregistre une fonction appelée (key, nouvelle valeur) quand une valeur déjà
+        en cache est remplacée par une valeur différente.
+        """
+        self._listeners.append(callback)
+
+    def on_store(self, callback: Callable[[str, Any, float, float, bool], None]) -> None:
+        """
+        Enregistre une fonction appelée à chaque chargement réussi :
+        (key, valeur, timestamp de stockage, timestamp du dernier changement, changée ou non).
+        """
+        self._store_listeners.append(callback)
+
+    def restore(self, key: str, value: Any, stored_at: float, changed_at: float) -> None:
+        """
+        Réinjecte une valeur sauvegardée (au démarrage), avec son âge : fraîche jusqu'au
+        soft TTL, puis servie stale même au-delà du hard TTL et rafraîchie en arrière-plan.
+        Les abonnés ne sont pas notifiés.
+        """
+        self._entries[key] = (value, stored_at)
+        self._versions[key] = (1, changed_at)
+        self._restored.add(key)
+
+    def version(self, key: str) -> int:
+        """Numéro de version de la valeur (incrémenté à chaque vrai changement), 0 si absente."""
+        return self._versions.get(key, (0, 0.0))[0]
+
+    def changed_at(self, key: str) -> Optional[float]:
+        """Timestamp du dernier vrai changement de la valeur, ou None si absente."""
+        entry = self._versions.get(key)
+        return None if entry is None else entry[1]
+
+    def etag(self, key: str) -> Optional[str]:
+        """
+        Empreinte du contenu de la valeur de key (fonction digest), calculée une fois par
+        version ; None si la valeur est absente ou sans fonction digest.
+        """
+        entry = self._entries.get(key)
+        if entry is None or self._digest is None:
+            return None
+        version = self.version(key)
+        cached = self._etags.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        etag = self._digest(entry[0])
+        self._etags[key] = (version, etag)
+        return etag
+
+    def fresh(self, key: str) -> bool:
+        """La valeur de key est fraîche (âge < soft TTL) : get() la servirait sans la recharger."""
+        entry = self._entries.get(key)
+        return entry is not None and time.time() - entry[1] < self.ttl(key)[0]
+
+    def failure(self, key: str) -> Optional[Tuple[float, str]]:
+        """(timestamp, message) du dernier échec de chargement de key, si aucun succès depuis."""
+        return self._failures.get(key)
+
+    def age(self, key: str) -> Optional[float]:
+        """Âge en secondes de la valeur en cache, ou None si absente."""
+        entry = self._entries.get(key)
+        return None if entry is None else time.time() - entry[1]
+
+    def entries(self) -> List[Tuple[str, float]]:
+        """Liste des clés en cache avec leur âge en secondes."""
+        now = time.time()
+        return [(key, now - stored_at) for key, (_, stored_at) in list(self._entries.items())]
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and time.time() - entry[1] < self.ttl(key)[1]
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return self._entries[key][0]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._store(key, value)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[0]
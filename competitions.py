@@ -0,0 +1,247 @@
+"""
+Registre des compétitions suivies
+Chaque compétition est décrite une seule fois (identifiants FFH, filtre d'équipe,
+source du classement, durée de cache et priorité de rafraîchissement) : le scraper,
+le cache, le planificateur et les routes de l'API sont construits à partir de ce registre.
+
+Ajouter une compétition = ajouter une entrée à COMPETITIONS.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from standings import TIEBREAK_GOAL_DIFF, TIEBREAK_GOALS_FOR
+
+
+# Sources du classement
+RANKING_FFH = "ffh"                # classement publié par la FFH (ClassementEquipes, PouleId)
+RANKING_MATCHS = "matchs"          # calculé depuis les matchs de la manifestation (standings.py)
+RANKING_RENCONTRES = "rencontres"  # idem
+RANKING_SALLE = "salle"            # idem, départagé par défaut par les buts marqués
+
+# Critères de départage par défaut d'un classement calculé (après les points)
+DEFAULT_TIEBREAKERS = (TIEBREAK_GOAL_DIFF,)
+SALLE_TIEBREAKERS = (TIEBREAK_GOAL_DIFF, TIEBREAK_GOALS_FOR)
+
+# Durées de cache par défaut (secondes) : fraîches 5 minutes, servies stale jusqu'à 30 minutes
+DEFAULT_SOFT_TTL = 300
+DEFAULT_HARD_TTL = 1800
+
+# Priorités de rafraîchissement (la plus petite passe en premier)
+PRIORITY_CLUB = 0     # équipes du club (Carquefou HC)
+PRIORITY_ELITE = 1    # championnats élite
+PRIORITY_OTHER = 2    # autres compétitions
+
+# Affichage harmonisé du club dans les matchs : (motif dans le nom FFH, nom affiché)
+CARQUEFOU = ("CARQUEFOU", "Carquefou HC")
+
+
+class Competition:
+    """
+    Une compétition suivie par l'API.
+
+    - id : identifiant stable (ex: "elite-hommes-gazon"), utilisé pour les clés de cache
+    - discipline, categorie : "gazon" / "salle", et catégorie (ex: "u14-garcons")
+    - manif_id / poule_id : identifiants FFH (la poule est prioritaire si renseignée) ;
+      vides tant que la FFH n'a pas publié la compétition
+    - team_filter : ne garder que les matchs d'une équipe (ex: "CARQUEFOU HC 1")
+    - normalize_names : supprimer les numéros de poule des noms ("CARQUEFOU HC 1" -> "CARQUEFOU HC")
+    - rename : (motif, nom affiché) pour harmoniser le nom d'un club
+    - ranking : source du classement (RANKING_*), None si la compétition n'en a pas
+    - tiebreakers : critères de départage d'un classement calculé (standings.TIEBREAK_*),
+      SALLE_TIEBREAKERS par défaut en salle, DEFAULT_TIEBREAKERS sinon
+    - path, tag, label : routes /classement et /matchs générées, tag et libellé de l'API ;
+      sans path, la compétition n'a pas de routes génériques (U14)
+    - live_id : identifiant utilisé par le live score (Firebase), None si non importable
+    - firebase_sync : recopier les matchs dans Firebase à chaque lecture
+    - required : une liste vide signifie que la FFH est indisponible (503)
+    - placeholder_teams : équipes affichées à 0 point tant qu'aucun match n'est joué
+    - soft_ttl / hard_ttl : durées de cache, priority : priorité de rafraîchissement
+    """
+
+    __slots__ = ("id", "discipline", "categorie", "manif_id", "poule_id", "team_filter",
+                 "normalize_names", "rename", "ranking", "path", "tag", "label", "live_id",
+                 "firebase_sync", "required", "placeholder_teams", "soft_ttl", "hard_ttl", "priority",
+                 "tiebreakers")
+
+    def __init__(self, id: str, discipline: str, categorie: str, manif_id: str = "", poule_id: str = "",
+                 team_filter: Optional[str] = None, normalize_names: bool = False,
+                 rename: Optional[Tuple[str, str]] = None, ranking: Optional[str] = None,
+                 path: Optional[str] = None, tag: Optional[str] = None, label: Optional[str] = None,
+                 live_id: Optional[str] = None, firebase_sync: bool = False, required: bool = False,
+                 placeholder_teams: Tuple[str, ...] = (), soft_ttl: float = DEFAULT_SOFT_TTL,
+                 hard_ttl: float = DEFAULT_HARD_TTL, priority: int = PRIORITY_OTHER,
+                 tiebreakers: Optional[Sequence[str]] = None):
+        self.id = id
+        self.discipline = discipline
+        self.categorie = categorie
+        self.manif_id = manif_id
+        self.poule_id = poule_id
+        self.team_filter = team_filter
+        self.normalize_names = normalize_names
+        self.rename = rename
+        self.ranking = ranking
+        self.path = path
+        self.tag = tag
+        self.label = label or id
+        self.live_id = live_id
+        self.firebase_sync = firebase_sync
+        self.required = required
+        self.placeholder_teams = placeholder_teams
+        self.soft_ttl = soft_ttl
+        self.hard_ttl = hard_ttl
+        self.priority = priority
+        if tiebreakers is None:
+            tiebreakers = SALLE_TIEBREAKERS if ranking == RANKING_SALLE else DEFAULT_TIEBREAKERS
+        self.tiebreakers = tuple(tiebreakers)
+
+    @property
+    def available(self) -> bool:
+        """La FFH a publié la compétition (ManifId ou PouleId connu)."""
+        return bool(self.manif_id or self.poule_id)
+
+    @property
+    def source(self) -> str:
+        """Source FFH des matchs (ex: "ManifId: 4317", "PouleId: 11510")."""
+        return f"PouleId: {self.poule_id}" if self.poule_id else f"ManifId: {self.manif_id}"
+
+    @property
+    def matches_key(self) -> str:
+        """Clé des matchs dans le cache dynamique."""
+        return f"matchs:{self.id}"
+
+    @property
+    def ranking_key(self) -> str:
+        """Clé du classement dans le cache dynamique."""
+        return f"classement:{self.id}"
+
+    def routes(self) -> List[str]:
+        """Routes génériques de la compétition."""
+        if not self.path:
+            return []
+        routes = [f"{self.path}/classement"] if self.ranking else []
+        if self.ranking not in (None, RANKING_FFH):
+            routes.append(f"{self.path}/confrontations")
+        return routes + [f"{self.path}/matchs"]
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "label": self.label,
+            "discipline": self.discipline,
+            "categorie": self.categorie,
+            "manif_id": self.manif_id,
+            "poule_id": self.poule_id,
+            "team_filter": self.team_filter,
+            "ranking": self.ranking,
+            "tiebreakers": list(self.tiebreakers) if self.ranking not in (None, RANKING_FFH) else [],
+            "routes": self.routes(),
+            "live_id": self.live_id,
+            "soft_ttl": self.soft_ttl,
+            "hard_ttl": self.hard_ttl,
+            "priority": self.priority
+        }
+
+    def __repr__(self) -> str:
+        return f"Competition({self.id}, {self.source})"
+
+
+COMPETITIONS: Dict[str, Competition] = {c.id: c for c in [
+    # Gazon
+    Competition(
+        "elite-hommes-gazon", "gazon", "elite-hommes", manif_id="4317",
+        ranking=RANKING_MATCHS, path="/api/v1/gazon/elite-hommes", tag="Elite Hommes Gazon",
+        label="Elite Hommes", live_id="elite-hommes", priority=PRIORITY_ELITE
+    ),
+    Competition(
+        "elite-femmes-gazon", "gazon", "elite-femmes", manif_id="4318",
+        ranking=RANKING_MATCHS, path="/api/v1/gazon/elite-femmes", tag="Elite Femmes Gazon",
+        label="Elite Femmes", live_id="elite-femmes", priority=PRIORITY_ELITE
+    ),
+    # Salle
+    Competition(
+        "elite-femmes-salle", "salle", "elite-femmes", manif_id="4403", rename=CARQUEFOU,
+        ranking=RANKING_SALLE, path="/api/v1/salle/elite-femmes", tag="Salle Elite Femmes",
+        label="Salle Elite Femmes", live_id="salle-elite-femmes", firebase_sync=True,
+        placeholder_teams=(
+            "HC Grenoble", "IH Lambersart", "AS Villeurbanne EL", "PHC Marcq en Baroeul", "Cambrai HC",
+            "Blanc Mesnil SH", "Carquefou HC", "La Baule OHC", "CA Montrouge 92", "Villa Primrose"
+        ),
+        priority=PRIORITY_ELITE
+    ),
+    Competition(
+        "n2-hommes-salle-zone3", "salle", "n2-hommes-zone3", manif_id="4430",
+        ranking=RANKING_RENCONTRES, path="/api/v1/salle/nationale-2-hommes-zone-3",
+        tag="N2 Hommes Salle Zone 3", label="N2 Hommes Zone 3", live_id="n2-salle-zone3",
+        firebase_sync=True
+    ),
+    # Carquefou HC
+    Competition(
+        "carquefou-1sh", "gazon", "seniors-hommes", poule_id="11510",
+        team_filter="CARQUEFOU HC 1", normalize_names=True, ranking=RANKING_FFH,
+        path="/api/v1/carquefou/1sh", tag="Carquefou HC", label="Carquefou 1SH",
+        live_id="carquefou-1sh", required=True, priority=PRIORITY_CLUB
+    ),
+    Competition(
+        "carquefou-2sh", "gazon", "seniors-hommes", poule_id="11511",
+        team_filter="CARQUEFOU HC 2", normalize_names=True, ranking=RANKING_FFH,
+        path="/api/v1/carquefou/2sh", tag="Carquefou HC", label="Carquefou 2SH",
+        live_id="carquefou-2sh", required=True, priority=PRIORITY_CLUB
+    ),
+    Competition(
+        "carquefou-sd", "gazon", "seniors-dames", manif_id="4318",
+        team_filter="CARQUEFOU", normalize_names=True, rename=CARQUEFOU,
+        path="/api/v1/carquefou/sd", tag="Carquefou HC", label="Carquefou SD",
+        live_id="carquefou-sd", required=True, priority=PRIORITY_CLUB
+    ),
+    # Interligues U14 (routes et formats dédiés, voir main.py) ; en salle, pas encore publiées
+    Competition("u14-garcons-gazon", "gazon", "u14-garcons", manif_id="4400",
+                label="U14 Garçons", soft_ttl=600, hard_ttl=3600),
+    Competition("u14-filles-gazon", "gazon", "u14-filles", manif_id="4401",
+                label="U14 Filles", soft_ttl=600, hard_ttl=3600, tiebreakers=SALLE_TIEBREAKERS),
+    Competition("u14-garcons-salle", "salle", "u14-garcons", label="U14 Garçons"),
+    Competition("u14-filles-salle", "salle", "u14-filles", label="U14 Filles"),
+]}
+
+
+def get_competition(competition_id: str) -> Competition:
+    """
+    Retourne une compétition du registre.
+
+    Raises:
+        KeyError: Si la compétition n'existe pas
+    """
+    return COMPETITIONS[competition_id]
+
+
+def find_competition(discipline: str, categorie: str) -> Optional[Competition]:
+    """Compétition d'une discipline et d'une catégorie (ex: "gazon", "u14-filles"), ou None."""
+    for competition in COMPETITIONS.values():
+        if competition.discipline == discipline and competition.categorie == categorie:
+            return competition
+    return None
+
+
+def find_by_live_id(live_id: str) -> Optional[Competition]:
+    """Compétition associée à un identifiant du live score (ex: "carquefou-1sh"), ou None."""
+    for competition in COMPETITIONS.values():
+        if competition.live_id == live_id:
+            return competition
+    return None
+
+
+def competitions_for_source(manif_id: str, poule_id: str = "") -> List[Competition]:
+    """
+    Compétitions du registre alimentées par une réponse ListerRencontres : celles de la
+    poule, ou de la manifestation (une poule hors registre, ex: poule d'une phase U14,
+    est rattachée aux compétitions de sa manifestation).
+    """
+    if poule_id:
+        matching = [c for c in COMPETITIONS.values() if c.poule_id == poule_id]
+        if matching:
+            return matching
+    return [c for c in COMPETITIONS.values() if manif_id and c.manif_id == manif_id and not c.poule_id]
+
+
+def competitions_by_priority() -> List[Competition]:
+    """Compétitions publiées, les plus prioritaires d'abord."""
+    return sorted((c for c in COMPETITIONS.values() if c.available), key=lambda c: c.priority)
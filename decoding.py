@@ -0,0 +1,213 @@
+"""
+Décodage rapide des réponses JSON de la FFH
+- loads() : un seul décodeur JSON (orjson s'il est installé, sinon le module json standard)
+- decode_rencontres() : décodage typé d'une réponse ListerRencontres directement en
+  enregistrements Match (msgspec s'il est installé), limité aux champs utilisés et
+  validé au passage ; sinon loads() puis parse_rencontres()
+"""
+
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from models import Match, MatchStatus
+
+try:
+    import orjson
+except ImportError:  # dépendance optionnelle
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # dépendance optionnelle
+    msgspec = None
+
+
+def json_backend() -> str:
+    """Décodeurs utilisés (ex: "msgspec+orjson", "json")."""
+    backend = "orjson" if orjson is not None else "json"
+    return f"msgspec+{backend}" if msgspec is not None else backend
+
+
+def loads(body: bytes) -> Any:
+    """
+    Décode un corps de réponse JSON (bytes), sans passer par une chaîne intermédiaire.
+
+    Raises:
+        ValueError: Si le corps n'est pas du JSON valide
+    """
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+
+_EMPTY: Dict = {}
+_FINISHED = MatchStatus.FINISHED
+_NOT_PLAYED = MatchStatus.NOT_PLAYED
+_SCHEDULED = MatchStatus.SCHEDULED
+
+
+def parse_rencontres(data: Dict) -> List[Match]:
+    """
+    Transforme une réponse ListerRencontres décodée en liste de matchs.
+
+    Seuls les champs utilisés sont lus (RencId, RencDateDerog, Equipe1/2.EquipeId et
+    EquipeNom, Scores.RencButsEqp1/2, Scores.RencScoresSaisieDate, RencNonJoue) ;
+    les noms d'équipes sont internés. Une réponse sans rencontre (objet ou tableau vide)
+    donne une liste vide.
+
+    Raises:
+        ValueError: Si une rencontre a une structure ou un score invalide
+    """
+    rencontres = (data.get("Response") or _EMPTY).get("RencontresArray") or _EMPTY
+    if isinstance(rencontres, dict):
+        rencontres = rencontres.values()
+
+    intern = sys.intern
+    matches: List[Match] = []
+    append = matches.append
+    rencontre = None
+    try:
+        for rencontre in rencontres:
+            scores = rencontre.get("Scores") or _EMPTY
+            but1 = scores.get("RencButsEqp1")
+            but2 = scores.get("RencButsEqp2")
+
+            if scores.get("RencScoresSaisieDate"):
+                statut = _FINISHED
+            elif rencontre.get("RencNonJoue") == "O":
+                statut = _NOT_PLAYED
+            else:
+                statut = _SCHEDULED
+
+            equipe1 = rencontre.get("Equipe1") or _EMPTY
+            equipe2 = rencontre.get("Equipe2") or _EMPTY
+            append(Match(
+                str(rencontre.get("RencId", "")),
+                rencontre.get("RencDateDerog") or "",
+                intern(equipe1.get("EquipeNom") or ""),
+                intern(equipe2.get("EquipeNom") or ""),
+                int(but1) if but1 else None,
+                int(but2) if but2 else None,
+                statut,
+                intern(str(equipe1.get("EquipeId") or "")),
+                intern(str(equipe2.get("EquipeId") or ""))
+            ))
+    except (AttributeError, TypeError, ValueError) as e:
+        raise ValueError(f"Rencontre invalide ({e}): {rencontre!r:.200}") from None
+    return matches
+
+
+if msgspec is not None:
+    # Structure d'une réponse ListerRencontres, réduite aux champs utilisés.
+    # Les autres champs sont ignorés sans être construits. PHP encode les objets
+    # vides en tableaux vides : les listes sont donc acceptées à la place des objets.
+
+    class _Equipe(msgspec.Struct):
+        EquipeId: Union[str, int, None] = None
+        EquipeNom: Optional[str] = None
+
+    class _Scores(msgspec.Struct):
+        RencButsEqp1: Union[str, int, None] = None
+        RencButsEqp2: Union[str, int, None] = None
+        RencScoresSaisieDate: Optional[str] = None
+
+    class _Rencontre(msgspec.Struct):
+        RencId: Union[str, int] = ""
+        RencDateDerog: Optional[str] = None
+        RencNonJoue: Optional[str] = None
+        Equipe1: Union[_Equipe, list, None] = None
+        Equipe2: Union[_Equipe, list, None] = None
+        Scores: Union[_Scores, list, None] = None
+
+    class _Response(msgspec.Struct):
+        RencontresArray: Union[Dict[str, _Rencontre], List[_Rencontre], None] = None
+
+    class _ListerRencontres(msgspec.Struct):
+        ResponseCode: Union[str, int, None] = None
+        ResponseMessage: Optional[str] = None
+        Response: Union[_Response, list, None] = None
+
+    _rencontres_decoder = msgspec.json.Decoder(_ListerRencontres)
+    _NO_SCORES = _Scores()
+    _NO_EQUIPE = _Equipe()
+
+
+def _matches_from_structs(rencontres: Any) -> List[Match]:
+    """Enregistrements Match à partir des rencontres décodées par msgspec."""
+    if isinstance(rencontres, dict):
+        rencontres = rencontres.values()
+    intern = sys.intern
+    matches: List[Match] = []
+    append = matches.append
+    for rencontre in rencontres:
+        scores = rencontre.Scores
+        if scores.__class__ is not _Scores:
+            scores = _NO_SCORES
+        but1 = scores.RencButsEqp1
+        but2 = scores.RencButsEqp2
+
+        if scores.RencScoresSaisieDate:
+            statut = _FINISHED
+        elif rencontre.RencNonJoue == "O":
+            statut = _NOT_PLAYED
+        else:
+            statut = _SCHEDULED
+
+        equipe1 = rencontre.Equipe1
+        if equipe1.__class__ is not _Equipe:
+            equipe1 = _NO_EQUIPE
+        equipe2 = rencontre.Equipe2
+        if equipe2.__class__ is not _Equipe:
+            equipe2 = _NO_EQUIPE
+        append(Match(
+            str(rencontre.RencId),
+            rencontre.RencDateDerog or "",
+            intern(equipe1.EquipeNom or ""),
+            intern(equipe2.EquipeNom or ""),
+            int(but1) if but1 else None,
+            int(but2) if but2 else None,
+            statut,
+            intern(str(equipe1.EquipeId or "")),
+            intern(str(equipe2.EquipeId or ""))
+        ))
+    return matches
+
+
+def _decode_rencontres_dicts(body: bytes) -> Tuple[str, Optional[str], List[Match]]:
+    data = loads(body)
+    code = str(data.get("ResponseCode"))
+    return code, data.get("ResponseMessage"), parse_rencontres(data) if code == "200" else []
+
+
+def decode_rencontres(body: bytes) -> Tuple[str, Optional[str], List[Match]]:
+    """
+    Décode une réponse ListerRencontres brute.
+
+    Returns:
+        (ResponseCode, ResponseMessage, matchs) ; les matchs ne sont lus que si
+        ResponseCode vaut "200"
+
+    Raises:
+        ValueError: Si le corps n'est pas du JSON valide ou si une rencontre est invalide
+    """
+    if msgspec is None:
+        return _decode_rencontres_dicts(body)
+
+    try:
+        decoded = _rencontres_decoder.decode(body)
+    except msgspec.ValidationError as e:
+        # Champ d'un type inattendu : la lecture générique (plus tolérante) prend le relais
+        print(f"⚠️  Décodage typé de ListerRencontres impossible ({e}), lecture générique")
+        return _decode_rencontres_dicts(body)
+    except msgspec.DecodeError as e:
+        raise ValueError(f"Réponse ListerRencontres invalide: {e}") from None
+    code = str(decoded.ResponseCode)
+    if code != "200":
+        return code, decoded.ResponseMessage, []
+    response = decoded.Response
+    rencontres = response.RencontresArray if response.__class__ is _Response else None
+    try:
+        return code, decoded.ResponseMessage, _matches_from_structs(rencontres or ())
+    except ValueError as e:
+        raise ValueError(f"Score invalide dans ListerRencontres: {e}") from None
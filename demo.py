@@ -1,15 +1,30 @@
 #!/usr/bin/env python
 """
 Client simple pour tester l'API
+(FFH_BASE_URL permet d'utiliser le serveur de substitution ffh_standin.py)
 """
-import json
-from scraper import get_ranking, get_matches
+import asyncio
+from ffh_client import close_client
+from models import to_public
+from competitions import get_competition
+from scraper import get_classement, get_matchs
+
+ELITE_HOMMES = get_competition("elite-hommes-gazon")
+
+
+async def fetch_all():
+    try:
+        return to_public(await get_classement(ELITE_HOMMES)), to_public(await get_matchs(ELITE_HOMMES))
+    finally:
+        await close_client()
+
+
+ranking, matches = asyncio.run(fetch_all())
 
 print("\n" + "="*60)
 print("CLASSEMENT - ELITE HOMMES 2025/2026")
 print("="*60)
 
-ranking = get_ranking()
 for team in ranking[:5]:
     print(f"{team['position']:2d}. {team['equipe']:<25} {team['points']:3d} pts - "
           f"{team['joues']}J {team['gagnes']}G {team['nuls']}N {team['perdus']}P "
@@ -19,7 +34,6 @@ print("\n" + "="*60)
 print("DERNIERS MATCHS")
 print("="*60)
 
-matches = get_matches()
 finished = [m for m in matches if m['statut'] == 'FINISHED']
 for match in finished[-5:]:
     if match['score_domicile'] is not None:
@@ -0,0 +1,111 @@
+"""
+Corps de réponse pré-encodés
+Une réponse servie depuis le cache ne change pas tant que les données lues ne changent
+pas : son corps JSON est conservé en bytes avec ses versions compressées (gzip, et
+brotli s'il est installé), chacune calculée une seule fois, à la première requête qui
+la demande, puis servi tel quel selon l'en-tête Accept-Encoding du client.
+"""
+
+import gzip
+from typing import Dict, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # dépendance optionnelle
+    brotli = None
+
+
+# Corps plus petits : non compressés (comme GZipMiddleware)
+MINIMUM_SIZE = 500
+# Compression faite une fois par contenu : niveaux élevés
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+# Corps qui changent souvent (live score, phases) : niveaux rapides
+GZIP_FAST_LEVEL = 5
+BROTLI_FAST_QUALITY = 4
+
+
+def compression_backend() -> str:
+    """Encodages disponibles (ex: "br+gzip", "gzip")."""
+    return "br+gzip" if brotli is not None else "gzip"
+
+
+def coding_etag(etag: str, encoding: Optional[str]) -> str:
+    """
+    ETag d'un encodage du corps : chaque encodage a des octets différents, donc son propre
+    validateur fort (ex: "<empreinte>-gzip", "<empreinte>-br" ; inchangé sans compression).
+    """
+    return f'{etag[:-1]}-{encoding}"' if encoding else etag
+
+
+def etag_variants(etag: str) -> Tuple[str, ...]:
+    """ETags de tous les encodages possibles d'un même contenu."""
+    return (etag, coding_etag(etag, "gzip"), coding_etag(etag, "br"))
+
+
+def _accepted(accept_encoding: str) -> Dict[str, float]:
+    """Encodages acceptés par le client et leur poids (q), ex: {"gzip": 1.0, "br": 1.0}."""
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        if name.strip():
+            accepted[name.strip()] = weight
+    return accepted
+
+
+class EncodedBody:
+    """
+    Corps d'une réponse et ses encodages.
+
+    - etag / last_modified : validateurs du contenu (voir main.py) ; l'ETag envoyé porte
+      l'encodage choisi (coding_etag)
+    - body : JSON sérialisé ; ses versions compressées sont calculées à la demande
+      (aucune si le corps est trop petit)
+    - fast : niveaux de compression rapides, pour un corps peu réutilisé
+    """
+
+    __slots__ = ("etag", "last_modified", "media_type", "body", "fast", "_encoded")
+
+    def __init__(self, etag: str, last_modified: Optional[str], body: bytes, media_type: str,
+                 fast: bool = False):
+        self.etag = etag
+        self.last_modified = last_modified
+        self.media_type = media_type
+        self.body = body
+        self.fast = fast
+        self._encoded: Dict[str, bytes] = {}
+
+    def _encode(self, encoding: str) -> bytes:
+        """Corps compressé (calculé une fois par encodage)."""
+        encoded = self._encoded.get(encoding)
+        if encoded is None:
+            if encoding == "br":
+                quality = BROTLI_FAST_QUALITY if self.fast else BROTLI_QUALITY
+                encoded = brotli.compress(self.body, quality=quality)
+            else:
+                level = GZIP_FAST_LEVEL if self.fast else GZIP_LEVEL
+                # mtime=0 : même contenu, mêmes octets compressés
+                encoded = gzip.compress(self.body, compresslevel=level, mtime=0)
+            self._encoded[encoding] = encoded
+        return encoded
+
+    def select(self, accept_encoding: str) -> Tuple[bytes, Optional[str]]:
+        """Corps à envoyer et son Content-Encoding (None : non compressé), brotli d'abord."""
+        if len(self.body) < MINIMUM_SIZE:
+            return self.body, None
+        accepted = _accepted(accept_encoding or "")
+        if brotli is not None and accepted.get("br", 0) > 0:
+            return self._encode("br"), "br"
+        if accepted.get("gzip", 0) > 0:
+            return self._encode("gzip"), "gzip"
+        return self.body, None
+
+    def size(self) -> int:
+        return len(self.body) + sum(len(encoded) for encoded in self._encoded.values())
@@ -0,0 +1,835 @@
+"""
+Client HTTP partagé pour l'API de la FFH
+Une seule instance httpx.AsyncClient pour toute la durée de vie de l'application
+"""
+
+import asyncio
+import hashlib
+import heapq
+import itertools
+import os
+import random
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from cachetools import LRUCache, TTLCache
+
+from decoding import decode_rencontres, loads
+from models import Match
+
+
+# URL de base de l'API interne de la FFH. FFH_BASE_URL permet de pointer vers le
+# serveur de substitution (ffh_standin.py) pour les tests et les mesures hors ligne
+FFH_BASE_URL = os.environ.get("FFH_BASE_URL", "https://championnats.ffhockey.org/rest2/Championnats")
+
+# Saison utilisée par défaut dans tous les appels
+SAISON_ANNEE = "2026"
+
+# Timeout global (lecture) et timeout de connexion, en secondes
+DEFAULT_TIMEOUT = 10.0
+CONNECT_TIMEOUT = 5.0
+
+# Limites du pool de connexions. Le client ne parle qu'à l'hôte de FFH_BASE_URL,
+# les limites du pool sont donc aussi les limites par hôte.
+POOL_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=30.0
+)
+
+# Disjoncteur par endpoint : ouvert après N échecs consécutifs, nouvel essai après le délai
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_RESET_TIMEOUT = 30.0
+
+# Budget d'appels par endpoint : (requêtes par seconde, rafale, appels simultanés).
+# La somme des appels simultanés reste sous la taille du pool de connexions.
+UPSTREAM_LIMITS = {
+    "ListerRencontres": (5.0, 10, 6),
+    "ClassementEquipes": (2.0, 5, 3),
+    "FeuilleDeMatchHTML": (3.0, 6, 4),
+    "ListerOfficiels": (2.0, 4, 2),
+    "ListerPhases": (1.0, 3, 2),
+    "ListerPoules": (1.0, 3, 2),
+}
+DEFAULT_UPSTREAM_LIMIT = (1.0, 2, 1)
+
+# Nouvelles tentatives des GET (idempotents) après une panne de l'API FFH (timeout,
+# erreur réseau, 5xx) : attente exponentielle avec jitter, dans la limite d'un délai global.
+# Chaque tentative est limitée à ATTEMPT_TIMEOUT ; l'appel complet à REQUEST_DEADLINE.
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.2
+RETRY_MAX_DELAY = 2.0
+ATTEMPT_TIMEOUT = 5.0
+REQUEST_DEADLINE = 10.0
+
+# Requête de secours (hedging) : si la FFH n'a pas répondu après le p95 observé de
+# l'endpoint, une seconde requête identique est envoyée et la première réponse gagne.
+# Réservé aux appels PRIORITY_LIVE, désactivable via FFH_HEDGE_REQUESTS=false
+HEDGE_REQUESTS = os.environ.get("FFH_HEDGE_REQUESTS", "true").lower() not in ("0", "false", "no")
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MIN_DELAY = 0.1
+LATENCY_SAMPLES = 200
+
+# Priorités des appels vers la FFH (la plus petite passe en premier)
+PRIORITY_LIVE = 0        # un client attend la réponse
+PRIORITY_BACKGROUND = 1  # rafraîchissements planifiés ou en arrière-plan (et au-delà, par importance)
+
+# Priorité des appels émis depuis le contexte courant (tâche asyncio)
+upstream_priority: ContextVar[int] = ContextVar("upstream_priority", default=PRIORITY_LIVE)
+
+# Durée de conservation des réponses brutes ListerRencontres, en secondes.
+# Volontairement courte (inférieure aux TTL des données calculées) : elle sert à
+# partager un même téléchargement entre le classement et les matchs d'une compétition.
+RAW_PAYLOAD_TTL = 60
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+class UpstreamUnavailable(httpx.TransportError):
+    """L'API FFH est considérée indisponible (disjoncteur ouvert) : l'appel n'est pas tenté."""
+
+
+class DeadlineExceeded(httpx.TimeoutException):
+    """Le délai global de l'appel est écoulé avant qu'une tentative puisse être faite."""
+
+
+class CircuitBreaker:
+    """
+    Disjoncteur pour un endpoint de l'API FFH.
+
+    - fermé : les appels passent ; N échecs consécutifs l'ouvrent
+    - ouvert : les appels échouent immédiatement (UpstreamUnavailable) pendant reset_timeout
+    - semi-ouvert : un seul appel d'essai passe ; son succès referme le disjoncteur,
+      son échec le rouvre
+    """
+
+    def __init__(self, name: str, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.rejected = 0
+        self._probe_in_flight = False
+
+    def before_call(self) -> None:
+        """
+        Vérifie que l'appel peut être tenté.
+
+        Raises:
+            UpstreamUnavailable: Si le disjoncteur est ouvert
+        """
+        if self.state == "open":
+            if time.time() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                raise UpstreamUnavailable(f"API FFH indisponible ({self.name}), disjoncteur ouvert")
+            self.state = "half-open"
+        if self.state == "half-open":
+            if self._probe_in_flight:
+                self.rejected += 1
+                raise UpstreamUnavailable(f"API FFH indisponible ({self.name}), essai en cours")
+            self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        if self.state != "closed":
+            print(f"✅ API FFH de nouveau disponible ({self.name})")
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def abandon(self) -> None:
+        """L'appel autorisé n'a finalement pas été fait (appelant annulé)."""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.state == "half-open" or self.failures >= self.failure_threshold:
+            if self.state != "open":
+                print(f"⚠️  Disjoncteur ouvert pour {self.name} après {self.failures} échec(s)")
+            self.state = "open"
+            self.opened_at = time.time()
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "opened_at": int(self.opened_at) if self.opened_at else None,
+            "rejected": self.rejected
+        }
+
+
+class EndpointLimiter:
+    """
+    Limite les appels vers un endpoint de la FFH : seau à jetons (débit et rafale)
+    et nombre maximum d'appels simultanés. Les appels en attente sont servis par
+    priorité (PRIORITY_LIVE avant PRIORITY_BACKGROUND), puis dans l'ordre d'arrivée.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int, max_concurrency: int):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self.tokens = float(burst)
+        self.active = 0
+        self.waited = 0
+        self.wait_time = 0.0
+        self._updated = time.monotonic()
+        self._queue: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def acquire(self, priority: int = PRIORITY_LIVE) -> None:
+        """Attend son tour (jeton disponible et place libre), selon la priorité."""
+        future = asyncio.get_event_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._seq), future))
+        self._dispatch()
+        if future.done():
+            return
+
+        started = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Place accordée au moment de l'annulation : la rendre
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        self.waited += 1
+        self.wait_time += time.monotonic() - started
+
+    def release(self) -> None:
+        """Libère la place occupée par un appel terminé."""
+        self.active -= 1
+        self._dispatch()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _dispatch(self) -> None:
+        """Accorde les places disponibles aux appels en attente les plus prioritaires."""
+        self._refill()
+        while self._queue and self.active < self.max_concurrency:
+            future = self._queue[0][2]
+            if future.done():
+                # Appelant annulé pendant l'attente
+                heapq.heappop(self._queue)
+                continue
+            if self.tokens < 1:
+                # Réessayer quand le prochain jeton sera disponible
+                if self._timer is None:
+                    delay = (1 - self.tokens) / self.rate
+                    self._timer = asyncio.get_event_loop().call_later(delay, self._on_timer)
+                break
+            heapq.heappop(self._queue)
+            self.tokens -= 1
+            self.active += 1
+            future.set_result(None)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def stats(self) -> Dict:
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "max_concurrency": self.max_concurrency,
+            "active": self.active,
+            "queued": sum(1 for _, _, future in self._queue if not future.done()),
+            "tokens": round(self.tokens, 2),
+            "waited": self.waited,
+            "avg_wait": round(self.wait_time / self.waited, 3) if self.waited else 0.0
+        }
+
+
+class EndpointLatency:
+    """
+    Temps de réponse récents d'un endpoint (tentatives réussies uniquement, hors attente
+    du limiteur) et compteurs des nouvelles tentatives et requêtes de secours.
+    """
+
+    def __init__(self, name: str, size: int = LATENCY_SAMPLES):
+        self.name = name
+        self.samples: deque = deque(maxlen=size)
+        self.calls = 0
+        self.retries = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        self.gave_up = 0
+
+    def record(self, duration: float) -> None:
+        self.samples.append(duration)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Percentile q (0-1) des temps de réponse, None si aucun échantillon."""
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def hedge_delay(self) -> Optional[float]:
+        """Délai avant la requête de secours (p95 observé), None tant que l'historique est trop court."""
+        if len(self.samples) < HEDGE_MIN_SAMPLES:
+            return None
+        return max(HEDGE_MIN_DELAY, self.percentile(0.95))
+
+    def stats(self) -> Dict:
+        p50, p95 = self.percentile(0.5), self.percentile(0.95)
+        return {
+            "samples": len(self.samples),
+            "p50": round(p50, 3) if p50 is not None else None,
+            "p95": round(p95, 3) if p95 is not None else None,
+            "calls": self.calls,
+            "retries": self.retries,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "gave_up": self.gave_up
+        }
+
+
+class SingleFlight:
+    """
+    Regroupe les requêtes identiques en cours : tant qu'un appel pour une clé
+    donnée n'est pas terminé, les appelants suivants attendent son résultat
+    au lieu de relancer leur propre requête vers la FFH.
+    """
+
+    def __init__(self, stats_size: int = 500):
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+        self._waiters: Dict[Tuple, int] = {}
+        self.flights = 0
+        self.waiters_saved = 0
+        # Compteurs par clé (endpoint + paramètres), bornés en taille
+        self.by_key = LRUCache(maxsize=stats_size)
+
+    async def do(self, key: Tuple, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Exécute fn() une seule fois pour une clé donnée parmi les appels concurrents.
+
+        Args:
+            key: Clé identifiant la requête
+            fn: Fonction retournant la coroutine à exécuter
+
+        Returns:
+            Le résultat partagé de l'appel
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self._waiters[key] += 1
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        self._waiters[key] = 0
+        task.add_done_callback(lambda t: self._finish(key, t))
+        # shield: l'annulation d'un appelant n'annule pas la requête partagée
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Tuple, task: asyncio.Task) -> None:
+        """Retire la requête terminée et met à jour les compteurs."""
+        self._inflight.pop(key, None)
+        waiters = self._waiters.pop(key, 0)
+        self.flights += 1
+        self.waiters_saved += waiters
+
+        label = _format_key(key)
+        entry = self.by_key.get(label) or {"flights": 0, "waiters_saved": 0, "max_waiters": 0}
+        entry["flights"] += 1
+        entry["waiters_saved"] += waiters
+        entry["max_waiters"] = max(entry["max_waiters"], waiters)
+        entry["last_waiters"] = waiters
+        self.by_key[label] = entry
+
+        # Évite l'avertissement "exception never retrieved" si tous les appelants ont été annulés
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict:
+        """Retourne les compteurs de regroupement."""
+        return {
+            "flights": self.flights,
+            "waiters_saved": self.waiters_saved,
+            "in_flight": len(self._inflight),
+            "by_key": dict(self.by_key.items())
+        }
+
+
+def _request_key(endpoint: str, params: Dict) -> Tuple:
+    """Clé canonique d'une requête : endpoint + paramètres triés."""
+    return (endpoint, tuple(sorted((k, str(v)) for k, v in params.items())))
+
+
+def _format_key(key: Tuple) -> str:
+    """Représentation lisible d'une clé de requête (ex: ListerRencontres?ManifId=4317&...)."""
+    endpoint, params = key
+    return endpoint + "?" + "&".join(f"{k}={v}" for k, v in params if v != "")
+
+
+singleflight = SingleFlight()
+
+# Un disjoncteur par endpoint (ListerRencontres, ClassementEquipes, ...)
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(endpoint: str) -> CircuitBreaker:
+    """Retourne le disjoncteur associé à un endpoint, en le créant si nécessaire."""
+    breaker = _breakers.get(endpoint)
+    if breaker is None:
+        breaker = _breakers[endpoint] = CircuitBreaker(endpoint)
+    return breaker
+
+
+# Un limiteur par endpoint
+_limiters: Dict[str, EndpointLimiter] = {}
+
+
+def get_limiter(endpoint: str) -> EndpointLimiter:
+    """Retourne le limiteur associé à un endpoint, en le créant si nécessaire."""
+    limiter = _limiters.get(endpoint)
+    if limiter is None:
+        rate, burst, max_concurrency = UPSTREAM_LIMITS.get(endpoint, DEFAULT_UPSTREAM_LIMIT)
+        limiter = _limiters[endpoint] = EndpointLimiter(endpoint, rate, burst, max_concurrency)
+    return limiter
+
+
+# Temps de réponse par endpoint
+_latencies: Dict[str, EndpointLatency] = {}
+
+
+def get_latency(endpoint: str) -> EndpointLatency:
+    """Retourne le suivi des temps de réponse d'un endpoint, en le créant si nécessaire."""
+    latency = _latencies.get(endpoint)
+    if latency is None:
+        latency = _latencies[endpoint] = EndpointLatency(endpoint)
+    return latency
+
+
+async def run_in_background(fn: Callable[[], Awaitable[Any]], priority: int = PRIORITY_BACKGROUND) -> Any:
+    """
+    Exécute fn() avec une priorité basse (PRIORITY_BACKGROUND ou au-delà) pour ses
+    appels vers la FFH. À utiliser dans une tâche dédiée : la priorité ne s'applique
+    qu'à cette tâche et aux tâches qu'elle crée.
+    """
+    upstream_priority.set(max(priority, PRIORITY_BACKGROUND))
+    return await fn()
+
+
+def _is_upstream_failure(error: Exception) -> bool:
+    """Timeouts, erreurs réseau et erreurs 5xx comptent comme des pannes de l'API FFH."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+class Payload:
+    """
+    Réponse brute ListerRencontres avec l'empreinte de son contenu.
+    Tant que l'empreinte ne change pas, le même objet est réutilisé, et donc les mêmes
+    `data` (JSON décodé) et `matches` (enregistrements Match), décodés à la demande
+    depuis le corps brut.
+    """
+
+    __slots__ = ("key", "body", "digest", "response_code", "fetched_at", "changed_at", "_data", "_matches")
+
+    def __init__(self, key: Tuple, body: bytes, digest: str, response_code: str = "200",
+                 matches: Optional[List[Match]] = None):
+        self.key = key
+        self.body = body
+        self.digest = digest
+        self.response_code = response_code
+        self.fetched_at = time.time()
+        self.changed_at = self.fetched_at
+        self._data: Optional[Dict] = None
+        self._matches = matches
+
+    @property
+    def data(self) -> Dict:
+        """Corps de la réponse décodé (partagé, ne doit pas être modifié)."""
+        if self._data is None:
+            self._data = loads(self.body)
+        return self._data
+
+    @property
+    def matches(self) -> List[Match]:
+        """Matchs de la réponse (partagés, ne doivent pas être modifiés)."""
+        if self._matches is None:
+            self._matches = decode_rencontres(self.body)[2]
+        return self._matches
+
+
+# Réponses brutes ListerRencontres par (SaisonAnnee, ManifId, PouleId) : les plus récentes
+# (TTL court) et la dernière version connue de chacune (pour la comparaison d'empreintes)
+_rencontres_cache = TTLCache(maxsize=200, ttl=RAW_PAYLOAD_TTL)
+_rencontres_last = LRUCache(maxsize=200)
+_rencontres_stats = {"hits": 0, "misses": 0, "changed": 0, "unchanged": 0}
+
+# Fonctions appelées (key, payload) quand le contenu d'une réponse ListerRencontres change
+_change_listeners: List[Callable[[Tuple, Payload], None]] = []
+# Fonctions appelées (key, payload, corps brut) à chaque réception d'un contenu nouveau
+# (premier chargement ou changement) et (key, payload, None) quand le contenu est inchangé
+_store_listeners: List[Callable[[Tuple, Payload, Optional[bytes]], None]] = []
+
+
+def _http2_available() -> bool:
+    """
+    Indique si le support HTTP/2 est installé (paquet h2, via httpx[http2]).
+    """
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Retourne le client HTTP partagé, en le créant si nécessaire.
+
+    Returns:
+        httpx.AsyncClient: Client avec keep-alive, pool de connexions et HTTP/2 si disponible
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=FFH_BASE_URL,
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=CONNECT_TIMEOUT),
+            limits=POOL_LIMITS,
+            http2=_http2_available(),
+            headers={"Accept": "application/json"}
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Ferme le client partagé (à l'arrêt de l'application)."""
+    global _client
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+
+
+def _retry_delay(attempt: int) -> float:
+    """Attente avant la tentative suivante : exponentielle, avec jitter complet."""
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+
+
+async def _send(endpoint: str, params: Dict, deadline: float, priority: int,
+                sent: Optional[asyncio.Event] = None) -> httpx.Response:
+    """
+    Une tentative : attend son tour auprès du limiteur de l'endpoint, puis effectue le GET
+    en moins de ATTEMPT_TIMEOUT (et avant le délai global). `sent` est signalé au moment
+    où la requête part vers la FFH.
+
+    Raises:
+        DeadlineExceeded: Si le délai global est écoulé pendant l'attente du limiteur
+        httpx.HTTPError: Si l'appel échoue
+    """
+    limiter = get_limiter(endpoint)
+    await limiter.acquire(priority)
+    try:
+        timeout = min(ATTEMPT_TIMEOUT, deadline - time.monotonic())
+        if timeout <= 0:
+            raise DeadlineExceeded(f"Délai dépassé avant l'appel de {endpoint}")
+        started = time.monotonic()
+        if sent is not None:
+            sent.set()
+        try:
+            response = await asyncio.wait_for(get_client().get(endpoint, params=params), timeout)
+        except asyncio.TimeoutError:
+            raise httpx.ReadTimeout(f"Pas de réponse de {endpoint} après {timeout:.1f}s") from None
+        response.raise_for_status()
+        get_latency(endpoint).record(time.monotonic() - started)
+        return response
+    finally:
+        limiter.release()
+
+
+async def _send_hedged(endpoint: str, params: Dict, deadline: float, priority: int,
+                       hedge_after: Optional[float]) -> httpx.Response:
+    """
+    Une tentative, doublée d'une requête de secours si la première n'a pas répondu
+    hedge_after secondes après son envoi (l'attente du limiteur n'est pas comptée). La première réponse réussie est retournée, l'autre
+    requête est annulée ; si les deux échouent, l'erreur de la première est propagée.
+    """
+    if hedge_after is None:
+        return await _send(endpoint, params, deadline, priority)
+
+    sent = asyncio.Event()
+    first = asyncio.ensure_future(_send(endpoint, params, deadline, priority, sent))
+    sending = asyncio.ensure_future(sent.wait())
+    tasks = [first, sending]
+    try:
+        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        done, _ = await asyncio.wait([first], timeout=hedge_after)
+        if not done:
+            get_latency(endpoint).hedged += 1
+            tasks.append(asyncio.ensure_future(_send(endpoint, params, deadline, priority)))
+        pending = {task for task in tasks if task is not sending}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is not first:
+                        get_latency(endpoint).hedge_wins += 1
+                    return task.result()
+        return first.result()
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+async def _get(endpoint: str, params: Dict) -> httpx.Response:
+    """
+    Effectue réellement le GET vers l'API FFH, au travers du disjoncteur de l'endpoint
+    puis de son limiteur (selon la priorité du contexte courant).
+
+    Après une panne (timeout, erreur réseau, 5xx), l'appel est retenté jusqu'à
+    RETRY_MAX_ATTEMPTS fois avec une attente exponentielle et du jitter, tant que le
+    délai global REQUEST_DEADLINE le permet. Pour les appels PRIORITY_LIVE, une requête
+    de secours est envoyée si la réponse tarde au-delà du p95 observé de l'endpoint.
+
+    Raises:
+        UpstreamUnavailable: Si le disjoncteur est ouvert (aucun appel n'est fait)
+        DeadlineExceeded: Si le délai global est écoulé avant une tentative
+        httpx.HTTPError: Si la dernière tentative échoue
+    """
+    breaker = get_breaker(endpoint)
+    latency = get_latency(endpoint)
+    priority = upstream_priority.get()
+    deadline = time.monotonic() + REQUEST_DEADLINE
+    latency.calls += 1
+    attempt = 0
+
+    while True:
+        breaker.before_call()
+        # Pas de requête de secours pendant l'essai d'un disjoncteur semi-ouvert
+        hedge_after = None
+        if HEDGE_REQUESTS and priority == PRIORITY_LIVE and breaker.state == "closed":
+            hedge_after = latency.hedge_delay()
+        try:
+            response = await _send_hedged(endpoint, params, deadline, priority, hedge_after)
+        except asyncio.CancelledError:
+            breaker.abandon()
+            raise
+        except DeadlineExceeded:
+            breaker.abandon()
+            latency.gave_up += 1
+            raise
+        except Exception as e:
+            if not _is_upstream_failure(e):
+                breaker.record_success()
+                raise
+            breaker.record_failure()
+            delay = _retry_delay(attempt)
+            if attempt + 1 >= RETRY_MAX_ATTEMPTS or time.monotonic() + delay >= deadline:
+                latency.gave_up += 1
+                raise
+            latency.retries += 1
+            attempt += 1
+            print(f"⚠️  {endpoint}: nouvelle tentative dans {delay:.2f}s ({type(e).__name__})")
+            await asyncio.sleep(delay)
+            continue
+        breaker.record_success()
+        return response
+
+
+async def _get_json(endpoint: str, params: Dict) -> Dict:
+    """Effectue le GET vers l'API FFH et décode le JSON."""
+    response = await _get(endpoint, params)
+    return loads(response.content)
+
+
+async def fetch_json(endpoint: str, params: Dict) -> Dict:
+    """
+    Effectue un GET sur un endpoint de l'API FFH et retourne le JSON décodé.
+    Les appels identiques concurrents sont regroupés en une seule requête.
+    Le résultat est partagé entre les appelants et ne doit pas être modifié.
+
+    Args:
+        endpoint: Nom de l'endpoint (ex: "ListerRencontres", "ClassementEquipes")
+        params: Paramètres de la requête
+
+    Returns:
+        Dict: Le corps de la réponse décodé
+
+    Raises:
+        UpstreamUnavailable: Si le disjoncteur de l'endpoint est ouvert
+        httpx.TimeoutException: Si l'API ne répond pas à temps (y compris DeadlineExceeded)
+        httpx.TransportError: Si la connexion échoue
+        httpx.HTTPStatusError: Si l'API retourne un code HTTP d'erreur
+    """
+    key = _request_key(endpoint, params)
+    return await singleflight.do(key, lambda: _get_json(endpoint, params))
+
+
+def on_rencontres_change(callback: Callable[[Tuple, Payload], None]) -> None:
+    """
+    Enregistre une fonction appelée quand le contenu d'une réponse ListerRencontres change.
+
+    Args:
+        callback: Fonction recevant la clé (SaisonAnnee, ManifId, PouleId) et le nouveau Payload
+    """
+    _change_listeners.append(callback)
+
+
+def on_rencontres_stored(callback: Callable[[Tuple, Payload, Optional[bytes]], None]) -> None:
+    """
+    Enregistre une fonction appelée après chaque téléchargement réussi de ListerRencontres,
+    avec le corps brut de la réponse si son contenu est nouveau (None s'il est inchangé).
+    """
+    _store_listeners.append(callback)
+
+
+def restore_rencontres(key: Tuple, body: bytes, digest: str, fetched_at: float, changed_at: float) -> Payload:
+    """
+    Réinjecte une réponse ListerRencontres sauvegardée (au démarrage), pour que la
+    comparaison d'empreintes continue de fonctionner après un redémarrage.
+    Le corps n'est décodé que s'il est réutilisé.
+
+    Returns:
+        Le Payload restauré
+    """
+    payload = Payload(key, body, digest)
+    payload.fetched_at = fetched_at
+    payload.changed_at = changed_at
+    _rencontres_last[key] = payload
+    return payload
+
+
+def _notify_stored(key: Tuple, payload: Payload, body: Optional[bytes]) -> None:
+    for callback in _store_listeners:
+        try:
+            callback(key, payload, body)
+        except Exception as e:
+            print(f"⚠️  Erreur lors de l'enregistrement de la réponse {key}: {e}")
+
+
+async def _load_rencontres(key: Tuple, params: Dict) -> Payload:
+    """
+    Télécharge ListerRencontres et compare l'empreinte du corps à la version précédente.
+    Si rien n'a changé, le JSON n'est pas décodé : le Payload précédent est réutilisé.
+    Sinon le corps est décodé directement en matchs (décodage typé, voir decoding.py).
+    """
+    response = await _get("ListerRencontres", params)
+    digest = hashlib.blake2b(response.content, digest_size=16).hexdigest()
+
+    previous = _rencontres_last.get(key)
+    if previous is not None and previous.digest == digest:
+        _rencontres_stats["unchanged"] += 1
+        previous.fetched_at = time.time()
+        _notify_stored(key, previous, None)
+        return previous
+
+    response_code, _, matches = decode_rencontres(response.content)
+    payload = Payload(key, response.content, digest, response_code, matches)
+    if response_code != "200":
+        return payload
+
+    _rencontres_last[key] = payload
+    _notify_stored(key, payload, response.content)
+    if previous is not None:
+        _rencontres_stats["changed"] += 1
+        for callback in _change_listeners:
+            try:
+                callback(key, payload)
+            except Exception as e:
+                print(f"⚠️  Erreur dans un abonné aux changements de rencontres: {e}")
+    return payload
+
+
+async def fetch_payload(manif_id: str = "", poule_id: str = "") -> Payload:
+    """
+    Retourne la réponse ListerRencontres pour une manifestation et/ou une poule.
+
+    La réponse est conservée RAW_PAYLOAD_TTL secondes, par (SaisonAnnee, ManifId, PouleId) :
+    le classement et les matchs d'une même compétition sont calculés à partir d'un seul
+    téléchargement. Seules les réponses valides (ResponseCode "200") sont conservées.
+    Tant que le contenu téléchargé est identique (même empreinte), le même objet est
+    retourné : les données qui en sont dérivées peuvent être réutilisées telles quelles.
+
+    Args:
+        manif_id: L'identifiant de la manifestation (championnat)
+        poule_id: L'identifiant de la poule
+
+    Returns:
+        Payload: La réponse (response_code, data, matches)
+
+    Raises:
+        Les mêmes exceptions httpx que fetch_json()
+        ValueError: Si la réponse n'est pas du JSON valide
+    """
+    key = (SAISON_ANNEE, str(manif_id or ""), str(poule_id or ""))
+    payload = _rencontres_cache.get(key)
+    if payload is not None:
+        _rencontres_stats["hits"] += 1
+        return payload
+
+    _rencontres_stats["misses"] += 1
+    params = {"SaisonAnnee": SAISON_ANNEE}
+    if manif_id:
+        params["ManifId"] = manif_id
+    if poule_id:
+        params["PouleId"] = poule_id
+
+    payload = await singleflight.do(
+        _request_key("ListerRencontres", params),
+        lambda: _load_rencontres(key, params)
+    )
+    if payload.response_code == "200":
+        _rencontres_cache[key] = payload
+    return payload
+
+
+def last_payload(manif_id: str = "", poule_id: str = "") -> Optional[Payload]:
+    """
+    Dernière réponse ListerRencontres connue (téléchargée ou restaurée), sans appel à la FFH.
+    None si aucune réponse n'a encore été reçue.
+    """
+    return _rencontres_last.get((SAISON_ANNEE, str(manif_id or ""), str(poule_id or "")))
+
+
+async def fetch_rencontres(manif_id: str = "", poule_id: str = "") -> Dict:
+    """
+    Retourne la réponse brute de ListerRencontres décodée (voir fetch_payload()).
+    Le résultat est partagé et ne doit pas être modifié.
+
+    Returns:
+        Dict: Le corps de la réponse décodé
+    """
+    payload = await fetch_payload(manif_id, poule_id)
+    return payload.data
+
+
+def get_upstream_stats() -> Dict:
+    """
+    Compteurs de l'accès à l'API FFH (regroupement, disjoncteurs, limiteurs,
+    temps de réponse et nouvelles tentatives, réponses brutes).
+    """
+    return {
+        "singleflight": singleflight.stats(),
+        "breakers": {name: breaker.stats() for name, breaker in _breakers.items()},
+        "limiters": {name: limiter.stats() for name, limiter in _limiters.items()},
+        "latency": {name: latency.stats() for name, latency in _latencies.items()},
+        "rencontres": {
+            **_rencontres_stats,
+            "cached": [
+                {
+                    "saison": saison, "manif_id": manif_id, "poule_id": poule_id,
+                    "digest": payload.digest,
+                    "fetched_at": int(payload.fetched_at),
+                    "changed_at": int(payload.changed_at)
+                }
+                for (saison, manif_id, poule_id), payload in list(_rencontres_last.items())
+            ]
+        }
+    }
@@ -0,0 +1,266 @@
+"""
+Serveur de substitution de l'API FFH (rest2/Championnats)
+Enregistre les réponses de la vraie API puis les rejoue en local, avec une latence,
+un taux d'erreur et une taille de réponse configurables : le cache, les nouvelles
+tentatives et le débit de l'API peuvent être testés et mesurés sans la FFH.
+
+Usage:
+    # 1. Enregistrer : relaie les appels vers la vraie API et sauvegarde chaque réponse
+    FFH_STANDIN_MODE=record python ffh_standin.py
+    FFH_BASE_URL=http://127.0.0.1:8001/rest2/Championnats python main.py
+    (puis parcourir les endpoints de l'API à enregistrer)
+
+    # 2. Rejouer, avec 80 ms de latence et 5% d'erreurs 503
+    FFH_STANDIN_LATENCY_MS=80 FFH_STANDIN_ERROR_RATE=0.05 python ffh_standin.py
+    FFH_BASE_URL=http://127.0.0.1:8001/rest2/Championnats python main.py
+
+La configuration peut aussi être modifiée à chaud : POST /_standin/config
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, Tuple
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+
+# Vraie API de la FFH (utilisée uniquement en mode enregistrement)
+REAL_FFH_URL = "https://championnats.ffhockey.org/rest2/Championnats"
+
+# Endpoints servis par le serveur de substitution
+ENDPOINTS = (
+    "ListerRencontres", "ClassementEquipes", "ListerPhases",
+    "ListerPoules", "FeuilleDeMatchHTML", "ListerOfficiels"
+)
+
+# Répertoire des réponses enregistrées : <dir>/<endpoint>/<paramètres>.json
+RECORDINGS_DIR = os.environ.get(
+    "FFH_STANDIN_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "recordings", "ffh")
+)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        print(f"⚠️  {name} invalide, valeur par défaut utilisée: {default}")
+        return default
+
+
+class StandinConfig:
+    """
+    Comportement du serveur de substitution.
+
+    - mode : "replay" (réponses enregistrées) ou "record" (relais vers la vraie API)
+    - latency_ms + jitter_ms : latence de chaque réponse (jitter uniforme)
+    - slow_rate / slow_ms : proportion de réponses très lentes (latence de queue)
+    - error_rate : proportion de réponses 503
+    - payload_scale : multiplie le nombre de rencontres de ListerRencontres
+    - seed : graine du tirage aléatoire (mesures reproductibles)
+    """
+
+    FIELDS = ("mode", "latency_ms", "jitter_ms", "slow_rate", "slow_ms",
+              "error_rate", "payload_scale", "seed")
+
+    def __init__(self):
+        self.mode = os.environ.get("FFH_STANDIN_MODE", "replay")
+        self.latency_ms = _env_float("FFH_STANDIN_LATENCY_MS", 0)
+        self.jitter_ms = _env_float("FFH_STANDIN_JITTER_MS", 0)
+        self.slow_rate = _env_float("FFH_STANDIN_SLOW_RATE", 0)
+        self.slow_ms = _env_float("FFH_STANDIN_SLOW_MS", 3000)
+        self.error_rate = _env_float("FFH_STANDIN_ERROR_RATE", 0)
+        self.payload_scale = int(_env_float("FFH_STANDIN_PAYLOAD_SCALE", 1))
+        self.seed = int(_env_float("FFH_STANDIN_SEED", 42))
+
+    def update(self, values: Dict) -> None:
+        for name in self.FIELDS:
+            if name in values:
+                setattr(self, name, type(getattr(self, name))(values[name]))
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+
+config = StandinConfig()
+_random = random.Random(config.seed)
+
+# (endpoint, paramètres) -> corps enregistré
+_recordings: Dict[Tuple[str, str], bytes] = {}
+# Corps agrandis (payload_scale) déjà calculés : (endpoint, paramètres, facteur) -> corps
+_scaled: Dict[Tuple[str, str, int], bytes] = {}
+_stats = {"requests": 0, "served": 0, "missing": 0, "errors_injected": 0, "slow": 0, "recorded": 0}
+_by_endpoint: Dict[str, int] = {}
+_upstream: Optional[httpx.AsyncClient] = None
+
+
+def _params_key(params: Dict) -> str:
+    """Paramètres triés, hors paramètres vides (ex: "ManifId=4317&SaisonAnnee=2026")."""
+    return "&".join(f"{k}={v}" for k, v in sorted(params.items()) if v != "") or "_"
+
+
+def _recording_path(endpoint: str, params_key: str) -> str:
+    return os.path.join(RECORDINGS_DIR, endpoint, f"{params_key}.json")
+
+
+def load_recordings() -> int:
+    """Charge en mémoire toutes les réponses enregistrées. Retourne leur nombre."""
+    _recordings.clear()
+    _scaled.clear()
+    for endpoint in ENDPOINTS:
+        directory = os.path.join(RECORDINGS_DIR, endpoint)
+        if not os.path.isdir(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(directory, filename), encoding="utf-8") as f:
+                    recording = json.load(f)
+                _recordings[(endpoint, filename[:-len(".json")])] = recording["body"].encode("utf-8")
+            except (OSError, ValueError, KeyError) as e:
+                print(f"⚠️  Enregistrement illisible {endpoint}/{filename}: {e}")
+    return len(_recordings)
+
+
+def _save_recording(endpoint: str, params: Dict, params_key: str, body: bytes) -> None:
+    path = _recording_path(endpoint, params_key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "endpoint": endpoint,
+            "params": params,
+            "recorded_at": int(time.time()),
+            "body": body.decode("utf-8")
+        }, f, ensure_ascii=False, indent=1)
+    _recordings[(endpoint, params_key)] = body
+    _stats["recorded"] += 1
+
+
+def _scale_rencontres(body: bytes, scale: int) -> bytes:
+    """Duplique chaque rencontre (identifiants suffixés) pour agrandir la réponse."""
+    data = json.loads(body)
+    rencontres = (data.get("Response") or {}).get("RencontresArray")
+    if not isinstance(rencontres, dict):
+        return body
+    scaled = dict(rencontres)
+    for copy in range(1, scale):
+        for renc_id, rencontre in rencontres.items():
+            clone = dict(rencontre, RencId=f"{rencontre.get('RencId', renc_id)}{copy:03d}")
+            scaled[f"{renc_id}{copy:03d}"] = clone
+    data["Response"]["RencontresArray"] = scaled
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _replay_body(endpoint: str, params_key: str) -> Optional[bytes]:
+    body = _recordings.get((endpoint, params_key))
+    if body is None or endpoint != "ListerRencontres" or config.payload_scale <= 1:
+        return body
+    key = (endpoint, params_key, config.payload_scale)
+    if key not in _scaled:
+        _scaled[key] = _scale_rencontres(body, config.payload_scale)
+    return _scaled[key]
+
+
+async def _record(endpoint: str, params: Dict, params_key: str) -> Response:
+    """Relaie l'appel vers la vraie API et enregistre la réponse si elle est valide."""
+    try:
+        response = await _upstream.get(endpoint, params=params)
+    except httpx.HTTPError as e:
+        return JSONResponse(status_code=502, content={"ResponseCode": "502", "ResponseMessage": str(e)})
+    if response.status_code == 200:
+        _save_recording(endpoint, params, params_key, response.content)
+    return Response(content=response.content, status_code=response.status_code,
+                    media_type="application/json")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _upstream
+    count = load_recordings()
+    print(f"✅ Serveur FFH de substitution ({config.mode}): {count} réponses enregistrées dans {RECORDINGS_DIR}")
+    _upstream = httpx.AsyncClient(base_url=REAL_FFH_URL, timeout=httpx.Timeout(30.0))
+    yield
+    await _upstream.aclose()
+
+
+app = FastAPI(title="FFH stand-in", lifespan=lifespan)
+
+
+@app.get("/rest2/Championnats/{endpoint}")
+async def championnats(endpoint: str, request: Request):
+    """Rejoue (ou enregistre) un appel à l'API rest2/Championnats."""
+    params = dict(request.query_params)
+    params_key = _params_key(params)
+    _stats["requests"] += 1
+    _by_endpoint[endpoint] = _by_endpoint.get(endpoint, 0) + 1
+
+    if config.mode == "record":
+        return await _record(endpoint, params, params_key)
+
+    delay = config.latency_ms + _random.uniform(0, config.jitter_ms)
+    if config.slow_rate and _random.random() < config.slow_rate:
+        delay = config.slow_ms
+        _stats["slow"] += 1
+    if delay > 0:
+        await asyncio.sleep(delay / 1000)
+
+    if config.error_rate and _random.random() < config.error_rate:
+        _stats["errors_injected"] += 1
+        return JSONResponse(status_code=503, content={"ResponseCode": "503", "ResponseMessage": "Erreur simulée"})
+
+    body = _replay_body(endpoint, params_key)
+    if body is None:
+        _stats["missing"] += 1
+        return JSONResponse(
+            status_code=404,
+            content={"ResponseCode": "404", "ResponseMessage": f"Aucun enregistrement pour {endpoint}?{params_key}"}
+        )
+    _stats["served"] += 1
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/_standin/config")
+async def get_config():
+    return config.to_dict()
+
+
+@app.post("/_standin/config")
+async def set_config(request: Request):
+    """Modifie la configuration (ex: {"error_rate": 0.2, "latency_ms": 150})."""
+    global _random
+    config.update(await request.json())
+    _random = random.Random(config.seed)
+    return config.to_dict()
+
+
+@app.get("/_standin/stats")
+async def get_stats():
+    return {
+        **_stats,
+        "by_endpoint": _by_endpoint,
+        "recordings": len(_recordings),
+        "config": config.to_dict()
+    }
+
+
+@app.post("/_standin/reset")
+async def reset_stats():
+    """Remet les compteurs à zéro et relit les enregistrements."""
+    global _random
+    for name in _stats:
+        _stats[name] = 0
+    _by_endpoint.clear()
+    _random = random.Random(config.seed)
+    return {"recordings": load_recordings()}
+
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="127.0.0.1", port=int(os.environ.get("FFH_STANDIN_PORT", "8001")))
@@ -4,30 +4,46 @@ Endpoints pour accéder aux données de la FFH
 """
 
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse, FileResponse, HTMLResponse
+from fastapi.responses import JSONResponse, FileResponse, HTMLResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
+import asyncio
 import json
 import os
 import re
 import hashlib
 import time
+from contextlib import asynccontextmanager
+from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
 from functools import wraps
-from cachetools import TTLCache
+import httpx
+from cachetools import LRUCache, TTLCache
 from dotenv import load_dotenv
 from bs4 import BeautifulSoup
 import firebase_admin
 from firebase_admin import credentials, db, auth
-from scraper import (
-    get_classement_carquefou_1sh, get_matchs_carquefou_1sh,
-    get_classement_carquefou_2sh, get_matchs_carquefou_2sh,
-    get_matchs_carquefou_sd,
-    get_classement_salle_elite_femmes, get_matchs_salle_elite_femmes,
-    get_ranking_elite_hommes_gazon, get_matches_elite_hommes_gazon,
-    get_ranking_elite_femmes_gazon, get_matches_elite_femmes_gazon,
-    get_ranking_n2_salle_zone3, get_matches_n2_salle_zone3
+from scraper import get_classement, get_head_to_head, get_matchs
+from competitions import (
+    COMPETITIONS, DEFAULT_HARD_TTL, DEFAULT_SOFT_TTL, Competition,
+    competitions_for_source, find_by_live_id, find_competition, get_competition
 )
+from cache import SWRCache, current_cache_reads, derive, track_cache_reads
+from scheduler import RefreshEntry, start_refresh_scheduler, stop_refresh_scheduler, get_scheduler_jobs
+from ffh_client import (
+    fetch_json, fetch_rencontres, get_client, close_client, get_upstream_stats,
+    on_rencontres_stored, restore_rencontres, run_in_background, SAISON_ANNEE
+)
+from store import SnapshotStore
+from models import Standing, to_public
+from standings import (
+    VECTORIZE_MIN_RESULTS, apply_live_result, get_standings_stats, standings_backend, standings_table
+)
+from teams import match_index, team_index
+from match_calendar import MatchCalendar, day_bounds, merged_calendar, weekend_bounds
+from match_query import MatchQuery
+from encoded import EncodedBody, coding_etag, compression_backend, etag_variants
 
 # Charger les variables d'environnement depuis le fichier .env
 load_dotenv()
@@ -110,6 +126,26 @@ LIVE_MATCHES_CACHE = {}
 # Webhooks - Liste des URLs pour recevoir les notifications de mise à jour
 REGISTERED_WEBHOOKS = {}
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Cycle de vie de l'application : ouvre le client HTTP partagé vers la FFH, recharge
+    le dernier instantané du cache depuis le disque et démarre le rafraîchissement
+    planifié au démarrage, puis arrête le planificateur, termine les écritures sur
+    disque et ferme le client proprement à l'arrêt.
+    """
+    get_client()
+    if snapshot_store.open():
+        restore_snapshot()
+    if ENABLE_SCHEDULER:
+        start_refresh_scheduler(cache_dynamic, warm_cache_entries(), jitter=REFRESH_JITTER)
+    yield
+    stop_refresh_scheduler()
+    snapshot_store.close()
+    await close_client()
+
+
 app = FastAPI(
     title="🏑 Hockey sur Gazon France API",
     description="""
@@ -126,6 +162,7 @@ app = FastAPI(
     
     """,
     version="1.0.0",
+    lifespan=lifespan,
     openapi_tags=[
         {
             "name": "Elite Hommes",
@@ -158,6 +195,27 @@ app = FastAPI(
     ]
 )
 
+@app.middleware("http")
+async def conditional_requests(request, call_next):
+    """
+    ETag et 304 Not Modified sur les classements, matchs, phases et poules et sur le live
+    score, et corps pré-encodés des réponses construites depuis le cache (voir
+    _cached_response et _with_validators). Déclaré avant CORS et GZip pour s'exécuter
+    à l'intérieur : les réponses reçoivent les en-têtes CORS, les empreintes portent sur
+    le corps non compressé et GZip laisse passer les corps déjà compressés.
+    """
+    if request.method != "GET" or not _conditional_route(request.url.path):
+        return await call_next(request)
+    url = f"{request.url.path}?{request.url.query}"
+    cached = _cached_response(request, url)
+    if cached is not None:
+        return cached
+    response = await call_next(request)
+    if response.status_code != 200:
+        return response
+    return await _with_validators(request, url, response)
+
+
 # Configuration CORS pour accepter les requêtes depuis n'importe quelle origine
 app.add_middleware(
     CORSMiddleware,
@@ -170,12 +228,271 @@ app.add_middleware(
 # Ajouter GZip compression pour les réponses > 500 bytes
 app.add_middleware(GZipMiddleware, minimum_size=500)
 
+
+@app.middleware("http")
+async def cache_status_headers(request, call_next):
+    """
+    Indique au client si la réponse a été servie depuis des données stale.
+    X-Cache: HIT (fraîche), STALE (rafraîchissement en cours), MISS (chargée à l'instant)
+    ou FALLBACK (API FFH indisponible : dernière valeur connue, avec un en-tête Warning),
+    Age: âge des données en secondes.
+    """
+    reads = track_cache_reads()
+    response = await call_next(request)
+    if reads:
+        statuses = {read["status"] for read in reads}
+        for status in ("FALLBACK", "STALE", "MISS", "HIT"):
+            if status in statuses:
+                response.headers["X-Cache"] = status
+                break
+        if "FALLBACK" in statuses:
+            response.headers["Warning"] = '111 - "Revalidation Failed"'
+        response.headers["Age"] = str(int(max(read["age"] for read in reads)))
+    return response
+
+
+@app.exception_handler(httpx.HTTPError)
+async def upstream_error_handler(request, exc):
+    """
+    Erreur d'accès à l'API FFH sans donnée de secours (aucune valeur encore en cache) :
+    répond 503 plutôt qu'une erreur interne.
+    """
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "La source de données de la FFH est actuellement indisponible."}
+    )
+
 # ============================================
 # SYSTÈME DE CACHE
 # ============================================
 
-# Cache pour les données dynamiques (classements, matchs) - 5 minutes TTL
-cache_dynamic = TTLCache(maxsize=100, ttl=300)
+# Cache pour les données dynamiques (classements, matchs) - stale-while-revalidate
+# Par défaut fraîches pendant 5 minutes, puis servies stale (rafraîchies en arrière-plan)
+# jusqu'à 30 minutes ; chaque compétition du registre peut définir ses propres durées
+DYNAMIC_SOFT_TTL = DEFAULT_SOFT_TTL
+DYNAMIC_HARD_TTL = DEFAULT_HARD_TTL
+def _content_digest(value):
+    """Empreinte du contenu d'une valeur du cache dynamique, au format JSON public."""
+    body = json.dumps(to_public(value), sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+
+
+cache_dynamic = SWRCache(
+    soft_ttl=DYNAMIC_SOFT_TTL, hard_ttl=DYNAMIC_HARD_TTL, maxsize=100,
+    background=run_in_background, digest=_content_digest
+)
+for _competition in COMPETITIONS.values():
+    cache_dynamic.set_ttl(_competition.matches_key, _competition.soft_ttl, _competition.hard_ttl)
+    cache_dynamic.set_ttl(_competition.ranking_key, _competition.soft_ttl, _competition.hard_ttl)
+
+# Rafraîchissement planifié : chaque compétition est rechargée avant la fin de son soft TTL
+# (80%), avec un jitter pour étaler les appels vers la FFH. Désactivable via ENABLE_SCHEDULER=false
+ENABLE_SCHEDULER = os.environ.get("ENABLE_SCHEDULER", "true").lower() not in ("0", "false", "no")
+REFRESH_RATIO = 0.8
+REFRESH_JITTER = 30
+
+
+def _log_cache_change(key, value):
+    """Signale un vrai changement des données d'une compétition (pas un simple rechargement)."""
+    print(f"🔄 Données modifiées: {key} (version {cache_dynamic.version(key)})")
+
+
+cache_dynamic.on_change(_log_cache_change)
+
+# Cache persistant (SQLite, sur un volume en production) : le dernier instantané est rechargé
+# au démarrage et chaque rafraîchissement réussi y est écrit (réponses brutes et données calculées)
+snapshot_store = SnapshotStore()
+cache_dynamic.on_store(snapshot_store.save_response)
+on_rencontres_stored(snapshot_store.save_payload)
+
+
+def _index_rencontres(key, payload, body):
+    """
+    Tient à jour l'index des matchs par équipe (teams.py) avec chaque réponse
+    ListerRencontres reçue : championnats du registre, poules des phases, U14.
+    Une réponse inchangée garde sa liste de matchs, qui n'est pas réindexée.
+    """
+    match_index.update(key, payload.matches)
+
+
+on_rencontres_stored(_index_rencontres)
+
+
+def restore_snapshot():
+    """
+    Recharge le dernier instantané sauvegardé dans le cache dynamique et dans le cache
+    des réponses brutes, et indexe les matchs restaurés par équipe. Les données restaurées
+    gardent leur âge : servies comme fraîches jusqu'au soft TTL, puis servies stale (même
+    au-delà du hard TTL) et rafraîchies en arrière-plan à la lecture suivante.
+    """
+    responses = 0
+    for key, value, stored_at, changed_at in snapshot_store.load_responses():
+        cache_dynamic.restore(key, value, stored_at, changed_at)
+        responses += 1
+    payloads = 0
+    for key, body, digest, fetched_at, changed_at in snapshot_store.load_payloads():
+        payload = restore_rencontres(key, body, digest, fetched_at, changed_at)
+        try:
+            match_index.update(key, payload.matches)
+        except Exception as e:
+            print(f"⚠️  Erreur lors de l'indexation de la réponse restaurée {key}: {e}")
+        payloads += 1
+    print(f"✅ Instantané restauré: {responses} données, {payloads} réponses FFH")
+
+# ============================================
+# REQUÊTES CONDITIONNELLES (ETag, 304) ET CORPS PRÉ-ENCODÉS
+# ============================================
+# Une réponse construite depuis le cache dynamique a pour ETag l'empreinte de l'URL et
+# du contenu des valeurs lues (SWRCache.etag, calculée une fois par version) et pour
+# Last-Modified leur dernier vrai changement. Les clés lues sont retenues par URL : tant
+# que ces valeurs sont fraîches, If-None-Match / If-Modified-Since est comparé avant
+# d'exécuter la route, sans rien sérialiser. Le corps de la réponse est conservé en bytes
+# avec ses versions gzip / brotli (encoded.py) : tant que l'ETag ne change pas, il est
+# servi tel quel, sans exécuter la route ni recompresser. Les autres réponses (phases
+# lues à la FFH, live score lu dans Firebase) ont pour ETag l'empreinte de leur corps ;
+# un corps inchangé n'est pas recompressé.
+
+# URL -> clés du cache dynamique lues pour la construire
+_conditional_keys = LRUCache(maxsize=500)
+# URL -> corps pré-encodé de la dernière réponse construite depuis le cache
+_encoded_bodies = LRUCache(maxsize=200)
+# URL -> dernier corps encodé des autres réponses (ETag : empreinte du corps)
+_hashed_bodies = LRUCache(maxsize=200)
+
+_CONDITIONAL_ROUTE = re.compile(r"/(classement|matchs)$|/phases$|/poules/[^/]+$|^/api/v1/live/match(es)?(/|$)")
+
+
+def _conditional_route(path):
+    """Routes servies avec ETag et 304 : classements, matchs, phases, poules et live score."""
+    return _CONDITIONAL_ROUTE.search(path) is not None
+
+
+def _cache_validators(url, keys):
+    """(ETag, Last-Modified) d'une URL construite depuis les valeurs keys du cache dynamique."""
+    etags = [cache_dynamic.etag(key) for key in keys]
+    if None in etags:
+        return None, None
+    digest = hashlib.blake2b("|".join([url] + etags).encode(), digest_size=16).hexdigest()
+    changed_at = max(cache_dynamic.changed_at(key) or 0 for key in keys)
+    return f'"{digest}"', formatdate(changed_at, usegmt=True)
+
+
+def _matching_etag(request, etag):
+    """
+    ETag de If-None-Match correspondant au contenu etag, quel que soit son encodage
+    (comparaison forte), etag pour "*", None si aucun ne correspond.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    if "*" in candidates:
+        return etag
+    variants = etag_variants(etag)
+    return next((candidate for candidate in candidates if candidate in variants), None)
+
+
+def _not_modified_since(request, last_modified):
+    """If-Modified-Since (sans If-None-Match) est postérieur ou égal à last_modified."""
+    header = request.headers.get("if-modified-since")
+    if not header or not last_modified or request.headers.get("if-none-match"):
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+
+
+def _not_modified(request, etag, last_modified, headers):
+    """
+    Le client a déjà ce contenu (If-None-Match ou If-Modified-Since) : l'ETag des en-têtes
+    de la 304 devient celui de l'encodage qu'il détient.
+    """
+    matched = _matching_etag(request, etag)
+    if matched is not None:
+        headers["ETag"] = matched
+        headers["Vary"] = "Accept-Encoding"
+        return True
+    return _not_modified_since(request, last_modified)
+
+
+def _validator_headers(etag, last_modified):
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+
+def _cached_response(request, url):
+    """
+    Réponse servie sans exécuter la route, à partir des valeurs en cache lues lors d'une
+    réponse précédente (qui doivent être fraîches) : 304 si le client a déjà ce contenu,
+    sinon le corps pré-encodé s'il correspond toujours. None si la route doit être exécutée.
+    """
+    keys = _conditional_keys.get(url)
+    if keys is None or not all(cache_dynamic.fresh(key) for key in keys):
+        return None
+    etag, last_modified = _cache_validators(url, keys)
+    if etag is None:
+        return None
+    headers = _validator_headers(etag, last_modified)
+    headers["X-Cache"] = "HIT"
+    headers["Age"] = str(int(max(cache_dynamic.age(key) or 0 for key in keys)))
+    if _not_modified(request, etag, last_modified, headers):
+        return Response(status_code=304, headers=headers)
+    encoded = _encoded_bodies.get(url)
+    if encoded is None or encoded.etag != etag:
+        return None
+    return _encoded_response(request, encoded, headers)
+
+
+def _encoded_response(request, encoded, headers):
+    """Corps pré-encodé dans l'encodage accepté par le client (brotli, gzip ou aucun)."""
+    content, encoding = encoded.select(request.headers.get("accept-encoding", ""))
+    headers = {**headers, "ETag": coding_etag(encoded.etag, encoding), "Vary": "Accept-Encoding"}
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=content, media_type=encoded.media_type, headers=headers)
+
+
+async def _with_validators(request, url, response):
+    """
+    Ajoute ETag, Last-Modified et Cache-Control à une réponse 200, ou la remplace par
+    une 304 si le client a déjà ce contenu. Le corps d'une réponse construite depuis le
+    cache est conservé avec ses versions compressées pour les requêtes suivantes.
+    """
+    reads = current_cache_reads() or []
+    keys = sorted({read["key"] for read in reads})
+    etag = last_modified = None
+    if keys and all(read["version"] == cache_dynamic.version(read["key"]) for read in reads):
+        etag, last_modified = _cache_validators(url, keys)
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    # Réponse de call_next (flux) : son type n'est connu que par ses en-têtes
+    media_type = response.headers.get("content-type", "application/json")
+    if etag is None:
+        # Réponse hors du cache dynamique : empreinte du corps
+        _conditional_keys.pop(url, None)
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    headers = _validator_headers(etag, last_modified)
+    if _not_modified(request, etag, last_modified, headers):
+        return Response(status_code=304, headers=headers)
+    if last_modified is None:
+        # Encodé ici plutôt que par GZipMiddleware, pour que l'ETag porte l'encodage
+        route_headers = {
+            name: value for name, value in response.headers.items()
+            if name not in ("content-length", "content-type")
+        }
+        encoded = _hashed_bodies.get(url)
+        if encoded is None or encoded.etag != etag:
+            encoded = _hashed_bodies[url] = EncodedBody(etag, None, body, media_type, fast=True)
+        return _encoded_response(request, encoded, {**route_headers, **headers})
+    _conditional_keys[url] = keys
+    encoded = _encoded_bodies.get(url)
+    if encoded is None or encoded.etag != etag:
+        encoded = _encoded_bodies[url] = EncodedBody(etag, last_modified, body, media_type)
+    return _encoded_response(request, encoded, headers)
+
 
 # Cache pour les données statiques - 1 heure TTL
 cache_static = TTLCache(maxsize=50, ttl=3600)
@@ -309,7 +626,7 @@ def create_placeholder_match(description, date, horaire, lieu=""):
         "rencId": ""
     }
 
-def get_phases_for_manifestation(manif_id):
+async def get_phases_for_manifestation(manif_id):
     """
     Récupère les phases pour une manifestation donnée.
     
@@ -320,17 +637,13 @@ def get_phases_for_manifestation(manif_id):
         Liste des phases formatées ou None si erreur
     """
     try:
-        import requests
-        
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerPhases"
+        endpoint = "ListerPhases"
         params = {
-            "SaisonAnnee": "2026",
+            "SaisonAnnee": SAISON_ANNEE,
             "ManifId": manif_id
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = await fetch_json(endpoint, params)
         
         if data.get("ResponseCode") == "200" and "Response" in data:
             phases_raw = data["Response"].get("PhasesArray", {})
@@ -356,9 +669,97 @@ def get_phases_for_manifestation(manif_id):
         print(f"❌ Erreur get_phases_for_manifestation({manif_id}): {str(e)}")
         return None
 
-def get_poules_for_phase(manif_id, phase_id, poules_mapping=None):
+# Nombre maximum d'appels ListerRencontres simultanés lors du chargement des poules d'une phase
+POULES_FANOUT_LIMIT = 4
+
+
+async def _load_poule(manif_id, poule_id, poule, semaphore):
+    """
+    Récupère les rencontres d'une poule.
+    
+    Args:
+        manif_id: L'ID de la manifestation
+        poule_id: L'ID de la poule
+        poule: Données brutes de la poule (ListerPoules)
+        semaphore: Limite le nombre d'appels simultanés vers la FFH
+        
+    Returns:
+        La poule formatée avec ses rencontres
+    """
+    poule_info = {
+        "poule_id": poule.get("PouleId"),
+        "libelle": poule.get("PouleLib"),
+        "rencontres": []
+    }
+    
+    # Récupérer les rencontres pour cette poule
+    try:
+        async with semaphore:
+            renc_data = await fetch_rencontres(manif_id=manif_id, poule_id=poule_id)
+        
+        if renc_data.get("ResponseCode") == "200":
+            rencontres_raw = renc_data.get("Response", {}).get("RencontresArray", {})
+            
+            for match in rencontres_raw.values():
+                formatted_match = format_match_data(match, include_renc_id=True)
+                poule_info["rencontres"].append(formatted_match)
+            
+    except httpx.HTTPError:
+        # API FFH indisponible : la phase n'est pas mise en cache avec des poules vides
+        raise
+    except Exception as e:
+        # La poule reste sans rencontres (les données manuelles prendront le relais)
+        print(f"⚠️  Rencontres de la poule {poule_id} indisponibles: {str(e)}")
+    
+    return poule_info
+
+
+def _with_manual_matches(poule_info, poules_mapping):
+    """
+    Si FFHockey n'a pas de rencontres pour la poule, retourne une copie de la poule
+    avec les données manuelles si disponibles.
+    """
+    poule_id = str(poule_info.get("poule_id"))
+    if poule_info["rencontres"] or poule_id not in poules_mapping:
+        return poule_info
+    return {
+        **poule_info,
+        "rencontres": poules_mapping[poule_id][1],
+        "source": "manual"  # Indiquer que c'est une donnée manuelle
+    }
+
+
+async def _load_poules_for_phase(manif_id, phase_id):
+    """
+    Charge les poules d'une phase puis leurs rencontres, en parallèle
+    (au plus POULES_FANOUT_LIMIT appels simultanés). Les poules restent dans l'ordre de ListerPoules.
+    """
+    poules_endpoint = "ListerPoules"
+    poules_params = {
+        "SaisonAnnee": SAISON_ANNEE,
+        "ManifId": manif_id,
+        "PhaseId": phase_id
+    }
+    
+    poules_data = await fetch_json(poules_endpoint, poules_params)
+    
+    if poules_data.get("ResponseCode") != "200":
+        return []
+    
+    poules_raw = poules_data.get("Response", {}).get("PoulesArray", {})
+    semaphore = asyncio.Semaphore(POULES_FANOUT_LIMIT)
+    
+    return list(await asyncio.gather(*(
+        _load_poule(manif_id, poule_id, poule, semaphore)
+        for poule_id, poule in poules_raw.items()
+    )))
+
+
+async def get_poules_for_phase(manif_id, phase_id, poules_mapping=None):
     """
     Récupère les poules et rencontres pour une phase donnée.
+    Les rencontres des poules sont chargées en parallèle et le résultat est mis en cache
+    par (ManifId, PhaseId) ; les données manuelles sont ajoutées ensuite, à chaque appel.
     
     Args:
         manif_id: L'ID de la manifestation
@@ -369,69 +770,14 @@ def get_poules_for_phase(manif_id, phase_id, poules_mapping=None):
         Liste des poules formatées
     """
     try:
-        import requests
-        
-        poules_mapping = poules_mapping or {}
-        
-        poules_url = "https://championnats.ffhockey.org/rest2/Championnats/ListerPoules"
-        poules_params = {
-            "SaisonAnnee": "2026",
-            "ManifId": manif_id,
-            "PhaseId": phase_id
-        }
-        
-        poules_response = requests.get(poules_url, params=poules_params, timeout=10)
-        poules_response.raise_for_status()
-        poules_data = poules_response.json()
-        
-        if poules_data.get("ResponseCode") != "200":
-            return []
-        
-        poules_raw = poules_data.get("Response", {}).get("PoulesArray", {})
-        poules_formatted = []
-        
-        # Pour chaque poule, récupérer les rencontres
-        for poule_id, poule in poules_raw.items():
-            poule_info = {
-                "poule_id": poule.get("PouleId"),
-                "libelle": poule.get("PouleLib"),
-                "rencontres": []
-            }
-            
-            # Récupérer les rencontres pour cette poule
-            try:
-                renc_url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-                renc_params = {
-                    "SaisonAnnee": "2026",
-                    "ManifId": manif_id,
-                    "PouleId": poule_id
-                }
-                
-                renc_response = requests.get(renc_url, params=renc_params, timeout=10)
-                renc_response.raise_for_status()
-                renc_data = renc_response.json()
-                
-                if renc_data.get("ResponseCode") == "200":
-                    rencontres_raw = renc_data.get("Response", {}).get("RencontresArray", {})
-                    
-                    for match in rencontres_raw.values():
-                        formatted_match = format_match_data(match, include_renc_id=True)
-                        poule_info["rencontres"].append(formatted_match)
-                
-                # Si pas de rencontres de FFHockey, ajouter les données manuelles si disponibles
-                if not poule_info["rencontres"] and poule_id in poules_mapping:
-                    poule_info["rencontres"] = poules_mapping[poule_id][1]
-                    poule_info["source"] = "manual"
-                    
-            except:
-                # Si pas de rencontres FFHockey, ajouter les données manuelles
-                if poule_id in poules_mapping:
-                    poule_info["rencontres"] = poules_mapping[poule_id][1]
-                    poule_info["source"] = "manual"
-            
-            poules_formatted.append(poule_info)
+        poules = await cache_dynamic.get(
+            f"poules_{manif_id}_{phase_id}",
+            lambda: _load_poules_for_phase(manif_id, phase_id)
+        )
         
-        return poules_formatted
+        if not poules_mapping:
+            return poules
+        return [_with_manual_matches(poule_info, poules_mapping) for poule_info in poules]
         
     except Exception as e:
         print(f"❌ Erreur get_poules_for_phase({manif_id}, {phase_id}): {str(e)}")
@@ -465,120 +811,52 @@ def generate_renc_id(equipe_domicile, equipe_exterieur, date, seed=0):
 
 
 # ============================================
-# WRAPPERS DE CACHE POUR APPELS SCRAPER
+# CACHE DES COMPÉTITIONS DU REGISTRE
 # ============================================
+# Le cache conserve les enregistrements compacts du scraper (models.Match, models.Standing) ;
+# ils sont convertis au format JSON public pour les endpoints et Firebase.
+
+# Interligues U14 : formats propres au Dashboard (voir plus bas)
+U14_GARCONS = get_competition("u14-garcons-gazon")
+U14_FILLES = get_competition("u14-filles-gazon")
+
 
-def get_classement_carquefou_1sh_cached():
-    """Wrapper avec cache pour get_classement_carquefou_1sh()"""
-    cache_key = "classement_carquefou_1sh"
-    if cache_key not in cache_dynamic:
-        result = get_classement_carquefou_1sh()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
-
-def get_matchs_carquefou_1sh_cached():
-    """Wrapper avec cache pour get_matchs_carquefou_1sh()"""
-    cache_key = "matchs_carquefou_1sh"
-    if cache_key not in cache_dynamic:
-        result = get_matchs_carquefou_1sh()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
-
-def get_classement_carquefou_2sh_cached():
-    """Wrapper avec cache pour get_classement_carquefou_2sh()"""
-    cache_key = "classement_carquefou_2sh"
-    if cache_key not in cache_dynamic:
-        result = get_classement_carquefou_2sh()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
-
-def get_matchs_carquefou_2sh_cached():
-    """Wrapper avec cache pour get_matchs_carquefou_2sh()"""
-    cache_key = "matchs_carquefou_2sh"
-    if cache_key not in cache_dynamic:
-        result = get_matchs_carquefou_2sh()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
-
-def get_matchs_carquefou_sd_cached():
-    """Wrapper avec cache pour get_matchs_carquefou_sd()"""
-    cache_key = "matchs_carquefou_sd"
-    if cache_key not in cache_dynamic:
-        result = get_matchs_carquefou_sd()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
-
-
-def get_ranking_elite_hommes_gazon_cached():
-    """Wrapper avec cache pour get_ranking_elite_hommes_gazon()"""
-    cache_key = "ranking_elite_hommes_gazon"
-    if cache_key not in cache_dynamic:
-        result = get_ranking_elite_hommes_gazon()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
-
-
-def get_matches_elite_hommes_gazon_cached():
-    """Wrapper avec cache pour get_matches_elite_hommes_gazon()"""
-    cache_key = "matches_elite_hommes_gazon"
-    if cache_key not in cache_dynamic:
-        result = get_matches_elite_hommes_gazon()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
-
-
-def get_ranking_elite_femmes_gazon_cached():
-    """Wrapper avec cache pour get_ranking_elite_femmes_gazon()"""
-    cache_key = "ranking_elite_femmes_gazon"
-    if cache_key not in cache_dynamic:
-        result = get_ranking_elite_femmes_gazon()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
-
-
-def get_matches_elite_femmes_gazon_cached():
-    """Wrapper avec cache pour get_matches_elite_femmes_gazon()"""
-    cache_key = "matches_elite_femmes_gazon"
-    if cache_key not in cache_dynamic:
-        result = get_matches_elite_femmes_gazon()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
-
-
-def get_classement_salle_elite_femmes_cached():
-    """Wrapper avec cache pour get_classement_salle_elite_femmes()"""
-    cache_key = "classement_salle_elite_femmes"
-    if cache_key not in cache_dynamic:
-        result = get_classement_salle_elite_femmes()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
-
-
-def get_matchs_salle_elite_femmes_cached():
-    """Wrapper avec cache pour get_matchs_salle_elite_femmes()"""
-    cache_key = "matchs_salle_elite_femmes"
-    if cache_key not in cache_dynamic:
-        result = get_matchs_salle_elite_femmes()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
-
-
-def get_ranking_n2_salle_zone3_cached():
-    """Wrapper avec cache pour get_ranking_n2_salle_zone3()"""
-    cache_key = "ranking_n2_salle_zone3"
-    if cache_key not in cache_dynamic:
-        result = get_ranking_n2_salle_zone3()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
-
-
-def get_matches_n2_salle_zone3_cached():
-    """Wrapper avec cache pour get_matches_n2_salle_zone3()"""
-    cache_key = "matches_n2_salle_zone3"
-    if cache_key not in cache_dynamic:
-        result = get_matches_n2_salle_zone3()
-        cache_dynamic[cache_key] = result
-    return cache_dynamic[cache_key]
+async def get_matchs_cached(competition: Competition):
+    """Matchs d'une compétition du registre, depuis le cache (format JSON public)."""
+    return to_public(await cache_dynamic.get(competition.matches_key, lambda: get_matchs(competition)))
+
+
+async def get_classement_cached(competition: Competition):
+    """Classement d'une compétition du registre, depuis le cache (format JSON public)."""
+    return to_public(await cache_dynamic.get(competition.ranking_key, lambda: get_classement(competition)))
+
+
+def warm_cache_entries():
+    """
+    Entrées du cache dynamique maintenues à jour par le planificateur : les matchs et
+    classements de chaque compétition publiée du registre, plus les formats U14 du
+    Dashboard. Chaque entrée est rechargée à 80% du soft TTL de sa compétition.
+
+    Returns:
+        list: Liste de RefreshEntry
+    """
+    def entry(competition, key, loader):
+        return RefreshEntry(key, loader, competition.soft_ttl * REFRESH_RATIO, competition.priority)
+
+    entries = []
+    for competition in COMPETITIONS.values():
+        if not competition.available or not competition.path:
+            continue
+        if competition.ranking:
+            entries.append(entry(competition, competition.ranking_key,
+                                 lambda c=competition: get_classement(c)))
+        entries.append(entry(competition, competition.matches_key, lambda c=competition: get_matchs(c)))
+    entries += [
+        entry(U14_FILLES, U14_FILLES.ranking_key, calculate_classement_u14_filles),
+        entry(U14_FILLES, U14_FILLES.matches_key, fetch_matchs_interligues_u14_filles),
+        entry(U14_GARCONS, U14_GARCONS.matches_key, fetch_matchs_interligues_u14_garcons),
+    ]
+    return entries
 
 
 # ========================
@@ -772,263 +1050,322 @@ async def serve_score_only():
 
 
 
-# ========================
-# ELITE HOMMES - GAZON
-# ========================
+# ============================================
+# ROUTES DES COMPÉTITIONS DU REGISTRE
+# ============================================
+# Pour chaque compétition du registre (competitions.py) ayant un path :
+# {path}/classement (si la compétition a un classement), {path}/confrontations (classement
+# calculé) et {path}/matchs
 
-@app.get("/api/v1/gazon/elite-hommes/classement", tags=["Elite Hommes Gazon"], summary="Classement Elite Hommes - Gazon")
-async def endpoint_classement_elite_hommes_gazon():
-    """
-    Récupère le classement de l'élite hommes sur gazon.
-    Données depuis FFHockey (ManifId: 4317).
-    
-    Returns:
-        Classement des équipes Elite Hommes Gazon
-    """
-    try:
-        ranking_data = get_ranking_elite_hommes_gazon_cached()
-        
-        return {
-            "success": True,
-            "data": ranking_data,
-            "count": len(ranking_data),
-            "championship": "elite-hommes-gazon",
-            "discipline": "gazon",
-            "note": "✅ Données réelles depuis FFHockey (ManifId: 4317)"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+def _live_match_data(championship, match):
+    """Match au format du live score (Firebase) pour un championnat."""
+    return {
+        "championship": championship,
+        "equipe_domicile": match.get("equipe_domicile", "?"),
+        "equipe_exterieur": match.get("equipe_exterieur", "?"),
+        "score_domicile": match.get("score_domicile") or 0,
+        "score_exterieur": match.get("score_exterieur") or 0,
+        "statut": match.get("statut", "SCHEDULED"),
+        "date": match.get("date", ""),
+        "rencId": match.get("rencId", match.get("id", "")),
+        "last_updated": int(time.time())
+    }
 
 
-@app.get("/api/v1/gazon/elite-hommes/matchs", tags=["Elite Hommes Gazon"], summary="Matchs Elite Hommes - Gazon")
-async def endpoint_matchs_elite_hommes_gazon():
-    """
-    Récupère les matchs de l'élite hommes sur gazon.
-    Données depuis FFHockey (ManifId: 4317).
-    
-    Returns:
-        Liste des matchs Elite Hommes Gazon
-    """
+def _sync_matches_to_firebase(competition, matches_data):
+    """Recopie les matchs d'une compétition dans Firebase (erreurs non bloquantes)."""
+    if not FIREBASE_ENABLED:
+        return
     try:
-        matches_data = get_matches_elite_hommes_gazon_cached()
-        
-        # Vérifier et notifier les matchs terminés
-        
-        return {
-            "success": True,
-            "data": matches_data,
-            "count": len(matches_data),
-            "championship": "elite-hommes-gazon",
-            "discipline": "gazon",
-            "note": "✅ Données réelles depuis FFHockey (ManifId: 4317)"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        from firebase_admin import db as firebase_db
+        for match in matches_data:
+            match_data = _live_match_data(competition.live_id, match)
+            firebase_db.reference(f"matches/{competition.live_id}_{match_data['rencId']}").set(match_data)
+        print(f"✅ {len(matches_data)} matchs {competition.label} sauvegardés dans Firebase")
+    except Exception as firebase_error:
+        print(f"⚠️  Erreur Firebase (non-bloquante): {str(firebase_error)}")
 
 
-# ========================
-# ELITE FEMMES - GAZON
-# ========================
+def _competition_response(competition, data, note=None):
+    """Réponse d'une route de compétition : {"success", "data", "count"} et la description de la compétition."""
+    return {
+        "success": True,
+        "data": data,
+        "count": len(data),
+        "championship": competition.id,
+        "discipline": competition.discipline,
+        "categorie": competition.label,
+        "note": note or f"✅ Données réelles depuis FFHockey ({competition.source})"
+    }
 
-@app.get("/api/v1/gazon/elite-femmes/classement", tags=["Elite Femmes Gazon"], summary="Classement Elite Femmes - Gazon")
-async def endpoint_classement_elite_femmes_gazon():
-    """
-    Récupère le classement de l'élite femmes sur gazon.
-    Données depuis FFHockey (ManifId: 4318).
-    
-    Returns:
-        Classement des équipes Elite Femmes Gazon
-    """
+
+def _match_query(statut, du, au, equipe, limit, cursor, fields):
+    """Paramètres de sélection d'une route /matchs (erreur 400 si invalides)."""
     try:
-        ranking_data = get_ranking_elite_femmes_gazon_cached()
-        
-        return {
-            "success": True,
-            "data": ranking_data,
-            "count": len(ranking_data),
-            "championship": "elite-femmes-gazon",
-            "discipline": "gazon",
-            "note": "✅ Données réelles depuis FFHockey (ManifId: 4318)"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        return MatchQuery(statut, du, au, equipe, limit, cursor, fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
-@app.get("/api/v1/gazon/elite-femmes/matchs", tags=["Elite Femmes Gazon"], summary="Matchs Elite Femmes - Gazon")
-async def endpoint_matchs_elite_femmes_gazon():
+def _select_matches(competition, query, matches):
     """
-    Récupère les matchs de l'élite femmes sur gazon.
-    Données depuis FFHockey (ManifId: 4318).
-    
+    Matchs sélectionnés d'une compétition (match_query.py) : seuls les matchs retournés
+    sont convertis, une période est lue dans le calendrier de la compétition.
+
     Returns:
-        Liste des matchs Elite Femmes Gazon
+        (matchs au format public, curseur de la page suivante ou None)
     """
-    try:
-        matches_data = get_matches_elite_femmes_gazon_cached()
-        
-        # Vérifier et notifier les matchs terminés
-        
-        return {
-            "success": True,
-            "data": matches_data,
-            "count": len(matches_data),
-            "championship": "elite-femmes-gazon",
-            "discipline": "gazon",
-            "note": "✅ Données réelles depuis FFHockey (ManifId: 4318)"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    calendar = None
+    if query.start is not None or query.end is not None:
+        calendar = _calendar_of(competition, matches)
+    return query.run(matches, calendar)
 
 
-@app.get("/api/v1/salle/elite-femmes/classement", tags=["Salle Elite Femmes"], summary="Classement Elite Femmes Salle")
-async def endpoint_classement_elite_femmes_salle():
-    """
-    Récupère le classement de l'élite femmes en salle.
-    Les données sont calculées automatiquement depuis les matchs réels FFHockey.
-    Système de points: Victoire=3pts, Nul=1pt, Défaite=0pts
-    Critères de départage: Différence de buts, puis buts marqués
-    
-    Championnat 2025-2026:
-    - Tournoi 1 : 13/14 décembre (Villeurbanne)
-    - Tournoi 2 : 3/4 janvier (Carquefou)
-    
-    Équipes: HC Grenoble, IH Lambersart, AS Villeurbanne EL, PHC Marcq en Baroeul,
-    Cambrai HC, Blanc Mesnil SH, Carquefou HC, La Baule OHC, CA Montrouge 92, Villa Primrose
-    
-    Returns:
-        Classement calculé des équipes Elite Femmes Salle
-    """
-    try:
-        ranking_data = get_classement_salle_elite_femmes_cached()
-        
-        if not ranking_data:
-            # Si pas de matchs joués encore, retourner les équipes avec 0 point
-            teams = [
-                "HC Grenoble",
-                "IH Lambersart",
-                "AS Villeurbanne EL",
-                "PHC Marcq en Baroeul",
-                "Cambrai HC",
-                "Blanc Mesnil SH",
-                "Carquefou HC",
-                "La Baule OHC",
-                "CA Montrouge 92",
-                "Villa Primrose"
-            ]
-            
-            classement = []
-            for rank, team in enumerate(teams, 1):
-                classement.append({
-                    "position": rank,
-                    "equipe": team,
-                    "points": 0,
-                    "joues": 0,
-                    "gagnes": 0,
-                    "nuls": 0,
-                    "perdus": 0,
-                    "buts_pour": 0,
-                    "buts_contre": 0,
-                    "difference": 0
-                })
-            
-            return {
-                "success": True,
-                "data": classement,
-                "count": len(classement),
-                "discipline": "salle",
-                "categorie": "Elite Femmes",
-                "note": "Classement initial (0 matchs joués). Données en direct depuis FFHockey."
-            }
-        
-        return {
-            "success": True,
-            "data": ranking_data,
-            "count": len(ranking_data),
-            "discipline": "salle",
-            "categorie": "Elite Femmes",
-            "note": "Classement calculé depuis les matchs réels FFHockey."
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de la récupération du classement Elite Femmes Salle: {str(e)}")
+def _placeholder_ranking(competition):
+    """Classement initial (toutes les équipes à 0 point) tant qu'aucun match n'est joué."""
+    return [
+        Standing(position, team, 0, 0, 0, 0, 0, 0, 0).to_dict()
+        for position, team in enumerate(competition.placeholder_teams, 1)
+    ]
+
+
+def _add_competition_routes(competition):
+    """Déclare les routes /classement, /confrontations et /matchs d'une compétition du registre."""
+
+    async def classement():
+        try:
+            ranking_data = await get_classement_cached(competition)
+            if not ranking_data and competition.placeholder_teams:
+                return _competition_response(
+                    competition, _placeholder_ranking(competition),
+                    "Classement initial (0 matchs joués). Données en direct depuis FFHockey."
+                )
+            if not ranking_data and competition.required:
+                raise HTTPException(
+                    status_code=503,
+                    detail="La source de données de la FFH est actuellement indisponible."
+                )
+            return _competition_response(competition, ranking_data)
+        except (httpx.HTTPError, HTTPException):
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    async def matchs(statut: str = None, du: str = None, au: str = None, equipe: str = None,
+                     limit: int = None, cursor: str = None, fields: str = None):
+        try:
+            query = _match_query(statut, du, au, equipe, limit, cursor, fields)
+            if query.active:
+                matches = await cache_dynamic.get(competition.matches_key, lambda: get_matchs(competition))
+                if not matches and competition.required:
+                    raise HTTPException(
+                        status_code=503,
+                        detail="La source de données de la FFH est actuellement indisponible."
+                    )
+                data, next_cursor = _select_matches(competition, query, matches)
+                return {**_competition_response(competition, data), "next_cursor": next_cursor}
+            matches_data = await get_matchs_cached(competition)
+            if not matches_data and competition.required:
+                raise HTTPException(
+                    status_code=503,
+                    detail="La source de données de la FFH est actuellement indisponible."
+                )
+            if competition.firebase_sync:
+                _sync_matches_to_firebase(competition, matches_data)
+            return _competition_response(competition, matches_data)
+        except (httpx.HTTPError, HTTPException):
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    async def confrontations(equipe: str = None, adversaire: str = None):
+        try:
+            # Même version du classement que la route classement (stale-while-revalidate)
+            await cache_dynamic.get(competition.ranking_key, lambda: get_classement(competition))
+            head_to_head = get_head_to_head(competition)
+            if equipe and adversaire:
+                record = head_to_head.record(equipe, adversaire)
+                data = [record] if record else []
+            else:
+                data = head_to_head.records(equipe)
+            return _competition_response(competition, data)
+        except (httpx.HTTPError, HTTPException):
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+    tags = [competition.tag] if competition.tag else None
+    if f"{competition.path}/confrontations" in competition.routes():
+        confrontations.__doc__ = (
+            f"Confrontations directes {competition.label} : bilan de chaque paire d'équipes "
+            f"(equipe, adversaire pour filtrer)."
+        )
+        app.add_api_route(
+            f"{competition.path}/confrontations", confrontations, methods=["GET"], tags=tags,
+            name=f"confrontations_{competition.id}", summary=f"Confrontations directes {competition.label}"
+        )
+    if competition.ranking:
+        classement.__doc__ = f"Classement {competition.label} ({competition.source})."
+        app.add_api_route(
+            f"{competition.path}/classement", classement, methods=["GET"], tags=tags,
+            name=f"classement_{competition.id}", summary=f"Classement {competition.label}"
+        )
+    matchs.__doc__ = (
+        f"Matchs {competition.label} ({competition.source}). Sélection : statut, du / au (YYYY-MM-DD), "
+        f"equipe ; pagination : limit, cursor (next_cursor) ; champs retournés : fields."
+    )
+    app.add_api_route(
+        f"{competition.path}/matchs", matchs, methods=["GET"], tags=tags,
+        name=f"matchs_{competition.id}", summary=f"Matchs {competition.label}"
+    )
+
+
+for _competition in COMPETITIONS.values():
+    if _competition.path:
+        _add_competition_routes(_competition)
 
 
-@app.get("/api/v1/salle/elite-femmes/matchs", tags=["Salle Elite Femmes"], summary="Matchs Elite Femmes Salle")
-async def endpoint_matchs_elite_femmes_salle():
+@app.get("/api/v1/competitions", tags=["Santé"], summary="Compétitions suivies")
+async def list_competitions():
+    """Registre des compétitions : identifiants FFH, routes, durées de cache et priorités."""
+    data = [competition.to_dict() for competition in COMPETITIONS.values()]
+    return {"success": True, "data": data, "count": len(data)}
+
+
+@app.get("/api/v1/teams", tags=["Équipes"], summary="Équipes connues")
+async def list_teams(nom: str = None):
     """
-    Récupère la liste des matchs réels de l'élite femmes en salle depuis FFHockey.
-    Sauvegarde automatiquement les matchs dans Firebase pour synchronisation en direct.
-    
-    Données actualisées depuis les URLs officielles FFHockey:
-    - Phases: https://championnats.ffhockey.org/rest2/Championnats/ListerPhases?SaisonAnnee=2026&ManifId=4403
-    - Matchs: https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres?...&ManifId=4403
-    - Classements: https://championnats.ffhockey.org/rest2/Championnats/ClassementEquipes?...&PouleId=11712
-    - Journées: https://championnats.ffhockey.org/rest2/Championnats/ListerJournees?...&PouleId=11712
-    
-    Championnat 2025-2026:
-    - Tournoi 1 : 13/14 décembre (Villeurbanne)
-    - Tournoi 2 : 3/4 janvier (Carquefou - Salle de la Mainguais)
-    
-    Returns:
-        Liste des matchs Elite Femmes Salle avec données réelles FFHockey
+    Équipes rencontrées dans les réponses de la FFH déjà chargées (identifiant, nom,
+    nom canonique, alias), filtrées sur une partie du nom (nom). Aucun appel à la FFH.
     """
-    try:
-        matches_data = get_matchs_salle_elite_femmes_cached()
-        
-        # ✅ Sauvegarder automatiquement dans Firebase
-        print(f"🔍 FIREBASE_ENABLED: {FIREBASE_ENABLED}")
-        if FIREBASE_ENABLED:
-            try:
-                from firebase_admin import db as firebase_db
-                print(f"📤 Début de sauvegarde de {len(matches_data)} matchs...")
-                for i, match in enumerate(matches_data):
-                    match_id = f"salle-elite-femmes_{match.get('rencId', match.get('id', ''))}"
-                    match_data = {
-                        "championship": "salle-elite-femmes",
-                        "equipe_domicile": match.get("equipe_domicile", "?"),
-                        "equipe_exterieur": match.get("equipe_exterieur", "?"),
-                        "score_domicile": match.get("score_domicile") or 0,
-                        "score_exterieur": match.get("score_exterieur") or 0,
-                        "statut": match.get("statut", "SCHEDULED"),
-                        "date": match.get("date", ""),
-                        "rencId": match.get("rencId", match.get("id", "")),
-                        "last_updated": int(time.time())
-                    }
-                    if i < 2:
-                        print(f"   Envoi {i+1}: {match_id}")
-                    firebase_db.reference(f'matches/{match_id}').set(match_data)
-                print(f"✅ {len(matches_data)} matchs Elite Femmes Salle sauvegardés dans Firebase")
-            except Exception as firebase_error:
-                print(f"⚠️  Erreur Firebase (non-bloquante): {str(firebase_error)}")
-                import traceback
-                print(traceback.format_exc())
-        else:
-            print(f"⚠️  Firebase désactivé - Pas de sauvegarde")
-        
-        # Vérifier et notifier les matchs terminés
-        
-        return {
-            "success": True,
-            "data": matches_data,
-            "count": len(matches_data),
-            "discipline": "salle",
-            "categorie": "Elite Femmes",
-            "note": "✅ Données réelles depuis FFHockey (ManifId: 4403) + Firebase sync"
-        }
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de la récupération des matchs Elite Femmes Salle: {str(e)}")
+    teams = team_index.teams()
+    if nom:
+        teams = [team for team in teams if nom.upper() in team.nom_upper]
+    data = sorted((team.to_dict() for team in teams), key=lambda team: team["nom"])
+    return {"success": True, "data": data, "count": len(data)}
 
 
-@app.post("/api/v1/debug/sync-salle-elite-femmes", tags=["Debug"])
-async def debug_sync_salle_elite_femmes():
-    """
-    Endpoint de debug pour forcer la synchronisation des matchs Salle Elite Femmes vers Firebase.
+@app.get("/api/v1/team/{team_id}/matchs", tags=["Équipes"], summary="Matchs d'une équipe")
+async def get_team_matchs(team_id: str, club: bool = False):
     """
-    # Vider la cache d'abord
-    cache_dynamic.pop("matchs_salle_elite_femmes", None)
+    Matchs d'une équipe dans toutes les compétitions chargées (Elite, salle, poules
+    régionales, U14), triés par date, depuis l'index des matchs : aucun appel à la FFH.
+
+    Args:
+        team_id: EquipeId FFH, nom ou alias de l'équipe
+        club: toutes les équipes du club (même nom sans numéro : "CARQUEFOU HC 1", "CARQUEFOU HC 2"...)
+    """
+    team = team_index.find(team_id)
+    keys = team_index.club(team.canonical if team else team_id) if club else ({team.key} if team else set())
+    if not keys:
+        raise HTTPException(status_code=404, detail=f"Équipe inconnue: {team_id}")
+
+    data = []
+    for (_, manif_id, poule_id), match in match_index.matches(keys):
+        data.append({
+            **match.to_dict(),
+            "competitions": [c.id for c in competitions_for_source(manif_id, poule_id)],
+            "manif_id": manif_id,
+            "poule_id": poule_id
+        })
+    teams = sorted((team_index.get(key) for key in keys), key=lambda team: team.nom)
+    return {
+        "success": True,
+        "data": data,
+        "count": len(data),
+        "equipes": [team.to_dict() for team in teams]
+    }
+
+
+# ============================================
+# CALENDRIER (match_calendar.py)
+# ============================================
+
+def _calendar_competitions():
+    """Compétitions du calendrier : celles du registre ayant des routes, plus les Interligues U14."""
+    return [c for c in COMPETITIONS.values() if c.available and c.path] + [U14_GARCONS, U14_FILLES]
+
+
+async def _cached_matches(competition):
+    """Matchs en cache d'une compétition (enregistrements Match, ou dicts du Dashboard pour les U14)."""
+    if competition is U14_GARCONS:
+        return (await get_matchs_interligues_u14_garcons()).get("data", [])
+    if competition is U14_FILLES:
+        return (await get_matchs_interligues_u14_filles()).get("data", [])
+    return await cache_dynamic.get(competition.matches_key, lambda: get_matchs(competition))
+
+
+def _calendar_of(competition, matches):
+    """Calendrier des matchs en cache d'une compétition, reconstruit seulement quand ils changent."""
+    return derive(("calendrier", competition.id), matches, lambda m: MatchCalendar(m, competition.id))
+
+
+async def _competition_calendar(competition):
+    """Calendrier d'une compétition."""
+    return _calendar_of(competition, await _cached_matches(competition))
+
+
+async def _calendar(competition_id=None):
+    """
+    Calendrier d'une compétition du registre (competition_id), ou de toutes les compétitions.
+    Une compétition indisponible est ignorée dans le calendrier global.
+    """
+    if competition_id:
+        competition = COMPETITIONS.get(competition_id)
+        if competition is None or competition not in _calendar_competitions():
+            raise HTTPException(status_code=404, detail=f"Compétition inconnue: {competition_id}")
+        return await _competition_calendar(competition)
+    calendars = []
+    for competition in _calendar_competitions():
+        try:
+            calendars.append(await _competition_calendar(competition))
+        except Exception as e:
+            print(f"⚠️  Calendrier {competition.id} indisponible: {e}")
+    return merged_calendar(calendars)
+
+
+def _calendar_response(entries):
+    """Réponse du calendrier : matchs au format public, avec l'identifiant de leur compétition."""
+    data = [{**to_public(match), "competition": source} for source, match in entries]
+    return {"success": True, "data": data, "count": len(data)}
+
+
+@app.get("/api/v1/calendrier/aujourdhui", tags=["Calendrier"], summary="Matchs du jour")
+async def calendar_today(competition: str = None):
+    """Matchs du jour, toutes compétitions ou une seule (identifiant du registre)."""
+    start, end = day_bounds(datetime.now())
+    return _calendar_response((await _calendar(competition)).between(start, end))
+
+
+@app.get("/api/v1/calendrier/weekend", tags=["Calendrier"], summary="Matchs du week-end")
+async def calendar_weekend(competition: str = None):
+    """Matchs du week-end en cours (ou du prochain en semaine), du samedi au dimanche."""
+    start, end = weekend_bounds(datetime.now())
+    return _calendar_response((await _calendar(competition)).between(start, end))
+
+
+@app.get("/api/v1/calendrier/prochains", tags=["Calendrier"], summary="Prochains matchs")
+async def calendar_upcoming(n: int = 10, competition: str = None):
+    """Les n prochains matchs, du plus proche au plus lointain."""
+    return _calendar_response((await _calendar(competition)).upcoming(time.time(), max(n, 0)))
+
+
+@app.get("/api/v1/calendrier/resultats", tags=["Calendrier"], summary="Derniers résultats")
+async def calendar_results(n: int = 10, competition: str = None):
+    """Les n derniers résultats (matchs terminés), du plus récent au plus ancien."""
+    return _calendar_response((await _calendar(competition)).latest_results(time.time(), max(n, 0)))
+
+
+@app.post("/api/v1/debug/sync-salle-elite-femmes", tags=["Debug"])
+async def debug_sync_salle_elite_femmes():
+    """
+    Endpoint de debug pour forcer la synchronisation des matchs Salle Elite Femmes vers Firebase.
+    """
+    competition = get_competition("elite-femmes-salle")
+    # Vider la cache d'abord
+    cache_dynamic.pop(competition.matches_key, None)
     
-    matches_data = get_matchs_salle_elite_femmes_cached()
+    matches_data = await get_matchs_cached(competition)
     
     sync_count = 0
     errors = []
@@ -1038,28 +1375,8 @@ async def debug_sync_salle_elite_femmes():
             from firebase_admin import db as firebase_db
             for match in matches_data:
                 try:
-                    match_id = f"salle-elite-femmes_{match.get('rencId', match.get('id', ''))}"
-                    
-                    # DEBUG: Vérifier les types
-                    score_d = match.get("score_domicile")
-                    score_e = match.get("score_exterieur")
-                    
-                    # Conversion sûre
-                    score_d_final = score_d if score_d is not None else 0
-                    score_e_final = score_e if score_e is not None else 0
-                    
-                    match_data = {
-                        "championship": "salle-elite-femmes",
-                        "equipe_domicile": match.get("equipe_domicile", "?"),
-                        "equipe_exterieur": match.get("equipe_exterieur", "?"),
-                        "score_domicile": score_d_final,
-                        "score_exterieur": score_e_final,
-                        "statut": match.get("statut", "SCHEDULED"),
-                        "date": match.get("date", ""),
-                        "rencId": match.get("rencId", match.get("id", "")),
-                        "last_updated": int(time.time())
-                    }
-                    firebase_db.reference(f'matches/{match_id}').set(match_data)
+                    match_data = _live_match_data(competition.live_id, match)
+                    firebase_db.reference(f"matches/{competition.live_id}_{match_data['rencId']}").set(match_data)
                     sync_count += 1
                 except Exception as e:
                     errors.append(f"{match.get('rencId')}: {type(e).__name__}: {str(e)}")
@@ -1079,192 +1396,80 @@ async def debug_sync_salle_elite_femmes():
     }
 
 
-# --- Endpoints N2 Hommes Salle - Zone 3 ---
-
-@app.get("/api/v1/salle/nationale-2-hommes-zone-3/classement", tags=["N2 Hommes Salle Zone 3"])
-def get_n2_salle_zone3_classement():
-    """
-    Retourne le classement pour le championnat Nationale 2 Hommes Salle - Zone 3.
-    """
-    try:
-        data = get_ranking_n2_salle_zone3_cached()
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/api/v1/salle/nationale-2-hommes-zone-3/matchs", tags=["N2 Hommes Salle Zone 3"])
-def get_n2_salle_zone3_matchs():
-    """
-    Retourne la liste des matchs pour le championnat Nationale 2 Hommes Salle - Zone 3.
-    """
-    try:
-        matches_data = get_matches_n2_salle_zone3_cached()
-        
-        # Sauvegarder automatiquement dans Firebase
-        if FIREBASE_ENABLED:
-            try:
-                from firebase_admin import db as firebase_db
-                for match in matches_data:
-                    match_id = f"n2-salle-zone3_{match.get('rencId', match.get('id', ''))}"
-                    match_data = {
-                        "championship": "n2-salle-zone3",
-                        "equipe_domicile": match.get("equipe_domicile", "?"),
-                        "equipe_exterieur": match.get("equipe_exterieur", "?"),
-                        "score_domicile": match.get("score_domicile") or 0,
-                        "score_exterieur": match.get("score_exterieur") or 0,
-                        "statut": match.get("statut", "SCHEDULED"),
-                        "date": match.get("date", ""),
-                        "rencId": match.get("rencId", match.get("id", "")),
-                        "last_updated": int(time.time())
-                    }
-                    firebase_db.reference(f'matches/{match_id}').set(match_data)
-            except Exception as firebase_error:
-                print(f"⚠️  Erreur Firebase (non-bloquante): {str(firebase_error)}")
-        
-        # Vérifier et notifier les matchs terminés
-        
-        return {
-            "success": True,
-            "data": matches_data,
-            "count": len(matches_data),
-            "discipline": "salle",
-            "categorie": "N2 Hommes Zone 3"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/api/v1/carquefou/sd/matchs", tags=["Carquefou HC"])
-async def endpoint_matchs_carquefou_sd():
-    """
-    Récupère la liste des matchs de Carquefou HC Seniors Dames (Elite).
-    Envoie aussi des emails pour les matchs nouvellement terminés.
-    
-    Returns:
-        Liste des matchs avec leurs résultats et statuts.
-    
-    Raises:
-        HTTPException: Si la source de données est indisponible (code 503).
-    """
-    matches_data = get_matchs_carquefou_sd_cached()
-    
-    if not matches_data:
-        raise HTTPException(
-            status_code=503,
-            detail="La source de données de la FFH est actuellement indisponible."
-        )
-    
-    # Vérifier et notifier les matchs terminés
-    
-    return {
-        "success": True,
-        "data": matches_data,
-        "count": len(matches_data)
-    }
-
-
-@app.get("/api/v1/carquefou/1sh/classement", tags=["Carquefou HC"])
-async def endpoint_classement_carquefou_1sh():
+@app.get("/api/v1/debug/upstream-stats", tags=["Debug"])
+async def debug_upstream_stats():
     """
-    Récupère le classement de Carquefou HC 1 Seniors Hommes.
-    
-    Returns:
-        Liste des équipes avec leurs statistiques de classement.
-    
-    Raises:
-        HTTPException: Si la source de données est indisponible (code 503).
+    Compteurs des appels vers l'API FFH.
+    - singleflight: nombre de requêtes réellement émises et d'appelants servis
+      par une requête déjà en cours (waiters_saved), au total et par requête.
     """
-    ranking_data = get_classement_carquefou_1sh_cached()
-    
-    if not ranking_data:
-        raise HTTPException(
-            status_code=503,
-            detail="La source de données de la FFH est actuellement indisponible."
-        )
-    
     return {
         "success": True,
-        "data": ranking_data,
-        "count": len(ranking_data)
+        "data": get_upstream_stats()
     }
 
 
-@app.get("/api/v1/carquefou/1sh/matchs", tags=["Carquefou HC"])
-async def endpoint_matchs_carquefou_1sh():
+@app.get("/api/v1/debug/responses", tags=["Debug"])
+async def debug_responses():
     """
-    Récupère la liste des matchs de Carquefou HC 1 Seniors Hommes.
-    
-    Returns:
-        Liste des matchs avec leurs résultats et statuts.
-    
-    Raises:
-        HTTPException: Si la source de données est indisponible (code 503).
+    Corps de réponse pré-encodés (encoded.py) : encodages disponibles, URLs conservées
+    (construites depuis le cache, et autres) et taille totale (JSON et versions compressées).
     """
-    matches_data = get_matchs_carquefou_1sh_cached()
-    
-    if not matches_data:
-        raise HTTPException(
-            status_code=503,
-            detail="La source de données de la FFH est actuellement indisponible."
-        )
-    
+    encoded = list(_encoded_bodies.values())
+    hashed = list(_hashed_bodies.values())
     return {
         "success": True,
-        "data": matches_data,
-        "count": len(matches_data)
+        "data": {
+            "compression": compression_backend(),
+            "urls": len(encoded),
+            "hashed_urls": len(hashed),
+            "bytes": sum(body.size() for body in encoded + hashed),
+            "validators": len(_conditional_keys)
+        }
     }
 
 
-@app.get("/api/v1/carquefou/2sh/classement", tags=["Carquefou HC"])
-async def endpoint_classement_carquefou_2sh():
+@app.get("/api/v1/debug/standings", tags=["Debug"])
+async def debug_standings():
     """
-    Récupère le classement de Carquefou HC 2 Seniors Hommes.
-    
-    Returns:
-        Liste des équipes avec leurs statistiques de classement.
-    
-    Raises:
-        HTTPException: Si la source de données est indisponible (code 503).
+    Tables des classements calculés (standings.py) : synchronisations avec la FFH,
+    résultats appliqués par différence, résultats saisis en direct en attente, et
+    calcul utilisé pour les recalculs en masse (numpy ou python).
     """
-    ranking_data = get_classement_carquefou_2sh_cached()
-    
-    if not ranking_data:
-        raise HTTPException(
-            status_code=503,
-            detail="La source de données de la FFH est actuellement indisponible."
-        )
-    
     return {
         "success": True,
-        "data": ranking_data,
-        "count": len(ranking_data)
+        "data": {
+            "backend": standings_backend(),
+            "vectorize_min_results": VECTORIZE_MIN_RESULTS,
+            "tables": get_standings_stats()
+        }
     }
 
 
-@app.get("/api/v1/carquefou/2sh/matchs", tags=["Carquefou HC"])
-async def endpoint_matchs_carquefou_2sh():
+@app.get("/api/v1/debug/refresh-jobs", tags=["Debug"])
+async def debug_refresh_jobs():
     """
-    Récupère la liste des matchs de Carquefou HC 2 Seniors Hommes.
-    
-    Returns:
-        Liste des matchs avec leurs résultats et statuts.
-    
-    Raises:
-        HTTPException: Si la source de données est indisponible (code 503).
+    Rafraîchissements planifiés du cache : prochaine exécution de chaque job
+    et âge, version et date du dernier changement de chaque entrée du cache dynamique.
     """
-    matches_data = get_matchs_carquefou_2sh_cached()
-    
-    if not matches_data:
-        raise HTTPException(
-            status_code=503,
-            detail="La source de données de la FFH est actuellement indisponible."
-        )
-    
     return {
         "success": True,
-        "data": matches_data,
-        "count": len(matches_data)
+        "data": {
+            "enabled": ENABLE_SCHEDULER,
+            "refresh_ratio": REFRESH_RATIO,
+            "jitter": REFRESH_JITTER,
+            "jobs": get_scheduler_jobs(),
+            "snapshot": await snapshot_store.stats(),
+            "cache": [
+                {
+                    "key": key,
+                    "age": round(age, 1),
+                    "version": cache_dynamic.version(key),
+                    "changed_at": int(cache_dynamic.changed_at(key) or 0)
+                }
+                for key, age in cache_dynamic.entries()
+            ]
+        }
     }
 
 
@@ -1277,25 +1482,11 @@ async def root():
         "message": "Bienvenue sur l'API Hockey sur Gazon France",
         "version": "1.0.0",
         "endpoints": {
-            "elite_hommes": {
-                "classement": "/api/v1/elite-hommes/classement",
-                "matchs": "/api/v1/elite-hommes/matchs"
-            },
-            "elite_femmes": {
-                "classement": "/api/v1/elite-femmes/classement",
-                "matchs": "/api/v1/elite-femmes/matchs"
-            },
-            "carquefou_sd_elite": {
-                "matchs": "/api/v1/carquefou/sd/matchs"
-            },
-            "carquefou_1_poule_a": {
-                "classement": "/api/v1/carquefou/1sh/classement",
-                "matchs": "/api/v1/carquefou/1sh/matchs"
-            },
-            "carquefou_2_poule_b": {
-                "classement": "/api/v1/carquefou/2sh/classement",
-                "matchs": "/api/v1/carquefou/2sh/matchs"
+            **{
+                competition.id: {route.rsplit("/", 1)[1]: route for route in competition.routes()}
+                for competition in COMPETITIONS.values() if competition.path
             },
+            "competitions": "/api/v1/competitions",
             "documentation": "/docs"
         }
     }
@@ -1316,160 +1507,151 @@ async def health_check():
 # INTERLIGUES U14 (NOUVELLES COMPÉTITIONS)
 # ============================================
 
-import requests
-
 @app.get("/api/v1/interligues-u14-filles/classement", tags=["Interligues U14"], include_in_schema=False, summary="Classement U14 Filles")
-def get_classement_interligues_u14_filles():
+async def get_classement_interligues_u14_filles():
     """
     Récupère le classement calculé des Interligues U14 Filles.
     Calcul automatique: Victoire=3pts, Nul=1pt, Défaite=0pts
-    Critères de départage: Différence de buts
+    Critères de départage: U14_FILLES.tiebreakers (différence de buts, puis buts marqués)
     
     Returns:
         Classement des équipes U14 Filles
     """
-    return calculate_classement_u14_filles()
+    return await cache_dynamic.get(U14_FILLES.ranking_key, calculate_classement_u14_filles)
 
 
 @app.get("/api/v1/interligues-u14-filles/matchs", tags=["Interligues U14"], include_in_schema=False, summary="Matchs U14 Filles")
-def get_matchs_interligues_u14_filles():
+async def get_matchs_interligues_u14_filles(statut: str = None, du: str = None, au: str = None,
+                                          equipe: str = None, limit: int = None, cursor: str = None,
+                                          fields: str = None):
     """
     Récupère les matchs des Interligues U14 Filles (Championnat de France des Régions).
+    Mêmes paramètres de sélection, pagination et champs que les routes /matchs du registre.
     
     Returns:
         Liste des matchs U14 Filles avec format standardisé
     """
-    try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4401",  # U14 Filles
-            "PhaseId": "",
-            "PouleId": "",
-            "TournId": "",
-            "JourId": "",
-            "StructureCodeParticipante": "",
-            "EqpId": "",
-            "EqpIdDomicile": "",
-            "StructureCodeDomicile": "",
-            "EqpIdVisiteurs": "",
-            "StructureCodeVisiteurs": "",
-            "StructureCodeTerrain": "",
-            "StructureCodeLieuPratique": ""
-        }
+    response = await cache_dynamic.get(U14_FILLES.matches_key, fetch_matchs_interligues_u14_filles)
+    return _u14_query_response(U14_FILLES, response, _match_query(statut, du, au, equipe, limit, cursor, fields))
+
+
+def _u14_query_response(competition, response, query):
+    """Réponse U14 en cache, ou sa sélection si des paramètres sont renseignés (match_query.py)."""
+    if not query.active or not response.get("success"):
+        return response
+    data, next_cursor = _select_matches(competition, query, response["data"])
+    return {"success": True, "data": data, "count": len(data), "next_cursor": next_cursor}
+
+
+def _format_matchs_u14(data, with_poule=False):
+    """
+    Transforme une réponse ListerRencontres au format attendu par le Dashboard (avec RencId).
+    
+    Args:
+        data: Réponse brute de l'API FFH
+        with_poule: Ajouter le libellé de la poule à chaque match
         
-        response = requests.get(url, params=params)
-        data = response.json()
+    Returns:
+        Réponse formatée avec la liste des matchs
+    """
+    matches_raw = data["Response"].get("RencontresArray", {})
+    matches_formatted = []
+    for match in matches_raw.values():
+        formatted_match = format_match_data(match, include_renc_id=True)
+        if with_poule:
+            # Ajouter le champ poule s'il existe
+            formatted_match["poule"] = match.get("Poule", {}).get("PouleLib", "")
+        matches_formatted.append(formatted_match)
+    return {"success": True, "data": matches_formatted, "count": len(matches_formatted)}
+
+
+async def fetch_matchs_interligues_u14_filles():
+    """
+    Charge les matchs des Interligues U14 Filles depuis la FFH (registre : u14-filles-gazon).
+    
+    Returns:
+        Réponse formatée avec la liste des matchs U14 Filles
+    """
+    try:
+        data = await fetch_rencontres(manif_id=U14_FILLES.manif_id)
         
         if data.get("ResponseCode") == "200" and "Response" in data:
-            matches_raw = data["Response"].get("RencontresArray", {})
-            # Transformer les données au format attendu par le Dashboard avec RencId
-            matches_formatted = []
-            for match in matches_raw.values():
-                formatted_match = format_match_data(match, include_renc_id=True)
-                matches_formatted.append(formatted_match)
-            return {"success": True, "data": matches_formatted, "count": len(matches_formatted)}
+            return derive("matchs_interligues_u14_filles", data, _format_matchs_u14)
         else:
             return {"success": False, "data": [], "count": 0}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur lors de la récupération des matchs U14 Filles: {str(e)}")
 
 
-def calculate_classement_u14_filles():
+def _u14_fixtures(data):
+    """
+    Rencontres U14 d'une réponse ListerRencontres pour la table de classement :
+    un match compte dès que ses deux scores sont saisis.
+    """
+    fixtures = []
+    for renc_id, match in data["Response"].get("RencontresArray", {}).items():
+        equipe1_nom = match.get("Equipe1", {}).get("EquipeNom", "TBD")
+        equipe2_nom = match.get("Equipe2", {}).get("EquipeNom", "TBD")
+        but1 = match.get("Scores", {}).get("RencButsEqp1")
+        but2 = match.get("Scores", {}).get("RencButsEqp2")
+        
+        # Matchs non joués (pas de score) : connus de la table, sans résultat
+        if not but1 or not but2:
+            fixtures.append((str(match.get("RencId") or renc_id), equipe1_nom, equipe2_nom, None, None))
+        else:
+            fixtures.append((str(match.get("RencId") or renc_id), equipe1_nom, equipe2_nom, int(but1), int(but2)))
+    return fixtures
+
+
+def _format_classement_u14(rows):
+    """Classement U14 au format de l'API (gagnees, nulles, perdues, difference_buts)."""
+    classement = [
+        {
+            "equipe": row.equipe,
+            "joues": row.joues,
+            "gagnees": row.gagnes,
+            "nulles": row.nuls,
+            "perdues": row.perdus,
+            "buts_pour": row.buts_pour,
+            "buts_contre": row.buts_contre,
+            "points": row.points,
+            "difference_buts": row.buts_pour - row.buts_contre
+        }
+        for row in rows
+    ]
+    return {"success": True, "data": classement, "count": len(classement)}
+
+
+def _classement_u14_from_rencontres(data):
+    """
+    Classement U14 à partir d'une réponse ListerRencontres.
+    La table (standings.py) n'applique que les résultats qui ont changé depuis la
+    réponse précédente ; tri par points puis selon U14_FILLES.tiebreakers.
+    
+    Args:
+        data: Réponse brute de l'API FFH
+        
+    Returns:
+        Réponse formatée avec le classement
+    """
+    table = standings_table(U14_FILLES.id, U14_FILLES.tiebreakers)
+    if table.source is not data:
+        table.sync(_u14_fixtures(data))
+        table.source = data
+    return derive("classement_interligues_u14_filles", table.rows(), _format_classement_u14)
+
+
+async def calculate_classement_u14_filles():
     """
     Calcule le classement des U14 Filles à partir des matchs.
     Règles: Victoire = 3pts, Nul = 1pt, Défaite = 0pts
-    Critères de départage: Différence de buts
+    Critères de départage: U14_FILLES.tiebreakers (différence de buts, puis buts marqués)
     """
     try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4401"  # U14 Filles
-        }
-        
-        response = requests.get(url, params=params)
-        data = response.json()
+        data = await fetch_rencontres(manif_id=U14_FILLES.manif_id)
         
         if data.get("ResponseCode") == "200" and "Response" in data:
-            matches_raw = data["Response"].get("RencontresArray", {})
-            
-            # Dictionnaire pour stocker les stats de chaque équipe
-            standings = {}
-            
-            for match in matches_raw.values():
-                # Récupérer les infos du match
-                equipe1_nom = match.get("Equipe1", {}).get("EquipeNom", "TBD")
-                equipe2_nom = match.get("Equipe2", {}).get("EquipeNom", "TBD")
-                but1 = match.get("Scores", {}).get("RencButsEqp1")
-                but2 = match.get("Scores", {}).get("RencButsEqp2")
-                
-                # Ignorer les matchs non joués (pas de score)
-                if not but1 or not but2:
-                    continue
-                
-                but1 = int(but1)
-                but2 = int(but2)
-                
-                # Initialiser les équipes si pas encore dans le classement
-                if equipe1_nom not in standings:
-                    standings[equipe1_nom] = {
-                        "equipe": equipe1_nom,
-                        "joues": 0,
-                        "gagnees": 0,
-                        "nulles": 0,
-                        "perdues": 0,
-                        "buts_pour": 0,
-                        "buts_contre": 0,
-                        "points": 0
-                    }
-                
-                if equipe2_nom not in standings:
-                    standings[equipe2_nom] = {
-                        "equipe": equipe2_nom,
-                        "joues": 0,
-                        "gagnees": 0,
-                        "nulles": 0,
-                        "perdues": 0,
-                        "buts_pour": 0,
-                        "buts_contre": 0,
-                        "points": 0
-                    }
-                
-                # Mettre à jour les stats
-                standings[equipe1_nom]["joues"] += 1
-                standings[equipe1_nom]["buts_pour"] += but1
-                standings[equipe1_nom]["buts_contre"] += but2
-                
-                standings[equipe2_nom]["joues"] += 1
-                standings[equipe2_nom]["buts_pour"] += but2
-                standings[equipe2_nom]["buts_contre"] += but1
-                
-                # Calculer les points
-                if but1 > but2:  # Équipe 1 gagne
-                    standings[equipe1_nom]["gagnees"] += 1
-                    standings[equipe1_nom]["points"] += 3
-                    standings[equipe2_nom]["perdues"] += 1
-                elif but2 > but1:  # Équipe 2 gagne
-                    standings[equipe2_nom]["gagnees"] += 1
-                    standings[equipe2_nom]["points"] += 3
-                    standings[equipe1_nom]["perdues"] += 1
-                else:  # Match nul
-                    standings[equipe1_nom]["nulles"] += 1
-                    standings[equipe1_nom]["points"] += 1
-                    standings[equipe2_nom]["nulles"] += 1
-                    standings[equipe2_nom]["points"] += 1
-            
-            # Calculer la différence de buts et trier
-            classement = []
-            for equipe in standings.values():
-                equipe["difference_buts"] = equipe["buts_pour"] - equipe["buts_contre"]
-                classement.append(equipe)
-            
-            # Trier par: Points DESC, Différence de buts DESC, Buts marqués DESC
-            classement.sort(key=lambda x: (-x["points"], -x["difference_buts"], -x["buts_pour"]))
-            
-            return {"success": True, "data": classement, "count": len(classement)}
+            return _classement_u14_from_rencontres(data)
         else:
             return {"success": False, "data": [], "count": 0}
             
@@ -1484,17 +1666,22 @@ def calculate_classement_u14_filles():
 # Gazon: /api/v1/gazon/u14-garcons/phases
 # Salle: /api/v1/salle/u14-garcons/phases (quand les données arriveront)
 
-# Mapping discipline -> ManifIds
-MANIFESTATION_IDS = {
-    "gazon": {
-        "u14-garcons": "4400",
-        "u14-filles": "4401",
-    },
-    "salle": {
-        "u14-garcons": "",  # À remplir quand les données arriveront
-        "u14-filles": "",   # À remplir quand les données arriveront
-    }
-}
+def _u14_manif_id(discipline, categorie):
+    """
+    ManifId des Interligues U14 d'une discipline, d'après le registre des compétitions.
+
+    Raises:
+        HTTPException: 400 si la discipline n'existe pas, 503 si la FFH n'a pas encore publié la compétition
+    """
+    competition = find_competition(discipline, categorie)
+    if competition is None:
+        raise HTTPException(status_code=400, detail=f"Discipline '{discipline}' non supportée. Utilisez 'gazon' ou 'salle'.")
+    if not competition.available:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Les données pour {discipline} {competition.label} ne sont pas encore disponibles."
+        )
+    return competition.manif_id
 
 @app.get("/api/v1/{discipline}/u14-garcons/phases", tags=["Interligues U14 - Générique"], include_in_schema=False)
 async def get_u14_garcons_phases_generic(discipline: str):
@@ -1511,14 +1698,9 @@ async def get_u14_garcons_phases_generic(discipline: str):
         /api/v1/gazon/u14-garcons/phases
     """
     discipline = discipline.lower()
-    if discipline not in MANIFESTATION_IDS or "u14-garcons" not in MANIFESTATION_IDS[discipline]:
-        raise HTTPException(status_code=400, detail=f"Discipline '{discipline}' non supportée. Utilisez 'gazon' ou 'salle'.")
-    
-    manif_id = MANIFESTATION_IDS[discipline]["u14-garcons"]
-    if not manif_id:
-        raise HTTPException(status_code=503, detail=f"Les données pour {discipline} U14 Garçons ne sont pas encore disponibles.")
+    manif_id = _u14_manif_id(discipline, "u14-garcons")
     
-    phases = get_phases_for_manifestation(manif_id)
+    phases = await get_phases_for_manifestation(manif_id)
     if phases is None:
         raise HTTPException(status_code=503, detail="Impossible de récupérer les phases.")
     
@@ -1546,12 +1728,7 @@ async def get_u14_garcons_poules_generic(discipline: str, phase_id: str):
         /api/v1/gazon/u14-garcons/poules/7174
     """
     discipline = discipline.lower()
-    if discipline not in MANIFESTATION_IDS or "u14-garcons" not in MANIFESTATION_IDS[discipline]:
-        raise HTTPException(status_code=400, detail=f"Discipline '{discipline}' non supportée. Utilisez 'gazon' ou 'salle'.")
-    
-    manif_id = MANIFESTATION_IDS[discipline]["u14-garcons"]
-    if not manif_id:
-        raise HTTPException(status_code=503, detail=f"Les données pour {discipline} U14 Garçons ne sont pas encore disponibles.")
+    manif_id = _u14_manif_id(discipline, "u14-garcons")
     
     # Données manuelles pour gazon uniquement (en attente de confirmation pour salle)
     poules_mapping_gazon = {
@@ -1570,7 +1747,7 @@ async def get_u14_garcons_poules_generic(discipline: str, phase_id: str):
     }
     
     poules_mapping = poules_mapping_gazon if discipline == "gazon" else {}
-    poules = get_poules_for_phase(manif_id, phase_id, poules_mapping)
+    poules = await get_poules_for_phase(manif_id, phase_id, poules_mapping)
     
     return {
         "success": True,
@@ -1597,14 +1774,9 @@ async def get_u14_filles_phases_generic(discipline: str):
         /api/v1/gazon/u14-filles/phases
     """
     discipline = discipline.lower()
-    if discipline not in MANIFESTATION_IDS or "u14-filles" not in MANIFESTATION_IDS[discipline]:
-        raise HTTPException(status_code=400, detail=f"Discipline '{discipline}' non supportée. Utilisez 'gazon' ou 'salle'.")
-    
-    manif_id = MANIFESTATION_IDS[discipline]["u14-filles"]
-    if not manif_id:
-        raise HTTPException(status_code=503, detail=f"Les données pour {discipline} U14 Filles ne sont pas encore disponibles.")
+    manif_id = _u14_manif_id(discipline, "u14-filles")
     
-    phases = get_phases_for_manifestation(manif_id)
+    phases = await get_phases_for_manifestation(manif_id)
     if phases is None:
         raise HTTPException(status_code=503, detail="Impossible de récupérer les phases.")
     
@@ -1632,12 +1804,7 @@ async def get_u14_filles_poules_generic(discipline: str, phase_id: str):
         /api/v1/gazon/u14-filles/poules/7182
     """
     discipline = discipline.lower()
-    if discipline not in MANIFESTATION_IDS or "u14-filles" not in MANIFESTATION_IDS[discipline]:
-        raise HTTPException(status_code=400, detail=f"Discipline '{discipline}' non supportée. Utilisez 'gazon' ou 'salle'.")
-    
-    manif_id = MANIFESTATION_IDS[discipline]["u14-filles"]
-    if not manif_id:
-        raise HTTPException(status_code=503, detail=f"Les données pour {discipline} U14 Filles ne sont pas encore disponibles.")
+    manif_id = _u14_manif_id(discipline, "u14-filles")
     
     # Données manuelles pour gazon uniquement
     poules_mapping_gazon = {
@@ -1653,7 +1820,7 @@ async def get_u14_filles_poules_generic(discipline: str, phase_id: str):
     }
     
     poules_mapping = poules_mapping_gazon if discipline == "gazon" else {}
-    poules = get_poules_for_phase(manif_id, phase_id, poules_mapping)
+    poules = await get_poules_for_phase(manif_id, phase_id, poules_mapping)
     
     return {
         "success": True,
@@ -1667,45 +1834,34 @@ async def get_u14_filles_poules_generic(discipline: str, phase_id: str):
 
 
 @app.get("/api/v1/interligues-u14-garcons/matchs", tags=["Interligues U14"], include_in_schema=False, summary="Matchs U14 Garçons")
-def get_matchs_interligues_u14_garcons():
+async def get_matchs_interligues_u14_garcons(statut: str = None, du: str = None, au: str = None,
+                                          equipe: str = None, limit: int = None, cursor: str = None,
+                                          fields: str = None):
     """
     Récupère les matchs des Interligues U14 Garçons (Championnat de France des Régions).
+    Mêmes paramètres de sélection, pagination et champs que les routes /matchs du registre.
     
     Returns:
         Liste des matchs U14 Garçons avec format standardisé
     """
+    response = await cache_dynamic.get(U14_GARCONS.matches_key, fetch_matchs_interligues_u14_garcons)
+    return _u14_query_response(U14_GARCONS, response, _match_query(statut, du, au, equipe, limit, cursor, fields))
+
+
+async def fetch_matchs_interligues_u14_garcons():
+    """
+    Charge les matchs des Interligues U14 Garçons depuis la FFH (registre : u14-garcons-gazon).
+    
+    Returns:
+        Réponse formatée avec la liste des matchs U14 Garçons (avec le champ poule)
+    """
     try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4400",  # U14 Garçons
-            "PhaseId": "",
-            "PouleId": "",
-            "TournId": "",
-            "JourId": "",
-            "StructureCodeParticipante": "",
-            "EqpId": "",
-            "EqpIdDomicile": "",
-            "StructureCodeDomicile": "",
-            "EqpIdVisiteurs": "",
-            "StructureCodeVisiteurs": "",
-            "StructureCodeTerrain": "",
-            "StructureCodeLieuPratique": ""
-        }
-        
-        response = requests.get(url, params=params)
-        data = response.json()
+        data = await fetch_rencontres(manif_id=U14_GARCONS.manif_id)
         
         if data.get("ResponseCode") == "200" and "Response" in data:
-            matches_raw = data["Response"].get("RencontresArray", {})
-            # Transformer les données au format attendu par le Dashboard avec RencId
-            matches_formatted = []
-            for match in matches_raw.values():
-                formatted_match = format_match_data(match, include_renc_id=True)
-                # Ajouter le champ poule s'il existe
-                formatted_match["poule"] = match.get("Poule", {}).get("PouleLib", "")
-                matches_formatted.append(formatted_match)
-            return {"success": True, "data": matches_formatted, "count": len(matches_formatted)}
+            return derive(
+                "matchs_interligues_u14_garcons", data, lambda d: _format_matchs_u14(d, with_poule=True)
+            )
         else:
             return {"success": False, "data": [], "count": 0}
     except Exception as e:
@@ -1716,68 +1872,39 @@ def get_matchs_interligues_u14_garcons():
 async def get_matchs_interligues_u14_garcons_poule_a():
     """
     Récupère les matchs des Interligues U14 Garçons - POULE A uniquement.
+    Filtre les matchs U14 Garçons en cache (même ManifId 4400).
     """
-    try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4400"
-        }
-        
-        response = requests.get(url, params=params)
-        data = response.json()
-        
-        if data.get("ResponseCode") == "200" and "Response" in data:
-            matches_raw = data["Response"].get("RencontresArray", {})
-            # Filtrer et transformer les données pour Poule A seulement avec RencId
-            matches_formatted = []
-            for match in matches_raw.values():
-                # Filtrer par Poule A
-                if match.get("Poule", {}).get("PouleLib") == "Poule A":
-                    formatted_match = format_match_data(match, include_renc_id=True)
-                    formatted_match["poule"] = match.get("Poule", {}).get("PouleLib", "")
-                    matches_formatted.append(formatted_match)
-            
-            # Vérifier les matchs terminés et envoyer des notifications
-            
-            return {"success": True, "data": matches_formatted, "count": len(matches_formatted)}
-        else:
-            return {"success": False, "data": [], "count": 0}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de la récupération des matchs U14 Garçons Poule A: {str(e)}")
+    return await _filter_matchs_u14_garcons_by_poule("Poule A")
 
 
 @app.get("/api/v1/interligues-u14-garcons-poule-b/matchs", tags=["Interligues U14"], include_in_schema=False)
 async def get_matchs_interligues_u14_garcons_poule_b():
     """
     Récupère les matchs des Interligues U14 Garçons - POULE B uniquement.
+    Filtre les matchs U14 Garçons en cache (même ManifId 4400).
     """
-    try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4400"
-        }
-        
-        response = requests.get(url, params=params)
-        data = response.json()
+    return await _filter_matchs_u14_garcons_by_poule("Poule B")
+
+
+async def _filter_matchs_u14_garcons_by_poule(poule_lib):
+    """
+    Filtre les matchs U14 Garçons en cache sur le libellé de poule.
+    
+    Args:
+        poule_lib: Libellé de la poule (ex: "Poule A")
         
-        if data.get("ResponseCode") == "200" and "Response" in data:
-            matches_raw = data["Response"].get("RencontresArray", {})
-            # Filtrer et transformer les données pour Poule B seulement
-            matches_formatted = []
-            for match in matches_raw.values():
-                # Filtrer par Poule B
-                if match.get("Poule", {}).get("PouleLib") == "Poule B":
-                    matches_formatted.append(format_match_data(match))
-            
-            # Vérifier les matchs terminés et envoyer des notifications
-            
-            return {"success": True, "data": matches_formatted, "count": len(matches_formatted)}
-        else:
-            return {"success": False, "data": [], "count": 0}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de la récupération des matchs U14 Garçons Poule B: {str(e)}")
+    Returns:
+        Réponse formatée avec les matchs de la poule
+    """
+    all_matches = await get_matchs_interligues_u14_garcons()
+    if not all_matches.get("success"):
+        return {"success": False, "data": [], "count": 0}
+    
+    def select(matches):
+        matches_formatted = [match for match in matches if match.get("poule") == poule_lib]
+        return {"success": True, "data": matches_formatted, "count": len(matches_formatted)}
+    
+    return derive(("matchs_interligues_u14_garcons", poule_lib), all_matches["data"], select)
 
 
 @app.get("/api/v1/interligues-u14-garcons/phases", tags=["Interligues U14"], include_in_schema=False)
@@ -1787,15 +1914,13 @@ async def get_interligues_u14_garcons_phases():
     Permet de suivre l'évolution de la compétition.
     """
     try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerPhases"
+        endpoint = "ListerPhases"
         params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4400"  # U14 Garçons
+            "SaisonAnnee": SAISON_ANNEE,
+            "ManifId": U14_GARCONS.manif_id
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = await fetch_json(endpoint, params)
         
         if data.get("ResponseCode") == "200" and "Response" in data:
             phases_raw = data["Response"].get("PhasesArray", {})
@@ -1842,24 +1967,6 @@ async def get_interligues_u14_garcons_poules(phase_id: str):
         /api/v1/interligues-u14-garcons/poules/7174
     """
     try:
-        # D'abord récupérer les poules
-        poules_url = "https://championnats.ffhockey.org/rest2/Championnats/ListerPoules"
-        poules_params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4400",  # U14 Garçons
-            "PhaseId": phase_id
-        }
-        
-        poules_response = requests.get(poules_url, params=poules_params, timeout=10)
-        poules_response.raise_for_status()
-        poules_data = poules_response.json()
-        
-        if poules_data.get("ResponseCode") != "200":
-            return {"success": False, "data": [], "count": 0}
-        
-        poules_raw = poules_data.get("Response", {}).get("PoulesArray", {})
-        poules_formatted = []
-        
         # Données manuelles pour les demi-finales du 29/10 (en attente de confirmation)
         matches_demi_finales_29oct = [
             ("11694", "Demi-Finale 1A vs 2B", [
@@ -1895,46 +2002,7 @@ async def get_interligues_u14_garcons_poules(phase_id: str):
         # Mapper les poules avec les matchs manuels
         poules_mapping = {poule_id: (libelle, matches) for poule_id, libelle, matches in matches_demi_finales_29oct + matches_finales_30oct}
         
-        # Pour chaque poule, récupérer les rencontres
-        for poule_id, poule in poules_raw.items():
-            poule_info = {
-                "poule_id": poule.get("PouleId"),
-                "libelle": poule.get("PouleLib"),
-                "rencontres": []
-            }
-            
-            # Récupérer les rencontres pour cette poule
-            try:
-                renc_url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-                renc_params = {
-                    "SaisonAnnee": "2026",
-                    "ManifId": "4400",
-                    "PouleId": poule_id
-                }
-                
-                renc_response = requests.get(renc_url, params=renc_params, timeout=10)
-                renc_response.raise_for_status()
-                renc_data = renc_response.json()
-                
-                if renc_data.get("ResponseCode") == "200":
-                    rencontres_raw = renc_data.get("Response", {}).get("RencontresArray", {})
-                    
-                    for match in rencontres_raw.values():
-                        formatted_match = format_match_data(match, include_renc_id=True)
-                        poule_info["rencontres"].append(formatted_match)
-                
-                # Si pas de rencontres de FFHockey, ajouter les données manuelles si disponibles
-                if not poule_info["rencontres"] and poule_id in poules_mapping:
-                    poule_info["rencontres"] = poules_mapping[poule_id][1]
-                    poule_info["source"] = "manual"  # Indiquer que c'est une donnée manuelle
-                    
-            except:
-                # Si pas de rencontres FFHockey, ajouter les données manuelles
-                if poule_id in poules_mapping:
-                    poule_info["rencontres"] = poules_mapping[poule_id][1]
-                    poule_info["source"] = "manual"
-            
-            poules_formatted.append(poule_info)
+        poules_formatted = await get_poules_for_phase(U14_GARCONS.manif_id, phase_id, poules_mapping)
         
         return {
             "success": True,
@@ -1953,15 +2021,13 @@ async def get_interligues_u14_filles_phases():
     Permet de suivre l'évolution de la compétition.
     """
     try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerPhases"
+        endpoint = "ListerPhases"
         params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4401"  # U14 Filles
+            "SaisonAnnee": SAISON_ANNEE,
+            "ManifId": U14_FILLES.manif_id
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = await fetch_json(endpoint, params)
         
         if data.get("ResponseCode") == "200" and "Response" in data:
             phases_raw = data["Response"].get("PhasesArray", {})
@@ -2008,23 +2074,6 @@ async def get_interligues_u14_filles_poules(phase_id: str):
         /api/v1/interligues-u14-filles/poules/7182
     """
     try:
-        # D'abord récupérer les poules
-        poules_url = "https://championnats.ffhockey.org/rest2/Championnats/ListerPoules"
-        poules_params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4401"  # U14 Filles
-        }
-        
-        poules_response = requests.get(poules_url, params=poules_params, timeout=10)
-        poules_response.raise_for_status()
-        poules_data = poules_response.json()
-        
-        if poules_data.get("ResponseCode") != "200":
-            return {"success": False, "data": [], "count": 0}
-        
-        poules_raw = poules_data.get("Response", {}).get("PoulesArray", {})
-        poules_formatted = []
-        
         # Données manuelles pour les finales du 30/10 (en attente de confirmation)
         matches_finales_30oct = [
             ("11702", "Places 1 et 2", [
@@ -2041,46 +2090,7 @@ async def get_interligues_u14_filles_poules(phase_id: str):
         # Mapper les poules avec les matchs manuels
         poules_mapping = {poule_id: (libelle, matches) for poule_id, libelle, matches in matches_finales_30oct}
         
-        # Pour chaque poule, récupérer les rencontres
-        for poule_id, poule in poules_raw.items():
-            poule_info = {
-                "poule_id": poule.get("PouleId"),
-                "libelle": poule.get("PouleLib"),
-                "rencontres": []
-            }
-            
-            # Récupérer les rencontres pour cette poule
-            try:
-                renc_url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-                renc_params = {
-                    "SaisonAnnee": "2026",
-                    "ManifId": "4401",
-                    "PouleId": poule_id
-                }
-                
-                renc_response = requests.get(renc_url, params=renc_params, timeout=10)
-                renc_response.raise_for_status()
-                renc_data = renc_response.json()
-                
-                if renc_data.get("ResponseCode") == "200":
-                    rencontres_raw = renc_data.get("Response", {}).get("RencontresArray", {})
-                    
-                    for match in rencontres_raw.values():
-                        formatted_match = format_match_data(match, include_renc_id=True)
-                        poule_info["rencontres"].append(formatted_match)
-                
-                # Si pas de rencontres de FFHockey, ajouter les données manuelles si disponibles
-                if not poule_info["rencontres"] and poule_id in poules_mapping:
-                    poule_info["rencontres"] = poules_mapping[poule_id][1]
-                    poule_info["source"] = "manual"  # Indiquer que c'est une donnée manuelle
-                    
-            except:
-                # Si pas de rencontres FFHockey, ajouter les données manuelles
-                if poule_id in poules_mapping:
-                    poule_info["rencontres"] = poules_mapping[poule_id][1]
-                    poule_info["source"] = "manual"
-            
-            poules_formatted.append(poule_info)
+        poules_formatted = await get_poules_for_phase(U14_FILLES.manif_id, phase_id, poules_mapping)
         
         return {
             "success": True,
@@ -2111,19 +2121,14 @@ async def get_match_scorers(renc_id: str):
         /api/v1/match/196053/buteurs
     """
     try:
-        import requests
-        
         # Récupérer la feuille de match
-        url = "https://championnats.ffhockey.org/rest2/Championnats/FeuilleDeMatchHTML"
+        endpoint = "FeuilleDeMatchHTML"
         params = {
-            "SaisonAnnee": "2026",
+            "SaisonAnnee": SAISON_ANNEE,
             "RencId": renc_id
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = await fetch_json(endpoint, params)
         
         if data.get("ResponseCode") != "200":
             raise HTTPException(
@@ -2140,9 +2145,9 @@ async def get_match_scorers(renc_id: str):
             "data": scorers
         }
         
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="Timeout lors de la récupération des buteurs")
-    except requests.exceptions.ConnectionError:
+    except httpx.TransportError:
         raise HTTPException(status_code=503, detail="Impossible de se connecter à l'API FFH")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur: {str(e)}")
@@ -2164,19 +2169,14 @@ async def get_match_cards(renc_id: str):
         /api/v1/match/196053/cartons
     """
     try:
-        import requests
-        
         # Récupérer la feuille de match
-        url = "https://championnats.ffhockey.org/rest2/Championnats/FeuilleDeMatchHTML"
+        endpoint = "FeuilleDeMatchHTML"
         params = {
-            "SaisonAnnee": "2026",
+            "SaisonAnnee": SAISON_ANNEE,
             "RencId": renc_id
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = await fetch_json(endpoint, params)
         
         if data.get("ResponseCode") != "200":
             raise HTTPException(
@@ -2193,9 +2193,9 @@ async def get_match_cards(renc_id: str):
             "data": cards
         }
         
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="Timeout lors de la récupération des cartons")
-    except requests.exceptions.ConnectionError:
+    except httpx.TransportError:
         raise HTTPException(status_code=503, detail="Impossible de se connecter à l'API FFH")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur: {str(e)}")
@@ -2218,17 +2218,13 @@ async def get_match_officials(renc_id: str, manif_id: str = ""):
         /api/v1/match/196053/officiels
     """
     try:
-        import requests
-        
         # D'abord récupérer les infos du match depuis la feuille de match
-        sheet_url = "https://championnats.ffhockey.org/rest2/Championnats/FeuilleDeMatchHTML"
+        sheet_endpoint = "FeuilleDeMatchHTML"
         sheet_params = {
-            "SaisonAnnee": "2026",
+            "SaisonAnnee": SAISON_ANNEE,
             "RencId": renc_id
         }
-        sheet_response = requests.get(sheet_url, params=sheet_params, timeout=10)
-        sheet_response.raise_for_status()
-        sheet_data = sheet_response.json()
+        sheet_data = await fetch_json(sheet_endpoint, sheet_params)
         
         # Extraire les infos du match
         html_content = sheet_data.get("Response", {}).get("RenduHTML", "")
@@ -2239,19 +2235,16 @@ async def get_match_officials(renc_id: str, manif_id: str = ""):
             match_info = get_match_info_from_api(renc_id)
         
         # Ensuite récupérer les officiels
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerOfficiels"
+        endpoint = "ListerOfficiels"
         params = {
-            "SaisonAnnee": "2026",
+            "SaisonAnnee": SAISON_ANNEE,
             "RencId": renc_id,
             "ManifId": manif_id or "",
             "PersonneId": "",
             "LicenceCode": ""
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = await fetch_json(endpoint, params)
         
         if data.get("ResponseCode") != "200":
             raise HTTPException(
@@ -2297,9 +2290,9 @@ async def get_match_officials(renc_id: str, manif_id: str = ""):
             "officiels": officials_list
         }
         
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="Timeout lors de la récupération des officiels")
-    except requests.exceptions.ConnectionError:
+    except httpx.TransportError:
         raise HTTPException(status_code=503, detail="Impossible de se connecter à l'API FFH")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur: {str(e)}")
@@ -2321,18 +2314,13 @@ async def get_match_sheet(renc_id: str):
         /api/v1/match/196053/feuille-de-match
     """
     try:
-        import requests
-        
-        url = "https://championnats.ffhockey.org/rest2/Championnats/FeuilleDeMatchHTML"
+        endpoint = "FeuilleDeMatchHTML"
         params = {
-            "SaisonAnnee": "2026",
+            "SaisonAnnee": SAISON_ANNEE,
             "RencId": renc_id
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = await fetch_json(endpoint, params)
         
         if data.get("ResponseCode") != "200":
             raise HTTPException(
@@ -2349,9 +2337,9 @@ async def get_match_sheet(renc_id: str):
             "html": html_content
         }
         
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         raise HTTPException(status_code=504, detail="Timeout lors de la récupération de la feuille de match")
-    except requests.exceptions.ConnectionError:
+    except httpx.TransportError:
         raise HTTPException(status_code=503, detail="Impossible de se connecter à l'API FFH")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Erreur: {str(e)}")
@@ -2663,6 +2651,36 @@ async def get_live_match(match_id: str):
         raise HTTPException(status_code=500, detail=f"Erreur Firebase: {str(e)}")
 
 
+def _apply_live_ranking(match_id, live_match):
+    """
+    Répercute un match du live score sur les classements calculés qui le contiennent
+    (standings.py) : un match terminé (FINISHED) compte avec son score saisi, sinon son
+    résultat en direct est retiré. Les classements modifiés sont remplacés dans le cache
+    dynamique sans retélécharger le championnat (erreurs non bloquantes).
+    """
+    if not live_match:
+        return
+    try:
+        renc_id = str(live_match.get('rencId') or match_id.partition('_')[2])
+        scores = None
+        if live_match.get('statut') == 'FINISHED':
+            scores = (int(live_match.get('score_domicile') or 0), int(live_match.get('score_exterieur') or 0))
+        for name in apply_live_result(renc_id, scores):
+            competition = COMPETITIONS.get(name)
+            if competition is None:
+                continue
+            rows = standings_table(name).rows()
+            if competition is U14_FILLES:
+                cache_dynamic[competition.ranking_key] = derive(
+                    "classement_interligues_u14_filles", rows, _format_classement_u14
+                )
+            else:
+                cache_dynamic[competition.ranking_key] = rows
+            print(f"🔄 Classement {competition.label} mis à jour (match {match_id})")
+    except Exception as e:
+        print(f"⚠️ Classement non mis à jour pour le match {match_id}: {e}")
+
+
 @app.put("/api/v1/live/match/{match_id}/score", tags=["Live Score"], summary="Mettre à jour le score")
 async def update_match_score(match_id: str, score: ScoreUpdate, admin_token: str = None):
     """
@@ -2719,6 +2737,11 @@ async def update_match_score(match_id: str, score: ScoreUpdate, admin_token: str
                         'last_updated': int(time.time())
                     })
                     print(f"✅ Score {match_id} mis à jour dans Firebase")
+                    _apply_live_ranking(match_id, {
+                        **existing_match,
+                        'score_domicile': score.score_domicile,
+                        'score_exterieur': score.score_exterieur
+                    })
                 backend = "Firebase"
             except Exception as fb_error:
                 print(f"❌ Firebase échoue pour score: {type(fb_error).__name__}: {str(fb_error)}")
@@ -2733,6 +2756,7 @@ async def update_match_score(match_id: str, score: ScoreUpdate, admin_token: str
                 LIVE_MATCHES_CACHE[match_id]['score_domicile'] = score.score_domicile
                 LIVE_MATCHES_CACHE[match_id]['score_exterieur'] = score.score_exterieur
                 LIVE_MATCHES_CACHE[match_id]['last_updated'] = int(time.time())
+                _apply_live_ranking(match_id, LIVE_MATCHES_CACHE[match_id])
                 backend = "Cache"
         else:
             # Utiliser le cache
@@ -2745,6 +2769,7 @@ async def update_match_score(match_id: str, score: ScoreUpdate, admin_token: str
             LIVE_MATCHES_CACHE[match_id]['score_domicile'] = score.score_domicile
             LIVE_MATCHES_CACHE[match_id]['score_exterieur'] = score.score_exterieur
             LIVE_MATCHES_CACHE[match_id]['last_updated'] = int(time.time())
+            _apply_live_ranking(match_id, LIVE_MATCHES_CACHE[match_id])
             backend = "Cache"
         
         # 🔔 Appeler les webhooks enregistrés
@@ -2932,6 +2957,7 @@ async def update_match_status(match_id: str, status: MatchStatusUpdate, admin_to
             'statut': status.statut,
             'last_updated': int(time.time())
         })
+        _apply_live_ranking(match_id, match_ref.get())
         
         return {
             "success": True,
@@ -3170,12 +3196,10 @@ async def import_real_data(championship: str, admin_token: str = None):
     - Ignore les équipes invalides (test, simulation, etc.)
     
     Championnats supportés:
-    - elite-hommes
-    - elite-femmes
     - u14-garcons
     - u14-filles
-    - carquefou-1sh, carquefou-2sh, carquefou-sd
-    - salle-elite-femmes
+    - les compétitions du registre ayant un live_id (competitions.py) : elite-hommes,
+      elite-femmes, salle-elite-femmes, n2-salle-zone3, carquefou-1sh, carquefou-2sh, carquefou-sd
     """
     if not admin_token or not verify_admin_token(admin_token):
         raise HTTPException(status_code=401, detail="Token admin invalide")
@@ -3186,33 +3210,19 @@ async def import_real_data(championship: str, admin_token: str = None):
         # Récupérer les vrais matchs depuis le cache FFH
         matches_list = []
         
+        competition = find_by_live_id(championship)
         if championship == "u14-garcons":
-            matches_list = get_matchs_interligues_u14_garcons() or []
+            competition = U14_GARCONS
         elif championship == "u14-filles":
-            matches_list = get_matchs_interligues_u14_filles() or []
-        elif championship == "carquefou-1sh":
-            matches_list = get_matchs_carquefou_1sh_cached() or []
-        elif championship == "carquefou-2sh":
-            matches_list = get_matchs_carquefou_2sh_cached() or []
-        elif championship == "carquefou-sd":
-            matches_list = get_matchs_carquefou_sd_cached() or []
-        elif championship == "salle-elite-femmes":
-            # ✨ Salle Elite Femmes: données réelles depuis FFHockey (ManifId=4403)
-            matches_list = get_matchs_salle_elite_femmes_cached() or []
-        else:
+            competition = U14_FILLES
+        elif competition is None:
             raise HTTPException(status_code=400, detail=f"Championnat {championship} non reconnu")
+        display_name = competition.label
         
-        championship_display = {
-            "elite-hommes": "Elite Hommes",
-            "elite-femmes": "Elite Femmes", 
-            "u14-garcons": "U14 Garçons",
-            "u14-filles": "U14 Filles",
-            "carquefou-1sh": "Carquefou 1SH",
-            "carquefou-2sh": "Carquefou 2SH",
-            "carquefou-sd": "Carquefou SD",
-            "salle-elite-femmes": "Salle Elite Femmes"
-        }
-        display_name = championship_display.get(championship, championship)
+        # 📅 Matchs du calendrier de la compétition (dates analysées une fois par liste de matchs) :
+        # matchs futurs d'abord (les plus proches), puis passés (les plus récents), puis sans date
+        calendar = await _competition_calendar(competition)
+        matches_list = [to_public(match) for _, match in calendar.by_proximity(time.time())]
         
         # 🔍 FILTRER LES MATCHS DE TEST ET INVALIDES
         filtered_matches = []
@@ -3228,23 +3238,6 @@ async def import_real_data(championship: str, admin_token: str = None):
             if not is_test and home and away and home != away:
                 filtered_matches.append(match)
         
-        # 📅 TRIER PAR DATES PROCHES (matchs futurs d'abord, puis récents)
-        from datetime import datetime
-        now = datetime.now()
-        
-        def get_sort_key(match):
-            date_str = match.get('date', '')
-            try:
-                match_date = datetime.strptime(date_str, '%Y-%m-%d %H:%M:%S')
-                if match_date < now:
-                    return (1, abs((now - match_date).total_seconds()))  # Matchs passés: après
-                else:
-                    return (0, (match_date - now).total_seconds())  # Matchs futurs: avant
-            except:
-                return (2, 0)  # Pas de date: à la fin
-        
-        filtered_matches.sort(key=get_sort_key)
-        
         # 📱 Récupérer les matchs EXISTANTS dans Firebase
         existing_match_keys = set()
         if FIREBASE_ENABLED:
@@ -3341,915 +3334,3 @@ async def import_real_data(championship: str, admin_token: str = None):
     except Exception as e:
         print(f"❌ Erreur: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Erreur: {str(e)}")
-
-
-@app.get("/api/v1/salle/nationale-2-hommes-zone-3/classement", tags=["N2 Hommes Salle Zone 3"])
-def get_n2_salle_zone3_classement():
-    """
-    Retourne le classement pour le championnat Nationale 2 Hommes Salle - Zone 3.
-    """
-    try:
-        data = get_ranking_n2_salle_zone3_cached()
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/api/v1/salle/nationale-2-hommes-zone-3/matchs", tags=["N2 Hommes Salle Zone 3"])
-def get_n2_salle_zone3_matchs():
-    """
-    Retourne la liste des matchs pour le championnat Nationale 2 Hommes Salle - Zone 3.
-    """
-    try:
-        matches_data = get_matches_n2_salle_zone3_cached()
-        
-        # Sauvegarder automatiquement dans Firebase
-        if FIREBASE_ENABLED:
-            try:
-                from firebase_admin import db as firebase_db
-                for match in matches_data:
-                    match_id = f"n2-salle-zone3_{match.get('rencId', match.get('id', ''))}"
-                    match_data = {
-                        "championship": "n2-salle-zone3",
-                        "equipe_domicile": match.get("equipe_domicile", "?"),
-                        "equipe_exterieur": match.get("equipe_exterieur", "?"),
-                        "score_domicile": match.get("score_domicile") or 0,
-                        "score_exterieur": match.get("score_exterieur") or 0,
-                        "statut": match.get("statut", "SCHEDULED"),
-                        "date": match.get("date", ""),
-                        "rencId": match.get("rencId", match.get("id", "")),
-                        "last_updated": int(time.time())
-                    }
-                    firebase_db.reference(f'matches/{match_id}').set(match_data)
-            except Exception as firebase_error:
-                print(f"⚠️  Erreur Firebase (non-bloquante): {str(firebase_error)}")
-        
-        # Vérifier et notifier les matchs terminés
-        
-        return {
-            "success": True,
-            "data": matches_data,
-            "count": len(matches_data),
-            "discipline": "salle",
-            "categorie": "N2 Hommes Zone 3"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/api/v1/carquefou/sd/matchs", tags=["Carquefou HC"])
-async def endpoint_matchs_carquefou_sd():
-    """
-    Récupère la liste des matchs de Carquefou HC Seniors Dames (Elite).
-    Envoie aussi des emails pour les matchs nouvellement terminés.
-    
-    Returns:
-        Liste des matchs avec leurs résultats et statuts.
-    
-    Raises:
-        HTTPException: Si la source de données est indisponible (code 503).
-    """
-    matches_data = get_matchs_carquefou_sd_cached()
-    
-    if not matches_data:
-        raise HTTPException(
-            status_code=503,
-            detail="La source de données de la FFH est actuellement indisponible."
-        )
-    
-    # Vérifier et notifier les matchs terminés
-    
-    return {
-        "success": True,
-        "data": matches_data,
-        "count": len(matches_data)
-    }
-
-
-@app.get("/api/v1/carquefou/1sh/classement", tags=["Carquefou HC"])
-async def endpoint_classement_carquefou_1sh():
-    """
-    Récupère le classement de Carquefou HC 1 Seniors Hommes.
-    
-    Returns:
-        Liste des équipes avec leurs statistiques de classement.
-    
-    Raises:
-        HTTPException: Si la source de données est indisponible (code 503).
-    """
-    ranking_data = get_classement_carquefou_1sh_cached()
-    
-    if not ranking_data:
-        raise HTTPException(
-            status_code=503,
-            detail="La source de données de la FFH est actuellement indisponible."
-        )
-    
-    return {
-        "success": True,
-        "data": ranking_data,
-        "count": len(ranking_data)
-    }
-
-
-@app.get("/api/v1/carquefou/1sh/matchs", tags=["Carquefou HC"])
-async def endpoint_matchs_carquefou_1sh():
-    """
-    Récupère la liste des matchs de Carquefou HC 1 Seniors Hommes.
-    
-    Returns:
-        Liste des matchs avec leurs résultats et statuts.
-    
-    Raises:
-        HTTPException: Si la source de données est indisponible (code 503).
-    """
-    matches_data = get_matchs_carquefou_1sh_cached()
-    
-    if not matches_data:
-        raise HTTPException(
-            status_code=503,
-            detail="La source de données de la FFH est actuellement indisponible."
-        )
-    
-    return {
-        "success": True,
-        "data": matches_data,
-        "count": len(matches_data)
-    }
-
-
-@app.get("/api/v1/carquefou/2sh/classement", tags=["Carquefou HC"])
-async def endpoint_classement_carquefou_2sh():
-    """
-    Récupère le classement de Carquefou HC 2 Seniors Hommes.
-    
-    Returns:
-        Liste des équipes avec leurs statistiques de classement.
-    
-    Raises:
-        HTTPException: Si la source de données est indisponible (code 503).
-    """
-    ranking_data = get_classement_carquefou_2sh_cached()
-    
-    if not ranking_data:
-        raise HTTPException(
-            status_code=503,
-            detail="La source de données de la FFH est actuellement indisponible."
-        )
-    
-    return {
-        "success": True,
-        "data": ranking_data,
-        "count": len(ranking_data)
-    }
-
-
-@app.get("/api/v1/carquefou/2sh/matchs", tags=["Carquefou HC"])
-async def endpoint_matchs_carquefou_2sh():
-    """
-    Récupère la liste des matchs de Carquefou HC 2 Seniors Hommes.
-    
-    Returns:
-        Liste des matchs avec leurs résultats et statuts.
-    
-    Raises:
-        HTTPException: Si la source de données est indisponible (code 503).
-    """
-    matches_data = get_matchs_carquefou_2sh_cached()
-    
-    if not matches_data:
-        raise HTTPException(
-            status_code=503,
-            detail="La source de données de la FFH est actuellement indisponible."
-        )
-    
-    return {
-        "success": True,
-        "data": matches_data,
-        "count": len(matches_data)
-    }
-
-
-@app.get("/", tags=["Santé"])
-async def root():
-    """
-    Endpoint de vérification de la santé de l'API.
-    """
-    return {
-        "message": "Bienvenue sur l'API Hockey sur Gazon France",
-        "version": "1.0.0",
-        "endpoints": {
-            "elite_hommes": {
-                "classement": "/api/v1/elite-hommes/classement",
-                "matchs": "/api/v1/elite-hommes/matchs"
-            },
-            "elite_femmes": {
-                "classement": "/api/v1/elite-femmes/classement",
-                "matchs": "/api/v1/elite-femmes/matchs"
-            },
-            "carquefou_sd_elite": {
-                "matchs": "/api/v1/carquefou/sd/matchs"
-            },
-            "carquefou_1_poule_a": {
-                "classement": "/api/v1/carquefou/1sh/classement",
-                "matchs": "/api/v1/carquefou/1sh/matchs"
-            },
-            "carquefou_2_poule_b": {
-                "classement": "/api/v1/carquefou/2sh/classement",
-                "matchs": "/api/v1/carquefou/2sh/matchs"
-            },
-            "documentation": "/docs"
-        }
-    }
-
-
-@app.get("/health", tags=["Santé"])
-async def health_check():
-    """
-    Endpoint de santé pour les vérifications de disponibilité.
-    """
-    return {
-        "status": "healthy",
-        "message": "L'API est en ligne et fonctionnelle"
-    }
-
-
-# ============================================
-# INTERLIGUES U14 (NOUVELLES COMPÉTITIONS)
-# ============================================
-
-import requests
-
-@app.get("/api/v1/interligues-u14-filles/classement", tags=["Interligues U14"], include_in_schema=False, summary="Classement U14 Filles")
-def get_classement_interligues_u14_filles():
-    """
-    Récupère le classement calculé des Interligues U14 Filles.
-    Calcul automatique: Victoire=3pts, Nul=1pt, Défaite=0pts
-    Critères de départage: Différence de buts
-    
-    Returns:
-        Classement des équipes U14 Filles
-    """
-    return calculate_classement_u14_filles()
-
-
-@app.get("/api/v1/interligues-u14-filles/matchs", tags=["Interligues U14"], include_in_schema=False, summary="Matchs U14 Filles")
-def get_matchs_interligues_u14_filles():
-    """
-    Récupère les matchs des Interligues U14 Filles (Championnat de France des Régions).
-    
-    Returns:
-        Liste des matchs U14 Filles avec format standardisé
-    """
-    try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4401",  # U14 Filles
-            "PhaseId": "",
-            "PouleId": "",
-            "TournId": "",
-            "JourId": "",
-            "StructureCodeParticipante": "",
-            "EqpId": "",
-            "EqpIdDomicile": "",
-            "StructureCodeDomicile": "",
-            "EqpIdVisiteurs": "",
-            "StructureCodeVisiteurs": "",
-            "StructureCodeTerrain": "",
-            "StructureCodeLieuPratique": ""
-        }
-        
-        response = requests.get(url, params=params)
-        data = response.json()
-        
-        if data.get("ResponseCode") == "200" and "Response" in data:
-            matches_raw = data["Response"].get("RencontresArray", {})
-            # Transformer les données au format attendu par le Dashboard avec RencId
-            matches_formatted = []
-            for match in matches_raw.values():
-                formatted_match = format_match_data(match, include_renc_id=True)
-                matches_formatted.append(formatted_match)
-            return {"success": True, "data": matches_formatted, "count": len(matches_formatted)}
-        else:
-            return {"success": False, "data": [], "count": 0}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de la récupération des matchs U14 Filles: {str(e)}")
-
-
-def calculate_classement_u14_filles():
-    """
-    Calcule le classement des U14 Filles à partir des matchs.
-    Règles: Victoire = 3pts, Nul = 1pt, Défaite = 0pts
-    Critères de départage: Différence de buts
-    """
-    try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4401"  # U14 Filles
-        }
-        
-        response = requests.get(url, params=params)
-        data = response.json()
-        
-        if data.get("ResponseCode") == "200" and "Response" in data:
-            matches_raw = data["Response"].get("RencontresArray", {})
-            
-            # Dictionnaire pour stocker les stats de chaque équipe
-            standings = {}
-            
-            for match in matches_raw.values():
-                # Récupérer les infos du match
-                equipe1_nom = match.get("Equipe1", {}).get("EquipeNom", "TBD")
-                equipe2_nom = match.get("Equipe2", {}).get("EquipeNom", "TBD")
-                but1 = match.get("Scores", {}).get("RencButsEqp1") or 0
-                but2 = match.get("Scores", {}).get("RencButsEqp2") or 0
-                
-                # Initialiser les équipes si pas déjà fait
-                if equipe1_nom not in standings:
-                    standings[equipe1_nom] = {
-                        "equipe": equipe1_nom,
-                        "joues": 0,
-                        "gagnees": 0,
-                        "nulles": 0,
-                        "perdues": 0,
-                        "buts_pour": 0,
-                        "buts_contre": 0,
-                        "points": 0
-                    }
-                
-                if equipe2_nom not in standings:
-                    standings[equipe2_nom] = {
-                        "equipe": equipe2_nom,
-                        "joues": 0,
-                        "gagnees": 0,
-                        "nulles": 0,
-                        "perdues": 0,
-                        "buts_pour": 0,
-                        "buts_contre": 0,
-                        "points": 0
-                    }
-                
-                # Mettre à jour les stats
-                standings[equipe1_nom]["joues"] += 1
-                standings[equipe1_nom]["buts_pour"] += but1
-                standings[equipe1_nom]["buts_contre"] += but2
-                
-                standings[equipe2_nom]["joues"] += 1
-                standings[equipe2_nom]["buts_pour"] += but2
-                standings[equipe2_nom]["buts_contre"] += but1
-                
-                # Calculer les points
-                if but1 > but2:  # Équipe 1 gagne
-                    standings[equipe1_nom]["gagnees"] += 1
-                    standings[equipe1_nom]["points"] += 3
-                    standings[equipe2_nom]["perdues"] += 1
-                elif but2 > but1:  # Équipe 2 gagne
-                    standings[equipe2_nom]["gagnees"] += 1
-                    standings[equipe2_nom]["points"] += 3
-                    standings[equipe1_nom]["perdues"] += 1
-                else:  # Match nul
-                    standings[equipe1_nom]["nulles"] += 1
-                    standings[equipe1_nom]["points"] += 1
-                    standings[equipe2_nom]["nulles"] += 1
-                    standings[equipe2_nom]["points"] += 1
-            
-            # Calculer la différence de buts et trier
-            classement = []
-            for equipe in standings.values():
-                equipe["difference_buts"] = equipe["buts_pour"] - equipe["buts_contre"]
-                classement.append(equipe)
-            
-            # Trier par: Points DESC, Différence de buts DESC, Buts marqués DESC
-            classement.sort(key=lambda x: (-x["points"], -x["difference_buts"], -x["buts_pour"]))
-            
-            return {"success": True, "data": classement, "count": len(classement)}
-        else:
-            return {"success": False, "data": [], "count": 0}
-            
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors du calcul du classement U14 Filles: {str(e)}")
-
-
-# ============================================
-# ENDPOINTS GÉNÉRIQUES - GAZON & SALLE
-# ============================================
-# Ces endpoints supportent à la fois Gazon et Salle
-# Gazon: /api/v1/gazon/u14-garcons/phases
-# Salle: /api/v1/salle/u14-garcons/phases (quand les données arriveront)
-
-# Mapping discipline -> ManifIds
-MANIFESTATION_IDS = {
-    "gazon": {
-        "u14-garcons": "4400",
-        "u14-filles": "4401",
-    },
-    "salle": {
-        "u14-garcons": "",  # À remplir quand les données arriveront
-        "u14-filles": "",   # À remplir quand les données arriveront
-    }
-}
-
-@app.get("/api/v1/{discipline}/u14-garcons/phases", tags=["Interligues U14 - Générique"], include_in_schema=False)
-async def get_u14_garcons_phases_generic(discipline: str):
-    """
-    Récupère les phases des Interligues U14 Garçons pour une discipline donnée.
-    
-    Args:
-        discipline: "gazon" ou "salle"
-        
-    Returns:
-        Liste des phases
-        
-    Example:
-        /api/v1/gazon/u14-garcons/phases
-    """
-    discipline = discipline.lower()
-    if discipline not in MANIFESTATION_IDS or "u14-garcons" not in MANIFESTATION_IDS[discipline]:
-        raise HTTPException(status_code=400, detail=f"Discipline '{discipline}' non supportée. Utilisez 'gazon' ou 'salle'.")
-    
-    manif_id = MANIFESTATION_IDS[discipline]["u14-garcons"]
-    if not manif_id:
-        raise HTTPException(status_code=503, detail=f"Les données pour {discipline} U14 Garçons ne sont pas encore disponibles.")
-    
-    phases = get_phases_for_manifestation(manif_id)
-    if phases is None:
-        raise HTTPException(status_code=503, detail="Impossible de récupérer les phases.")
-    
-    return {
-        "success": True,
-        "data": phases,
-        "count": len(phases),
-        "discipline": discipline,
-        "categorie": "U14 Garçons"
-    }
-
-@app.get("/api/v1/{discipline}/u14-garcons/poules/{phase_id}", tags=["Interligues U14 - Générique"], include_in_schema=False)
-async def get_u14_garcons_poules_generic(discipline: str, phase_id: str):
-    """
-    Récupère les poules et rencontres pour une phase des Interligues U14 Garçons.
-    
-    Args:
-        discipline: "gazon" ou "salle"
-        phase_id: L'ID de la phase
-        
-    Returns:
-        Liste des poules avec leurs rencontres
-        
-    Example:
-        /api/v1/gazon/u14-garcons/poules/7174
-    """
-    discipline = discipline.lower()
-    if discipline not in MANIFESTATION_IDS or "u14-garcons" not in MANIFESTATION_IDS[discipline]:
-        raise HTTPException(status_code=400, detail=f"Discipline '{discipline}' non supportée. Utilisez 'gazon' ou 'salle'.")
-    
-    manif_id = MANIFESTATION_IDS[discipline]["u14-garcons"]
-    if not manif_id:
-        raise HTTPException(status_code=503, detail=f"Les données pour {discipline} U14 Garçons ne sont pas encore disponibles.")
-    
-    # Données manuelles pour gazon uniquement (en attente de confirmation pour salle)
-    poules_mapping_gazon = {
-        "11694": ("Demi-Finale 1A vs 2B", [
-            create_placeholder_match("Île-de-France vs La Réunion", "2025-10-29", "09:00"),
-        ]),
-        "11695": ("Demi-Finale 1B vs 2A", [
-            create_placeholder_match("Hauts-de-France vs Normandie", "2025-10-29", "10:10"),
-        ]),
-        "11696": ("Demi-Finale 3A vs 4B", [
-            create_placeholder_match("Nouvelle Aquitaine vs Auvergne-Rhône-Alpes", "2025-10-29", "11:20"),
-        ]),
-        "11697": ("Demi-Finale 4A vs 3B", [
-            create_placeholder_match("Pays de la Loire vs Occitanie", "2025-10-29", "12:30"),
-        ]),
-    }
-    
-    poules_mapping = poules_mapping_gazon if discipline == "gazon" else {}
-    poules = get_poules_for_phase(manif_id, phase_id, poules_mapping)
-    
-    return {
-        "success": True,
-        "data": poules,
-        "count": len(poules),
-        "discipline": discipline,
-        "categorie": "U14 Garçons",
-        "phase_id": phase_id,
-        "note": "Les données manuelles (source: manual) seront confirmées/remplacées dès que FFHockey les fournie."
-    }
-
-@app.get("/api/v1/{discipline}/u14-filles/phases", tags=["Interligues U14 - Générique"], include_in_schema=False)
-async def get_u14_filles_phases_generic(discipline: str):
-    """
-    Récupère les phases des Interligues U14 Filles pour une discipline donnée.
-    
-    Args:
-        discipline: "gazon" ou "salle"
-        
-    Returns:
-        Liste des phases
-        
-    Example:
-        /api/v1/gazon/u14-filles/phases
-    """
-    discipline = discipline.lower()
-    if discipline not in MANIFESTATION_IDS or "u14-filles" not in MANIFESTATION_IDS[discipline]:
-        raise HTTPException(status_code=400, detail=f"Discipline '{discipline}' non supportée. Utilisez 'gazon' ou 'salle'.")
-    
-    manif_id = MANIFESTATION_IDS[discipline]["u14-filles"]
-    if not manif_id:
-        raise HTTPException(status_code=503, detail=f"Les données pour {discipline} U14 Filles ne sont pas encore disponibles.")
-    
-    phases = get_phases_for_manifestation(manif_id)
-    if phases is None:
-        raise HTTPException(status_code=503, detail="Impossible de récupérer les phases.")
-    
-    return {
-        "success": True,
-        "data": phases,
-        "count": len(phases),
-        "discipline": discipline,
-        "categorie": "U14 Filles"
-    }
-
-@app.get("/api/v1/{discipline}/u14-filles/poules/{phase_id}", tags=["Interligues U14 - Générique"], include_in_schema=False)
-async def get_u14_filles_poules_generic(discipline: str, phase_id: str):
-    """
-    Récupère les poules et rencontres pour une phase des Interligues U14 Filles.
-    
-    Args:
-        discipline: "gazon" ou "salle"
-        phase_id: L'ID de la phase
-        
-    Returns:
-        Liste des poules avec leurs rencontres
-        
-    Example:
-        /api/v1/gazon/u14-filles/poules/7182
-    """
-    discipline = discipline.lower()
-    if discipline not in MANIFESTATION_IDS or "u14-filles" not in MANIFESTATION_IDS[discipline]:
-        raise HTTPException(status_code=400, detail=f"Discipline '{discipline}' non supportée. Utilisez 'gazon' ou 'salle'.")
-    
-    manif_id = MANIFESTATION_IDS[discipline]["u14-filles"]
-    if not manif_id:
-        raise HTTPException(status_code=503, detail=f"Les données pour {discipline} U14 Filles ne sont pas encore disponibles.")
-    
-    # Données manuelles pour gazon uniquement
-    poules_mapping_gazon = {
-        "11702": ("Places 1 et 2", [
-            create_placeholder_match("Finale du Championnat", "2025-10-30", "12:30", "La Boulie"),
-        ]),
-        "11703": ("Places 3 et 4", [
-            create_placeholder_match("Match pour la médaille de bronze", "2025-10-30", "10:10", "La Boulie"),
-        ]),
-        "11704": ("Places 5 et 6", [
-            create_placeholder_match("Classement 5e/6e place", "2025-10-30", "10:40", "Asnières"),
-        ]),
-    }
-    
-    poules_mapping = poules_mapping_gazon if discipline == "gazon" else {}
-    poules = get_poules_for_phase(manif_id, phase_id, poules_mapping)
-    
-    return {
-        "success": True,
-        "data": poules,
-        "count": len(poules),
-        "discipline": discipline,
-        "categorie": "U14 Filles",
-        "phase_id": phase_id,
-        "note": "Les données manuelles (source: manual) seront confirmées/remplacées dès que FFHockey les fournie."
-    }
-
-
-@app.get("/api/v1/interligues-u14-garcons/matchs", tags=["Interligues U14"], include_in_schema=False, summary="Matchs U14 Garçons")
-def get_matchs_interligues_u14_garcons():
-    """
-    Récupère les matchs des Interligues U14 Garçons (Championnat de France des Régions).
-    
-    Returns:
-        Liste des matchs U14 Garçons avec format standardisé
-    """
-    try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4400",  # U14 Garçons
-            "PhaseId": "",
-            "PouleId": "",
-            "TournId": "",
-            "JourId": "",
-            "StructureCodeParticipante": "",
-            "EqpId": "",
-            "EqpIdDomicile": "",
-            "StructureCodeDomicile": "",
-            "EqpIdVisiteurs": "",
-            "StructureCodeVisiteurs": "",
-            "StructureCodeTerrain": "",
-            "StructureCodeLieuPratique": ""
-        }
-        
-        response = requests.get(url, params=params)
-        data = response.json()
-        
-        if data.get("ResponseCode") == "200" and "Response" in data:
-            matches_raw = data["Response"].get("RencontresArray", {})
-            # Transformer les données au format attendu par le Dashboard avec RencId
-            matches_formatted = []
-            for match in matches_raw.values():
-                formatted_match = format_match_data(match, include_renc_id=True)
-                # Ajouter le champ poule s'il existe
-                formatted_match["poule"] = match.get("Poule", {}).get("PouleLib", "")
-                matches_formatted.append(formatted_match)
-            return {"success": True, "data": matches_formatted, "count": len(matches_formatted)}
-        else:
-            return {"success": False, "data": [], "count": 0}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de la récupération des matchs U14 Garçons: {str(e)}")
-
-
-@app.get("/api/v1/interligues-u14-garcons-poule-a/matchs", tags=["Interligues U14"], include_in_schema=False)
-async def get_matchs_interligues_u14_garcons_poule_a():
-    """
-    Récupère les matchs des Interligues U14 Garçons - POULE A uniquement.
-    """
-    try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4400"
-        }
-        
-        response = requests.get(url, params=params)
-        data = response.json()
-        
-        if data.get("ResponseCode") == "200" and "Response" in data:
-            matches_raw = data["Response"].get("RencontresArray", {})
-            # Filtrer et transformer les données pour Poule A seulement avec RencId
-            matches_formatted = []
-            for match in matches_raw.values():
-                # Filtrer par Poule A
-                if match.get("Poule", {}).get("PouleLib") == "Poule A":
-                    formatted_match = format_match_data(match, include_renc_id=True)
-                    formatted_match["poule"] = match.get("Poule", {}).get("PouleLib", "")
-                    matches_formatted.append(formatted_match)
-            
-            # Vérifier les matchs terminés et envoyer des notifications
-            
-            return {"success": True, "data": matches_formatted, "count": len(matches_formatted)}
-        else:
-            return {"success": False, "data": [], "count": 0}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de la récupération des matchs U14 Garçons Poule A: {str(e)}")
-
-
-@app.get("/api/v1/interligues-u14-garcons-poule-b/matchs", tags=["Interligues U14"], include_in_schema=False)
-async def get_matchs_interligues_u14_garcons_poule_b():
-    """
-    Récupère les matchs des Interligues U14 Garçons - POULE B uniquement.
-    """
-    try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4400"
-        }
-        
-        response = requests.get(url, params=params)
-        data = response.json()
-        
-        if data.get("ResponseCode") == "200" and "Response" in data:
-            matches_raw = data["Response"].get("RencontresArray", {})
-            # Filtrer et transformer les données pour Poule B seulement
-            matches_formatted = []
-            for match in matches_raw.values():
-                # Filtrer par Poule B
-                if match.get("Poule", {}).get("PouleLib") == "Poule B":
-                    matches_formatted.append(format_match_data(match))
-            
-            # Vérifier les matchs terminés et envoyer des notifications
-            
-            return {"success": True, "data": matches_formatted, "count": len(matches_formatted)}
-        else:
-            return {"success": False, "data": [], "count": 0}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de la récupération des matchs U14 Garçons Poule B: {str(e)}")
-
-
-@app.get("/api/v1/interligues-u14-garcons/phases", tags=["Interligues U14"], include_in_schema=False)
-async def get_interligues_u14_garcons_phases():
-    """
-    Récupère les phases (groupes, 1/2 finales, finales) des Interligues U14 Garçons.
-    Permet de suivre l'évolution de la compétition.
-    """
-    try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerPhases"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4400"  # U14 Garçons
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data.get("ResponseCode") == "200" and "Response" in data:
-            phases_raw = data["Response"].get("PhasesArray", {})
-            phases_formatted = []
-            
-            for phase_id, phase in phases_raw.items():
-                phases_formatted.append({
-                    "phase_id": phase.get("PhaseId"),
-                    "libelle": phase.get("PhaseLib"),
-                    "ordre": int(phase.get("PhaseOrdre", 0)),
-                    "date_debut": phase.get("PhaseDateDebut"),
-                    "date_fin": phase.get("PhaseDateFin"),
-                    "type": phase.get("PhaseRencType")
-                })
-            
-            # Trier par ordre
-            phases_formatted.sort(key=lambda x: x["ordre"])
-            
-            return {
-                "success": True,
-                "data": phases_formatted,
-                "count": len(phases_formatted)
-            }
-        else:
-            return {"success": False, "data": [], "count": 0}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de la récupération des phases: {str(e)}")
-
-
-@app.get("/api/v1/interligues-u14-garcons/poules/{phase_id}", tags=["Interligues U14"], include_in_schema=False)
-async def get_interligues_u14_garcons_poules(phase_id: str):
-    """
-    Récupère les poules (matchups) pour une phase spécifique des Interligues U14 Garçons.
-    Les rencontres s'ajoutent automatiquement dès que les équipes sont désignées.
-    Inclut les données manuelles en attente de confirmation FFHockey.
-    
-    Args:
-        phase_id: L'identifiant de la phase (ex: 7174 pour 1/2 finales)
-        
-    Returns:
-        Liste des poules avec leurs rencontres
-        
-    Example:
-        /api/v1/interligues-u14-garcons/poules/7174
-    """
-    try:
-        # D'abord récupérer les poules
-        poules_url = "https://championnats.ffhockey.org/rest2/Championnats/ListerPoules"
-        poules_params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4400",  # U14 Garçons
-            "PhaseId": phase_id
-        }
-        
-        poules_response = requests.get(poules_url, params=poules_params, timeout=10)
-        poules_response.raise_for_status()
-        poules_data = poules_response.json()
-        
-        if poules_data.get("ResponseCode") != "200":
-            return {"success": False, "data": [], "count": 0}
-        
-        poules_raw = poules_data.get("Response", {}).get("PoulesArray", {})
-        poules_formatted = []
-        
-        # Données manuelles pour les demi-finales du 29/10 (en attente de confirmation)
-        matches_demi_finales_29oct = [
-            ("11694", "Demi-Finale 1A vs 2B", [
-                create_placeholder_match("Île-de-France vs La Réunion", "2025-10-29", "09:00"),
-            ]),
-            ("11695", "Demi-Finale 1B vs 2A", [
-                create_placeholder_match("Hauts-de-France vs Normandie", "2025-10-29", "10:10"),
-            ]),
-            ("11696", "Demi-Finale 3A vs 4B", [
-                create_placeholder_match("Nouvelle Aquitaine vs Auvergne-Rhône-Alpes", "2025-10-29", "11:20"),
-            ]),
-            ("11697", "Demi-Finale 4A vs 3B", [
-                create_placeholder_match("Pays de la Loire vs Occitanie", "2025-10-29", "12:30"),
-            ]),
-        ]
-        
-        # Données manuelles pour les matchs du 30/10 (finales et classements)
-        matches_finales_30oct = [
-            ("11702", "Match pour la 7e/8e place", [
-                create_placeholder_match("Classement 7e/8e place", "2025-10-30", "09:30", "Asnières"),
-            ]),
-            ("11703", "Match pour la 5e/6e place", [
-                create_placeholder_match("Classement 5e/6e place", "2025-10-30", "09:00", "La Boulie"),
-            ]),
-            ("11704", "Match pour la médaille de Bronze", [
-                create_placeholder_match("Match Bronze", "2025-10-30", "11:20", "La Boulie"),
-            ]),
-            ("11705", "Finale du Championnat", [
-                create_placeholder_match("Finale", "2025-10-30", "13:40", "La Boulie"),
-            ]),
-        ]
-        
-        # Mapper les poules avec les matchs manuels
-        poules_mapping = {poule_id: (libelle, matches) for poule_id, libelle, matches in matches_demi_finales_29oct + matches_finales_30oct}
-        
-        # Pour chaque poule, récupérer les rencontres
-        for poule_id, poule in poules_raw.items():
-            poule_info = {
-                "poule_id": poule.get("PouleId"),
-                "libelle": poule.get("PouleLib"),
-                "rencontres": []
-            }
-            
-            # Récupérer les rencontres pour cette poule
-            try:
-                renc_url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-                renc_params = {
-                    "SaisonAnnee": "2026",
-                    "ManifId": "4400",
-                    "PouleId": poule_id
-                }
-                
-                renc_response = requests.get(renc_url, params=renc_params, timeout=10)
-                renc_response.raise_for_status()
-                renc_data = renc_response.json()
-                
-                if renc_data.get("ResponseCode") == "200":
-                    rencontres_raw = renc_data.get("Response", {}).get("RencontresArray", {})
-                    
-                    for match in rencontres_raw.values():
-                        formatted_match = format_match_data(match, include_renc_id=True)
-                        poule_info["rencontres"].append(formatted_match)
-                
-                # Si pas de rencontres de FFHockey, ajouter les données manuelles si disponibles
-                if not poule_info["rencontres"] and poule_id in poules_mapping:
-                    poule_info["rencontres"] = poules_mapping[poule_id][1]
-                    poule_info["source"] = "manual"  # Indiquer que c'est une donnée manuelle
-                    
-            except:
-                # Si pas de rencontres FFHockey, ajouter les données manuelles
-                if poule_id in poules_mapping:
-                    poule_info["rencontres"] = poules_mapping[poule_id][1]
-                    poule_info["source"] = "manual"
-            
-            poules_formatted.append(poule_info)
-        
-        return {
-            "success": True,
-            "data": poules_formatted,
-            "count": len(poules_formatted),
-            "note": "Les données manuelles (source: manual) seront confirmées/remplacées dès que FFHockey les fournie."
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur lors de la récupération des poules: {str(e)}")
-
-
-@app.get("/api/v1/salle/nationale-2-hommes-zone-3/classement", tags=["N2 Hommes Salle Zone 3"])
-def get_n2_salle_zone3_classement():
-    """
-    Retourne le classement pour le championnat Nationale 2 Hommes Salle - Zone 3.
-    """
-    try:
-        data = get_ranking_n2_salle_zone3_cached()
-        return data
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@app.get("/api/v1/salle/nationale-2-hommes-zone-3/matchs", tags=["N2 Hommes Salle Zone 3"])
-def get_n2_salle_zone3_matchs():
-    """
-    Retourne la liste des matchs pour le championnat Nationale 2 Hommes Salle - Zone 3.
-    """
-    try:
-        matches_data = get_matches_n2_salle_zone3_cached()
-        
-        # Sauvegarder automatiquement dans Firebase
-        if FIREBASE_ENABLED:
-            try:
-                from firebase_admin import db as firebase_db
-                for match in matches_data:
-                    match_id = f"n2-salle-zone3_{match.get('rencId', match.get('id', ''))}"
-                    match_data = {
-                        "championship": "n2-salle-zone3",
-                        "equipe_domicile": match.get("equipe_domicile", "?"),
-                        "equipe_exterieur": match.get("equipe_exterieur", "?"),
-                        "score_domicile": match.get("score_domicile") or 0,
-                        "score_exterieur": match.get("score_exterieur") or 0,
-                        "statut": match.get("statut", "SCHEDULED"),
-                        "date": match.get("date", ""),
-                        "rencId": match.get("rencId", match.get("id", "")),
-                        "last_updated": int(time.time())
-                    }
-                    firebase_db.reference(f'matches/{match_id}').set(match_data)
-            except Exception as firebase_error:
-                print(f"⚠️  Erreur Firebase (non-bloquante): {str(firebase_error)}")
-        
-        # Vérifier et notifier les matchs terminés
-        
-        return {
-            "success": True,
-            "data": matches_data,
-            "count": len(matches_data),
-            "discipline": "salle",
-            "categorie": "N2 Hommes Zone 3"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
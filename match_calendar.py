@@ -0,0 +1,145 @@
+"""
+Calendrier des matchs
+Les dates des matchs sont des chaînes "YYYY-MM-DD HH:MM:SS" : chaque liste de matchs
+du cache est indexée une fois (dates converties en horodatages, matchs triés), puis
+les requêtes par période (aujourd'hui, week-end), les N prochains matchs et les N
+derniers résultats sont des recherches par dichotomie (bisect), en O(log n + k).
+
+Un calendrier est construit une fois par liste de matchs (voir cache.derive) ;
+le calendrier global fusionne ceux des compétitions sans retrier leurs matchs.
+"""
+
+import bisect
+import heapq
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
+
+from models import Match, MatchStatus
+
+
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+@lru_cache(maxsize=8192)
+def parse_date(value: str) -> Optional[float]:
+    """Horodatage (heure locale) d'une date FFH "YYYY-MM-DD HH:MM:SS", None si absente ou invalide."""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, DATE_FORMAT).timestamp()
+    except ValueError:
+        return None
+
+
+def _date_and_result(match: Any) -> Tuple[str, bool]:
+    """Date et résultat saisi d'un match (enregistrement Match ou dict au format public)."""
+    if isinstance(match, Match):
+        return match.date, match.statut == MatchStatus.FINISHED
+    return match.get("date", ""), match.get("statut") == "FINISHED"
+
+
+class MatchCalendar:
+    """
+    Matchs d'une ou plusieurs compétitions triés par date.
+
+    - times / matches / sources : horodatages triés, matchs et compétition de chaque match
+    - result_times / results : idem pour les seuls matchs terminés (résultats)
+    - undated : matchs sans date exploitable, dans leur ordre d'origine
+    """
+
+    __slots__ = ("times", "matches", "sources", "result_times", "results", "undated")
+
+    def __init__(self, matches: Sequence[Any] = (), source: str = ""):
+        dated = []
+        self.undated: List[Tuple[str, Any]] = []
+        for match in matches:
+            date, _ = _date_and_result(match)
+            timestamp = parse_date(date)
+            if timestamp is None:
+                self.undated.append((source, match))
+            else:
+                dated.append((timestamp, source, match))
+        dated.sort(key=lambda entry: entry[0])
+        self._set(dated)
+
+    def _set(self, dated: List[Tuple[float, str, Any]]) -> None:
+        self.times = [entry[0] for entry in dated]
+        self.sources = [entry[1] for entry in dated]
+        self.matches = [entry[2] for entry in dated]
+        finished = [i for i, match in enumerate(self.matches) if _date_and_result(match)[1]]
+        self.result_times = [self.times[i] for i in finished]
+        self.results = [(self.sources[i], self.matches[i]) for i in finished]
+
+    @classmethod
+    def merged(cls, calendars: Sequence["MatchCalendar"]) -> "MatchCalendar":
+        """Calendrier de plusieurs compétitions (fusion de listes déjà triées)."""
+        merged = cls()
+        merged._set(list(heapq.merge(
+            *(zip(c.times, c.sources, c.matches) for c in calendars), key=lambda entry: entry[0]
+        )))
+        merged.undated = [entry for c in calendars for entry in c.undated]
+        return merged
+
+    def between(self, start: float, end: float) -> List[Tuple[str, Any]]:
+        """Matchs (compétition, match) datés de start (inclus) à end (exclu)."""
+        lo = bisect.bisect_left(self.times, start)
+        hi = bisect.bisect_left(self.times, end, lo)
+        return list(zip(self.sources[lo:hi], self.matches[lo:hi]))
+
+    def upcoming(self, now: float, count: int) -> List[Tuple[str, Any]]:
+        """Les count prochains matchs à partir de now."""
+        lo = bisect.bisect_left(self.times, now)
+        return list(zip(self.sources[lo:lo + count], self.matches[lo:lo + count]))
+
+    def latest_results(self, now: float, count: int) -> List[Tuple[str, Any]]:
+        """Les count derniers résultats avant now, du plus récent au plus ancien."""
+        hi = bisect.bisect_left(self.result_times, now)
+        return self.results[max(0, hi - count):hi][::-1]
+
+    def by_proximity(self, now: float) -> List[Tuple[str, Any]]:
+        """Tous les matchs : à venir (les plus proches d'abord), puis passés (les plus récents d'abord), puis sans date."""
+        split = bisect.bisect_left(self.times, now)
+        entries = list(zip(self.sources[split:], self.matches[split:]))
+        entries += list(zip(self.sources[:split], self.matches[:split]))[::-1]
+        return entries + self.undated
+
+    def __len__(self) -> int:
+        return len(self.matches) + len(self.undated)
+
+
+# Dernier calendrier global : (calendriers des compétitions, fusion)
+_merged: Optional[Tuple[Tuple[MatchCalendar, ...], MatchCalendar]] = None
+
+
+def merged_calendar(calendars: Sequence[MatchCalendar]) -> MatchCalendar:
+    """
+    Calendrier global des compétitions, refusionné seulement si le calendrier
+    d'une compétition a changé (même principe que cache.derive).
+    """
+    global _merged
+    calendars = tuple(calendars)
+    if _merged is not None and len(_merged[0]) == len(calendars) and all(
+        a is b for a, b in zip(_merged[0], calendars)
+    ):
+        return _merged[1]
+    merged = MatchCalendar.merged(calendars)
+    _merged = (calendars, merged)
+    return merged
+
+
+def day_bounds(now: datetime) -> Tuple[float, float]:
+    """Début et fin (exclue) du jour de now."""
+    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return start.timestamp(), (start + timedelta(days=1)).timestamp()
+
+
+def weekend_bounds(now: datetime) -> Tuple[float, float]:
+    """Début (samedi 0h) et fin (lundi 0h) du week-end en cours, ou du prochain en semaine."""
+    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    weekday = start.weekday()
+    if weekday == 6:
+        start -= timedelta(days=1)
+    else:
+        start += timedelta(days=5 - weekday)
+    return start.timestamp(), (start + timedelta(days=2)).timestamp()
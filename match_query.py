@@ -0,0 +1,138 @@
+"""
+Requêtes sur les listes de matchs
+Les routes /matchs acceptent des paramètres de sélection (statut, période, équipe),
+de pagination (limit, cursor) et de projection (fields) : ils sont évalués sur les
+matchs en cache, et seuls les matchs retournés sont convertis au format public.
+Une période est lue dans le calendrier de la compétition (match_calendar.py) au lieu
+de parcourir tous les matchs.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from match_calendar import MatchCalendar
+from models import Match, MatchStatus, to_public
+
+
+# Nombre maximum de matchs par page
+MAX_LIMIT = 500
+
+STATUTS = frozenset(status.name for status in MatchStatus)
+
+
+def _parse_bound(value: str, end: bool) -> float:
+    """
+    Borne d'une période : "YYYY-MM-DD" (journée entière) ou "YYYY-MM-DD HH:MM:SS".
+    Une date de fin sans heure inclut toute la journée.
+    """
+    try:
+        if len(value) == 10:
+            day = datetime.strptime(value, "%Y-%m-%d")
+            return (day + timedelta(days=1) if end else day).timestamp()
+        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S").timestamp()
+    except ValueError:
+        raise ValueError(f"Date invalide: {value} (attendu YYYY-MM-DD ou YYYY-MM-DD HH:MM:SS)")
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+def _summary(match: Any) -> Tuple[str, str, str]:
+    """Statut et équipes d'un match (enregistrement Match ou dict au format public)."""
+    if isinstance(match, Match):
+        return match.statut.name, match.equipe_domicile, match.equipe_exterieur
+    return match.get("statut", ""), str(match.get("equipe_domicile", "")), str(match.get("equipe_exterieur", ""))
+
+
+class MatchQuery:
+    """
+    Paramètres d'une requête /matchs.
+
+    - statut : statuts retenus ("FINISHED", "SCHEDULED,NOT_PLAYED"...)
+    - du / au : période (dates incluses) ; les matchs sont alors triés par date
+    - equipe : partie du nom d'une des deux équipes (casse ignorée)
+    - limit / cursor : taille de la page et position de départ (next_cursor de la page précédente)
+    - fields : champs retournés pour chaque match (ex: "rencId,date,statut")
+
+    Raises:
+        ValueError: Si un paramètre est invalide
+    """
+
+    __slots__ = ("statuts", "start", "end", "equipe", "limit", "offset", "fields")
+
+    def __init__(self, statut: Optional[str] = None, du: Optional[str] = None, au: Optional[str] = None,
+                 equipe: Optional[str] = None, limit: Optional[int] = None, cursor: Optional[str] = None,
+                 fields: Optional[str] = None):
+        statuts = {value.upper() for value in _split(statut)}
+        unknown = statuts - STATUTS
+        if unknown:
+            raise ValueError(f"Statut inconnu: {', '.join(sorted(unknown))} (attendu {', '.join(sorted(STATUTS))})")
+        self.statuts: Optional[FrozenSet[str]] = frozenset(statuts) or None
+        self.start = _parse_bound(du, end=False) if du else None
+        self.end = _parse_bound(au, end=True) if au else None
+        self.equipe = equipe.upper() if equipe else None
+        if limit is not None and not 1 <= limit <= MAX_LIMIT:
+            raise ValueError(f"limit doit être compris entre 1 et {MAX_LIMIT}")
+        self.limit = limit
+        try:
+            self.offset = int(cursor) if cursor else 0
+        except ValueError:
+            raise ValueError(f"Curseur invalide: {cursor}")
+        if self.offset < 0:
+            raise ValueError(f"Curseur invalide: {cursor}")
+        self.fields: Optional[Tuple[str, ...]] = tuple(_split(fields)) or None
+
+    @property
+    def active(self) -> bool:
+        """Au moins un paramètre est renseigné (sinon la liste complète est servie telle quelle)."""
+        return any(value is not None for value in (
+            self.statuts, self.start, self.end, self.equipe, self.limit, self.fields
+        )) or self.offset > 0
+
+    def _matches(self, match: Any) -> bool:
+        if self.statuts is None and self.equipe is None:
+            return True
+        statut, domicile, exterieur = _summary(match)
+        if self.statuts is not None and statut not in self.statuts:
+            return False
+        return self.equipe is None or self.equipe in domicile.upper() or self.equipe in exterieur.upper()
+
+    def run(self, matches: List[Any], calendar: Optional[MatchCalendar] = None) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Sélectionne, pagine et projette les matchs.
+
+        Args:
+            matches: Matchs en cache (enregistrements Match ou dicts au format public)
+            calendar: Calendrier des mêmes matchs, utilisé pour une période
+
+        Returns:
+            (matchs au format public, curseur de la page suivante ou None)
+        """
+        if self.start is not None or self.end is not None:
+            if calendar is None:
+                calendar = MatchCalendar(matches)
+            start = self.start if self.start is not None else float("-inf")
+            end = self.end if self.end is not None else float("inf")
+            candidates = (match for _, match in calendar.between(start, end))
+        else:
+            candidates = iter(matches)
+
+        selected = []
+        skipped = 0
+        next_cursor = None
+        for match in candidates:
+            if not self._matches(match):
+                continue
+            if skipped < self.offset:
+                skipped += 1
+                continue
+            if self.limit is not None and len(selected) == self.limit:
+                next_cursor = str(self.offset + self.limit)
+                break
+            selected.append(match)
+
+        data = [to_public(match) for match in selected]
+        if self.fields is not None:
+            data = [{field: item[field] for field in self.fields if field in item} for item in data]
+        return data, next_cursor
@@ -0,0 +1,153 @@
+"""
+Représentation interne compacte des matchs et des classements
+Les données calculées (cache, données dérivées) sont des enregistrements à __slots__
+avec des noms d'équipes internés ; la conversion au format JSON public (dicts)
+n'est faite qu'en sortie, au moment de répondre ou de synchroniser Firebase.
+"""
+
+import sys
+from enum import IntEnum
+from typing import Any, Dict, Optional
+
+
+class MatchStatus(IntEnum):
+    """Statut d'un match (publié sous son nom : "SCHEDULED", "FINISHED", "NOT_PLAYED")."""
+    SCHEDULED = 0
+    FINISHED = 1
+    NOT_PLAYED = 2
+
+
+def intern_name(name: Any) -> str:
+    """Nom d'équipe interné : une seule copie en mémoire pour toutes les rencontres."""
+    return sys.intern(str(name or ""))
+
+
+class Match:
+    """
+    Un match (format public : rencId, date, equipe_domicile, ..., statut).
+    domicile_id / exterieur_id : EquipeId FFH des équipes ("" si inconnu), voir teams.py.
+    """
+
+    __slots__ = ("renc_id", "date", "equipe_domicile", "equipe_exterieur",
+                 "score_domicile", "score_exterieur", "statut", "domicile_id", "exterieur_id")
+
+    def __init__(self, renc_id: str, date: str, equipe_domicile: str, equipe_exterieur: str,
+                 score_domicile: Optional[int], score_exterieur: Optional[int], statut: MatchStatus,
+                 domicile_id: str = "", exterieur_id: str = ""):
+        self.renc_id = renc_id
+        self.date = date
+        self.equipe_domicile = equipe_domicile
+        self.equipe_exterieur = equipe_exterieur
+        self.score_domicile = score_domicile
+        self.score_exterieur = score_exterieur
+        self.statut = statut
+        self.domicile_id = domicile_id
+        self.exterieur_id = exterieur_id
+
+    def with_teams(self, equipe_domicile: str, equipe_exterieur: str) -> "Match":
+        """Copie du match avec d'autres noms d'équipes (les enregistrements sont partagés)."""
+        return Match(self.renc_id, self.date, intern_name(equipe_domicile), intern_name(equipe_exterieur),
+                     self.score_domicile, self.score_exterieur, self.statut,
+                     self.domicile_id, self.exterieur_id)
+
+    def to_dict(self) -> Dict:
+        return {
+            "rencId": self.renc_id,
+            "date": self.date,
+            "equipe_domicile": self.equipe_domicile,
+            "equipe_exterieur": self.equipe_exterieur,
+            "score_domicile": self.score_domicile,
+            "score_exterieur": self.score_exterieur,
+            "statut": self.statut.name,
+            "equipe_domicile_id": self.domicile_id,
+            "equipe_exterieur_id": self.exterieur_id
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Match":
+        return cls(
+            str(data.get("rencId", "")), str(data.get("date", "")),
+            intern_name(data.get("equipe_domicile")), intern_name(data.get("equipe_exterieur")),
+            data.get("score_domicile"), data.get("score_exterieur"),
+            MatchStatus[data.get("statut", "SCHEDULED")],
+            str(data.get("equipe_domicile_id") or ""), str(data.get("equipe_exterieur_id") or "")
+        )
+
+    def __repr__(self) -> str:
+        return (f"Match({self.renc_id}, {self.equipe_domicile} {self.score_domicile}-"
+                f"{self.score_exterieur} {self.equipe_exterieur}, {self.statut.name})")
+
+
+class Standing:
+    """Une ligne de classement (format public : position, equipe, points, ..., difference)."""
+
+    __slots__ = ("position", "equipe", "points", "joues", "gagnes", "nuls", "perdus",
+                 "buts_pour", "buts_contre")
+
+    def __init__(self, position: int, equipe: str, points: int, joues: int, gagnes: int,
+                 nuls: int, perdus: int, buts_pour: int, buts_contre: int):
+        self.position = position
+        self.equipe = equipe
+        self.points = points
+        self.joues = joues
+        self.gagnes = gagnes
+        self.nuls = nuls
+        self.perdus = perdus
+        self.buts_pour = buts_pour
+        self.buts_contre = buts_contre
+
+    @property
+    def difference(self) -> int:
+        return self.buts_pour - self.buts_contre
+
+    def to_dict(self) -> Dict:
+        return {
+            "position": self.position,
+            "equipe": self.equipe,
+            "points": self.points,
+            "joues": self.joues,
+            "gagnes": self.gagnes,
+            "nuls": self.nuls,
+            "perdus": self.perdus,
+            "buts_pour": self.buts_pour,
+            "buts_contre": self.buts_contre,
+            "difference": self.difference
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Standing":
+        return cls(
+            int(data.get("position", 0)), intern_name(data.get("equipe")), int(data.get("points", 0)),
+            int(data.get("joues", 0)), int(data.get("gagnes", 0)), int(data.get("nuls", 0)),
+            int(data.get("perdus", 0)), int(data.get("buts_pour", 0)), int(data.get("buts_contre", 0))
+        )
+
+    def __repr__(self) -> str:
+        return f"Standing({self.position}, {self.equipe}, {self.points} pts)"
+
+
+def to_public(value: Any) -> Any:
+    """
+    Convertit les enregistrements (Match, Standing, listes de ceux-ci) au format JSON public.
+    Les autres valeurs sont retournées telles quelles.
+    """
+    if isinstance(value, list):
+        return [item.to_dict() if isinstance(item, (Match, Standing)) else item for item in value]
+    if isinstance(value, (Match, Standing)):
+        return value.to_dict()
+    return value
+
+
+def from_public(value: Any) -> Any:
+    """
+    Inverse de to_public() pour les données relues depuis le disque : une liste de dicts
+    au format public des matchs ou des classements redevient une liste d'enregistrements.
+    """
+    if not isinstance(value, list) or not value or not all(isinstance(item, dict) for item in value):
+        return value
+    keys = value[0].keys()
+    if "rencId" in keys and "statut" in keys:
+        return [Match.from_dict(item) for item in value]
+    if "position" in keys and "gagnes" in keys:
+        return [Standing.from_dict(item) for item in value]
+    return value
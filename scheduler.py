@@ -0,0 +1,132 @@
+"""
+Planificateur de rafraîchissement des données FFH
+Garde chaque championnat en cache avant l'expiration de son TTL
+"""
+
+import asyncio
+import random
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, List, NamedTuple, Optional
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from cache import SWRCache
+from ffh_client import PRIORITY_BACKGROUND, run_in_background
+
+
+# Délai entre deux chargements au démarrage, en secondes (évite de tout demander à la FFH en même temps)
+STARTUP_STAGGER = 0.5
+
+_scheduler: Optional[AsyncIOScheduler] = None
+_warm_up_task: Optional[asyncio.Task] = None
+
+
+class RefreshEntry(NamedTuple):
+    """
+    Entrée du cache maintenue à jour : clé, fonction de chargement, période de
+    rafraîchissement en secondes (à choisir inférieure au soft TTL de la clé) et
+    priorité (0 = la plus importante : préchargée et servie en premier par la FFH).
+    """
+    key: str
+    loader: Callable[[], Awaitable[Any]]
+    interval: float
+    priority: int = 0
+
+
+async def _refresh_entry(cache: SWRCache, key: str, loader: Callable[[], Awaitable[Any]],
+                         priority: int = 0) -> None:
+    """
+    Rafraîchit une entrée du cache sans jamais lever d'exception (job planifié).
+    Les appels vers la FFH passent après ceux des clients en attente (priorité basse),
+    puis par ordre de priorité de l'entrée.
+    """
+    try:
+        await run_in_background(lambda: cache.refresh(key, loader), PRIORITY_BACKGROUND + priority)
+    except Exception as e:
+        print(f"⚠️  Rafraîchissement planifié de '{key}' échoué: {e}")
+
+
+async def _warm_up(cache: SWRCache, entries: List[RefreshEntry]) -> None:
+    """Charge toutes les entrées au démarrage, les plus prioritaires d'abord, en décalant chaque appel."""
+    tasks = []
+    try:
+        for entry in sorted(entries, key=lambda e: e.priority):
+            tasks.append(asyncio.ensure_future(_refresh_entry(cache, entry.key, entry.loader, entry.priority)))
+            await asyncio.sleep(STARTUP_STAGGER)
+        await asyncio.gather(*tasks)
+    except asyncio.CancelledError:
+        # Arrêt de l'application pendant le préchargement
+        for task in tasks:
+            task.cancel()
+        return
+    print(f"✅ Cache préchargé: {len(entries)} entrées")
+
+
+def start_refresh_scheduler(
+    cache: SWRCache,
+    entries: List[RefreshEntry],
+    jitter: float
+) -> AsyncIOScheduler:
+    """
+    Démarre le rafraîchissement périodique des entrées du cache.
+
+    Toutes les entrées sont d'abord chargées une fois, en décalé. Chaque entrée est
+    ensuite rechargée selon sa propre période, avec un décalage initial réparti sur
+    la période et un jitter aléatoire pour que les appels vers la FFH ne tombent pas
+    tous dans la même seconde.
+
+    Args:
+        cache: Le cache à alimenter
+        entries: Entrées à maintenir à jour
+        jitter: Variation aléatoire maximale (en secondes) de chaque exécution
+
+    Returns:
+        AsyncIOScheduler: Le planificateur démarré
+    """
+    global _scheduler, _warm_up_task
+    scheduler = AsyncIOScheduler()
+    now = datetime.now()
+    count = max(len(entries), 1)
+
+    for index, entry in enumerate(entries):
+        offset = entry.interval * (1 + index / count) + random.uniform(0, jitter)
+        scheduler.add_job(
+            _refresh_entry,
+            IntervalTrigger(seconds=entry.interval, start_date=now + timedelta(seconds=offset), jitter=jitter),
+            args=[cache, entry.key, entry.loader, entry.priority],
+            id=f"refresh:{entry.key}",
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True
+        )
+
+    scheduler.start()
+    _scheduler = scheduler
+    _warm_up_task = asyncio.ensure_future(_warm_up(cache, entries))
+    return scheduler
+
+
+def stop_refresh_scheduler() -> None:
+    """Arrête le planificateur (et le préchargement s'il est encore en cours)."""
+    global _scheduler, _warm_up_task
+    if _warm_up_task is not None and not _warm_up_task.done():
+        _warm_up_task.cancel()
+    _warm_up_task = None
+    if _scheduler is not None and _scheduler.running:
+        _scheduler.shutdown(wait=False)
+    _scheduler = None
+
+
+def get_scheduler_jobs() -> list:
+    """Liste des jobs planifiés et de leur prochaine exécution."""
+    if _scheduler is None:
+        return []
+    return [
+        {
+            "id": job.id,
+            "interval": job.trigger.interval.total_seconds(),
+            "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None
+        }
+        for job in _scheduler.get_jobs()
+    ]
@@ -1,245 +1,48 @@
 """
 Scraper pour l'API de Hockey sur Gazon Français
 Récupère les données depuis l'API interne de la FFH
-"""
-
-import requests
-import re
-from typing import List, Dict
-
-
-def _normalize_team_name(team_name: str) -> str:
-    """
-    Normalise le nom d'une équipe en supprimant les numéros de poule.
-    Ex: "CARQUEFOU HC 3" -> "CARQUEFOU HC"
-    Mais garde les numéros qui font partie du nom: "CA MONTROUGE 92" -> "CA MONTROUGE 92"
-    
-    Args:
-        team_name: Le nom de l'équipe à normaliser
-    
-    Returns:
-        str: Le nom normalisé
-    """
-    if not team_name:
-        return team_name
-    
-    # Pattern: " X" où X est un nombre SEUL (1-9) à la fin
-    # Ceci ciblera les numéros de poule (1-9) mais pas des codes comme "92"
-    normalized = re.sub(r'\s+[1-9]\s*$', '', team_name.strip())
-    return normalized
 
+Les erreurs d'accès à l'API (timeout, réseau, HTTP) sont affichées puis relancées :
+le cache conserve alors la dernière valeur connue au lieu d'enregistrer une liste vide.
 
-def _calculate_ranking_from_matches(matches: List[Dict]) -> List[Dict]:
-    """
-    Fonction interne pour calculer le classement à partir d'une liste de matchs.
-    
-    Args:
-        matches: Liste des matchs avec scores
-    
-    Returns:
-        List[Dict]: Liste des équipes triées par classement.
-    """
-    teams_stats = {}
-    
-    for match in matches:
-        # Filtrer les matchs terminés
-        if match.get("statut") != "FINISHED" or match.get("score_domicile") is None:
-            continue
-        
-        equipe1_name = match.get("equipe_domicile", "")
-        equipe2_name = match.get("equipe_exterieur", "")
-        but1 = match.get("score_domicile", 0)
-        but2 = match.get("score_exterieur", 0)
-        
-        if not equipe1_name or not equipe2_name:
-            continue
-        
-        # Initialiser les équipes si nécessaire
-        if equipe1_name not in teams_stats:
-            teams_stats[equipe1_name] = {
-                "joues": 0, "gagnes": 0, "nuls": 0, "perdus": 0,
-                "buts_pour": 0, "buts_contre": 0, "points": 0
-            }
-        if equipe2_name not in teams_stats:
-            teams_stats[equipe2_name] = {
-                "joues": 0, "gagnes": 0, "nuls": 0, "perdus": 0,
-                "buts_pour": 0, "buts_contre": 0, "points": 0
-            }
-        
-        # Mise à jour des statistiques
-        teams_stats[equipe1_name]["joues"] += 1
-        teams_stats[equipe2_name]["joues"] += 1
-        
-        teams_stats[equipe1_name]["buts_pour"] += but1
-        teams_stats[equipe1_name]["buts_contre"] += but2
-        
-        teams_stats[equipe2_name]["buts_pour"] += but2
-        teams_stats[equipe2_name]["buts_contre"] += but1
-        
-        # Calculer les points
-        if but1 > but2:
-            teams_stats[equipe1_name]["gagnes"] += 1
-            teams_stats[equipe1_name]["points"] += 3
-            teams_stats[equipe2_name]["perdus"] += 1
-        elif but2 > but1:
-            teams_stats[equipe2_name]["gagnes"] += 1
-            teams_stats[equipe2_name]["points"] += 3
-            teams_stats[equipe1_name]["perdus"] += 1
-        else:
-            teams_stats[equipe1_name]["nuls"] += 1
-            teams_stats[equipe1_name]["points"] += 1
-            teams_stats[equipe2_name]["nuls"] += 1
-            teams_stats[equipe2_name]["points"] += 1
-    
-    # Créer la liste de classement triée
-    ranking_list = []
-    for position, (team_name, stats) in enumerate(
-        sorted(teams_stats.items(), key=lambda x: (-x[1]["points"], -(x[1]["buts_pour"] - x[1]["buts_contre"]))),
-        1
-    ):
-        ranking_dict = {
-            "position": position,
-            "equipe": team_name,
-            "points": stats["points"],
-            "joues": stats["joues"],
-            "gagnes": stats["gagnes"],
-            "nuls": stats["nuls"],
-            "perdus": stats["perdus"],
-            "buts_pour": stats["buts_pour"],
-            "buts_contre": stats["buts_contre"],
-            "difference": stats["buts_pour"] - stats["buts_contre"]
-        }
-        ranking_list.append(ranking_dict)
-    
-    return ranking_list
-
-
-def _calculate_ranking(manif_id: str) -> List[Dict]:
-    """
-    Fonction interne pour calculer le classement à partir d'un ManifId.
-    
-    Args:
-        manif_id: L'identifiant de la manifestation (championnats)
-    
-    Returns:
-        List[Dict]: Liste des équipes avec leurs informations de classement.
-    """
-    try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": manif_id
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Vérifier la structure de la réponse
-        if data.get("ResponseCode") != "200":
-            print(f"Erreur API: {data.get('ResponseMessage')}")
-            return []
-        
-        rencontres_data = data.get("Response", {})
-        rencontres_array = rencontres_data.get("RencontresArray", {})
-        
-        # Dictionnaire pour cumuler les statistiques par équipe
-        teams_stats = {}
-        
-        # Parcourir toutes les rencontres
-        for match_id, match_data in rencontres_array.items():
-            scores = match_data.get("Scores", {})
-            
-            # Vérifier si le match a un résultat saisi
-            if not scores.get("RencScoresSaisieDate"):
-                continue
-            
-            equipe1_data = match_data.get("Equipe1", {})
-            equipe2_data = match_data.get("Equipe2", {})
-            
-            equipe1_name = equipe1_data.get("EquipeNom", "")
-            equipe2_name = equipe2_data.get("EquipeNom", "")
-            
-            but1 = int(scores.get("RencButsEqp1") or 0)
-            but2 = int(scores.get("RencButsEqp2") or 0)
-            
-            # Initialiser les équipes si nécessaire
-            if equipe1_name not in teams_stats:
-                teams_stats[equipe1_name] = {
-                    "joues": 0, "gagnes": 0, "nuls": 0, "perdus": 0,
-                    "buts_pour": 0, "buts_contre": 0, "points": 0
-                }
-            if equipe2_name not in teams_stats:
-                teams_stats[equipe2_name] = {
-                    "joues": 0, "gagnes": 0, "nuls": 0, "perdus": 0,
-                    "buts_pour": 0, "buts_contre": 0, "points": 0
-                }
-            
-            # Mise à jour des statistiques
-            teams_stats[equipe1_name]["joues"] += 1
-            teams_stats[equipe2_name]["joues"] += 1
-            
-            teams_stats[equipe1_name]["buts_pour"] += but1
-            teams_stats[equipe1_name]["buts_contre"] += but2
-            
-            teams_stats[equipe2_name]["buts_pour"] += but2
-            teams_stats[equipe2_name]["buts_contre"] += but1
-            
-            if but1 > but2:
-                teams_stats[equipe1_name]["gagnes"] += 1
-                teams_stats[equipe1_name]["points"] += 3
-                teams_stats[equipe2_name]["perdus"] += 1
-            elif but2 > but1:
-                teams_stats[equipe2_name]["gagnes"] += 1
-                teams_stats[equipe2_name]["points"] += 3
-                teams_stats[equipe1_name]["perdus"] += 1
-            else:
-                teams_stats[equipe1_name]["nuls"] += 1
-                teams_stats[equipe1_name]["points"] += 1
-                teams_stats[equipe2_name]["nuls"] += 1
-                teams_stats[equipe2_name]["points"] += 1
-        
-        # Créer la liste de classement triée
-        ranking_list = []
-        for position, (team_name, stats) in enumerate(
-            sorted(teams_stats.items(), key=lambda x: (-x[1]["points"], -(x[1]["buts_pour"] - x[1]["buts_contre"]))),
-            1
-        ):
-            ranking_dict = {
-                "position": position,
-                "equipe": team_name,
-                "points": stats["points"],
-                "joues": stats["joues"],
-                "gagnes": stats["gagnes"],
-                "nuls": stats["nuls"],
-                "perdus": stats["perdus"],
-                "buts_pour": stats["buts_pour"],
-                "buts_contre": stats["buts_contre"],
-                "difference": stats["buts_pour"] - stats["buts_contre"]
-            }
-            ranking_list.append(ranking_dict)
-        
-        return ranking_list
-        
-    except requests.exceptions.Timeout:
-        print(f"Erreur: Timeout lors de la récupération du classement (ManifId: {manif_id})")
-        return []
-    except requests.exceptions.ConnectionError:
-        print("Erreur: Impossible de se connecter à l'API de la FFH")
-        return []
-    except requests.exceptions.HTTPError as e:
-        print(f"Erreur HTTP: {e.response.status_code}")
-        return []
-    except (ValueError, KeyError) as e:
-        print(f"Erreur lors du parsing JSON: {e}")
-        return []
-    except Exception as e:
-        print(f"Erreur inattendue: {e}")
-        return []
+Les matchs et classements sont retournés sous forme d'enregistrements compacts
+(models.Match, models.Standing) ; models.to_public() les convertit au format JSON.
 
+Les compétitions (identifiants FFH, filtre d'équipe, source du classement) sont
+décrites dans competitions.py : get_matchs() et get_classement() les chargent.
+"""
 
-def get_classement_poule(poule_id: str) -> List[Dict]:
+import httpx
+from typing import Dict, List, Optional
+
+from cache import derive
+from competitions import Competition, RANKING_FFH
+from ffh_client import fetch_json, fetch_payload, last_payload, SAISON_ANNEE
+from models import Match, MatchStatus, Standing, intern_name
+from standings import Fixture, HeadToHead, standings_table
+from teams import team_index
+
+
+def _standings_from_classement(data: Dict) -> List[Standing]:
+    """Transforme une réponse ClassementEquipes en lignes de classement."""
+    classement_lignes = data.get("Response", {}).get("Classement", {}).get("ClassmentLignes", [])
+    return [
+        Standing(
+            int(ligne.get("ClassmPos", 0)),
+            intern_name(ligne.get("Equipe", {}).get("EquipeNom", "")),
+            int(ligne.get("ClassmPts", 0)),
+            int(ligne.get("ClassmMatchJ", 0)),
+            int(ligne.get("ClassmMatchG", 0)),
+            int(ligne.get("ClassmMatchN", 0)),
+            int(ligne.get("ClassmMatchP", 0)),
+            int(ligne.get("ClassmButP", 0)),
+            int(ligne.get("ClassmButC", 0))
+        )
+        for ligne in classement_lignes
+    ]
+
+
+async def get_classement_poule(poule_id: str) -> List[Standing]:
     """
     Récupère le classement d'une poule spécifique.
     
@@ -247,55 +50,32 @@ def get_classement_poule(poule_id: str) -> List[Dict]:
         poule_id: L'identifiant de la poule (ex: "11510" pour Carquefou HC poule A)
     
     Returns:
-        List[Dict]: Liste des équipes avec leurs statistiques de classement dans la poule.
+        List[Standing]: Liste des équipes avec leurs statistiques de classement dans la poule.
     """
     try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ClassementEquipes"
+        endpoint = "ClassementEquipes"
         params = {
-            "SaisonAnnee": "2026",
+            "SaisonAnnee": SAISON_ANNEE,
             "PouleId": poule_id
         }
         
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        data = await fetch_json(endpoint, params)
         
         if data.get("ResponseCode") != "200":
             print(f"Erreur API: {data.get('ResponseMessage')}")
             return []
         
-        classement_data = data.get("Response", {}).get("Classement", {})
-        classement_lignes = classement_data.get("ClassmentLignes", [])
-        
-        ranking_list = []
-        for ligne in classement_lignes:
-            equipe = ligne.get("Equipe", {})
-            ranking_dict = {
-                "position": int(ligne.get("ClassmPos", 0)),
-                "equipe": equipe.get("EquipeNom", ""),
-                "points": int(ligne.get("ClassmPts", 0)),
-                "joues": int(ligne.get("ClassmMatchJ", 0)),
-                "gagnes": int(ligne.get("ClassmMatchG", 0)),
-                "nuls": int(ligne.get("ClassmMatchN", 0)),
-                "perdus": int(ligne.get("ClassmMatchP", 0)),
-                "buts_pour": int(ligne.get("ClassmButP", 0)),
-                "buts_contre": int(ligne.get("ClassmButC", 0)),
-                "difference": int(ligne.get("ClassmDiff", 0))
-            }
-            ranking_list.append(ranking_dict)
+        return derive(("classement_poule", poule_id), data, _standings_from_classement)
         
-        return ranking_list
-        
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print(f"Erreur: Timeout lors de la récupération du classement de la poule {poule_id}")
-        return []
-    except requests.exceptions.ConnectionError:
+        raise
+    except httpx.TransportError:
         print("Erreur: Impossible de se connecter à l'API de la FFH")
-        return []
-    except requests.exceptions.HTTPError as e:
+        raise
+    except httpx.HTTPStatusError as e:
         print(f"Erreur HTTP: {e.response.status_code}")
-        return []
+        raise
     except (ValueError, KeyError) as e:
         print(f"Erreur lors du parsing JSON: {e}")
         return []
@@ -304,7 +84,7 @@ def get_classement_poule(poule_id: str) -> List[Dict]:
         return []
 
 
-def get_matchs_poule(poule_id: str) -> List[Dict]:
+async def get_matchs_poule(poule_id: str) -> List[Match]:
     """
     Récupère les matchs d'une poule spécifique.
     
@@ -312,73 +92,26 @@ def get_matchs_poule(poule_id: str) -> List[Dict]:
         poule_id: L'identifiant de la poule (ex: "11510" pour Carquefou HC poule A)
     
     Returns:
-        List[Dict]: Liste des matchs avec leurs informations.
+        List[Match]: Liste des matchs avec leurs informations.
     """
     try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "PouleId": poule_id
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        payload = await fetch_payload(poule_id=poule_id)
         
-        if data.get("ResponseCode") != "200":
-            print(f"Erreur API: {data.get('ResponseMessage')}")
+        if payload.response_code != "200":
+            print(f"Erreur API: {payload.data.get('ResponseMessage')}")
             return []
         
-        rencontres_data = data.get("Response", {})
-        rencontres_array = rencontres_data.get("RencontresArray", {})
-        
-        matches_list = []
-        
-        for match_id, match_data in rencontres_array.items():
-            renc_id = match_data.get("RencId", "")
-            renc_date = match_data.get("RencDateDerog", "")
-            
-            equipe1_data = match_data.get("Equipe1", {})
-            equipe2_data = match_data.get("Equipe2", {})
-            
-            equipe1_name = equipe1_data.get("EquipeNom", "")
-            equipe2_name = equipe2_data.get("EquipeNom", "")
-            
-            scores = match_data.get("Scores", {})
-            but1 = int(scores.get("RencButsEqp1") or 0) if scores.get("RencButsEqp1") else None
-            but2 = int(scores.get("RencButsEqp2") or 0) if scores.get("RencButsEqp2") else None
-            
-            # Déterminer le statut du match
-            if scores.get("RencScoresSaisieDate"):
-                statut = "FINISHED"
-            elif match_data.get("RencNonJoue") == "O":
-                statut = "NOT_PLAYED"
-            else:
-                statut = "SCHEDULED"
-            
-            match_dict = {
-                "rencId": str(renc_id),
-                "date": str(renc_date),
-                "equipe_domicile": str(equipe1_name),
-                "equipe_exterieur": str(equipe2_name),
-                "score_domicile": but1 if but1 is not None else None,
-                "score_exterieur": but2 if but2 is not None else None,
-                "statut": statut
-            }
-            matches_list.append(match_dict)
+        return payload.matches
         
-        return matches_list
-        
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print(f"Erreur: Timeout lors de la récupération des matchs de la poule {poule_id}")
-        return []
-    except requests.exceptions.ConnectionError:
+        raise
+    except httpx.TransportError:
         print("Erreur: Impossible de se connecter à l'API de la FFH")
-        return []
-    except requests.exceptions.HTTPError as e:
+        raise
+    except httpx.HTTPStatusError as e:
         print(f"Erreur HTTP: {e.response.status_code}")
-        return []
+        raise
     except (ValueError, KeyError) as e:
         print(f"Erreur lors du parsing JSON: {e}")
         return []
@@ -387,130 +120,36 @@ def get_matchs_poule(poule_id: str) -> List[Dict]:
         return []
 
 
-# Raccourcis pour Carquefou HC 1 Seniors Hommes (PouleId: 11510)
-def get_classement_carquefou_1sh() -> List[Dict]:
-    """Récupère le classement de Carquefou HC 1 Seniors Hommes."""
-    return get_classement_poule("11510")
-
-
-def get_matchs_carquefou_1sh() -> List[Dict]:
-    """Récupère les matchs de Carquefou HC 1 Seniors Hommes."""
-    matches = get_matchs_poule("11510")
-    # Filtrer pour ne conserver que les matchs impliquant Carquefou HC 1
-    filtered_matches = []
-    for match in matches:
-        domicile = match.get("equipe_domicile", "").upper()
-        exterieur = match.get("equipe_exterieur", "").upper()
-        # Chercher "CARQUEFOU HC 1" dans le nom de l'équipe (avec ou sans suffixe)
-        if "CARQUEFOU HC 1" in domicile or "CARQUEFOU HC 1" in exterieur:
-            # Normaliser les noms (suppression des numéros de poule si présents)
-            match["equipe_domicile"] = _normalize_team_name(match["equipe_domicile"])
-            match["equipe_exterieur"] = _normalize_team_name(match["equipe_exterieur"])
-            filtered_matches.append(match)
-    return filtered_matches
-
-
-# Raccourcis pour Carquefou HC 2 Seniors Hommes (PouleId: 11511)
-def get_classement_carquefou_2sh() -> List[Dict]:
-    """Récupère le classement de Carquefou HC 2 Seniors Hommes."""
-    return get_classement_poule("11511")
-
-
-def get_matchs_carquefou_2sh() -> List[Dict]:
-    """Récupère les matchs de Carquefou HC 2 Seniors Hommes."""
-    matches = get_matchs_poule("11511")
-    # Filtrer pour ne conserver que les matchs impliquant Carquefou HC 2
-    filtered_matches = []
-    for match in matches:
-        domicile = match.get("equipe_domicile", "").upper()
-        exterieur = match.get("equipe_exterieur", "").upper()
-        # Chercher "CARQUEFOU HC 2" dans le nom de l'équipe (avec ou sans suffixe)
-        if "CARQUEFOU HC 2" in domicile or "CARQUEFOU HC 2" in exterieur:
-            # Normaliser les noms (suppression des numéros de poule si présents)
-            match["equipe_domicile"] = _normalize_team_name(match["equipe_domicile"])
-            match["equipe_exterieur"] = _normalize_team_name(match["equipe_exterieur"])
-            filtered_matches.append(match)
-    return filtered_matches
-
-
-def _get_matchs_by_team_name(manif_id: str, team_name_filter: str) -> List[Dict]:
+async def _get_matches_by_manif(manif_id: str) -> List[Match]:
     """
-    Fonction interne pour récupérer les matchs d'une équipe spécifique au sein d'une manifestation.
+    Fonction interne pour récupérer les matchs à partir d'un ManifId.
     
     Args:
-        manif_id: L'identifiant de la manifestation
-        team_name_filter: Le nom ou partie du nom de l'équipe à filtrer
+        manif_id: L'identifiant de la manifestation (championnats)
     
     Returns:
-        List[Dict]: Liste des matchs de l'équipe avec leurs informations.
+        List[Match]: Liste des matchs avec leurs informations.
     """
     try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": manif_id
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
+        payload = await fetch_payload(manif_id=manif_id)
         
-        data = response.json()
-        
-        if data.get("ResponseCode") != "200":
-            print(f"Erreur API: {data.get('ResponseMessage')}")
+        # Vérifier la structure de la réponse
+        if payload.response_code != "200":
+            print(f"Erreur API: {payload.data.get('ResponseMessage')}")
             return []
         
-        rencontres_data = data.get("Response", {})
-        rencontres_array = rencontres_data.get("RencontresArray", {})
-        
-        matches_list = []
-        
-        # Parcourir toutes les rencontres et filtrer par nom d'équipe
-        for match_id, match_data in rencontres_array.items():
-            equipe1_name = match_data.get("Equipe1", {}).get("EquipeNom", "")
-            equipe2_name = match_data.get("Equipe2", {}).get("EquipeNom", "")
-            
-            # Filtrer si l'équipe recherchée joue
-            if team_name_filter.upper() not in equipe1_name.upper() and team_name_filter.upper() not in equipe2_name.upper():
-                continue
-            
-            renc_id = match_data.get("RencId", "")
-            renc_date = match_data.get("RencDateDerog", "")
-            
-            scores = match_data.get("Scores", {})
-            but1 = int(scores.get("RencButsEqp1") or 0) if scores.get("RencButsEqp1") else None
-            but2 = int(scores.get("RencButsEqp2") or 0) if scores.get("RencButsEqp2") else None
-            
-            # Déterminer le statut du match
-            if scores.get("RencScoresSaisieDate"):
-                statut = "FINISHED"
-            elif match_data.get("RencNonJoue") == "O":
-                statut = "NOT_PLAYED"
-            else:
-                statut = "SCHEDULED"
-            
-            match_dict = {
-                "rencId": str(renc_id),
-                "date": str(renc_date),
-                "equipe_domicile": str(equipe1_name),
-                "equipe_exterieur": str(equipe2_name),
-                "score_domicile": but1 if but1 is not None else None,
-                "score_exterieur": but2 if but2 is not None else None,
-                "statut": statut
-            }
-            matches_list.append(match_dict)
-        
-        return matches_list
+        # Matchs décodés une fois par réponse (mêmes enregistrements tant qu'elle ne change pas)
+        return payload.matches
         
-    except requests.exceptions.Timeout:
-        print(f"Erreur: Timeout lors de la récupération des matchs (ManifId: {manif_id})")
-        return []
-    except requests.exceptions.ConnectionError:
+    except httpx.TimeoutException:
+        print("Erreur: Timeout lors de la récupération des matchs")
+        raise
+    except httpx.TransportError:
         print("Erreur: Impossible de se connecter à l'API de la FFH")
-        return []
-    except requests.exceptions.HTTPError as e:
+        raise
+    except httpx.HTTPStatusError as e:
         print(f"Erreur HTTP: {e.response.status_code}")
-        return []
+        raise
     except (ValueError, KeyError) as e:
         print(f"Erreur lors du parsing JSON: {e}")
         return []
@@ -519,282 +158,137 @@ def _get_matchs_by_team_name(manif_id: str, team_name_filter: str) -> List[Dict]
         return []
 
 
-# Raccourcis pour Carquefou HC Seniors Dames Elite
-def get_matchs_carquefou_sd() -> List[Dict]:
-    """Récupère les matchs de Carquefou HC Seniors Dames (Elite)."""
-    matches = _get_matchs_by_team_name("4318", "CARQUEFOU")
-    # Normaliser le nom de l'équipe Carquefou (enlever le numéro de poule)
-    for match in matches:
-        match["equipe_domicile"] = _normalize_team_name(match["equipe_domicile"])
-        match["equipe_exterieur"] = _normalize_team_name(match["equipe_exterieur"])
-
-        # Afficher 'Carquefou HC' de façon cohérente pour ce championnat
-        if "CARQUEFOU" in str(match.get("equipe_domicile", "")).upper():
-            match["equipe_domicile"] = "Carquefou HC"
-        if "CARQUEFOU" in str(match.get("equipe_exterieur", "")).upper():
-            match["equipe_exterieur"] = "Carquefou HC"
-    return matches
-
-
 # ============================================
-# Elite Femmes Salle (NEW)
-# ManifId: 4403 (Saison 2026)
+# Compétitions du registre (competitions.py)
 # ============================================
 
-def get_classement_salle_elite_femmes() -> List[Dict]:
+def _team_view(matches: List[Match], competition: Competition) -> List[Match]:
     """
-    Récupère le classement calculé des Elite Femmes en Salle.
-    Calcul automatique: Victoire=3pts, Nul=1pt, Défaite=0pts
-    Critères de départage: Différence de buts
+    Matchs d'une compétition tels qu'affichés : filtrés sur l'équipe suivie et avec
+    les noms d'équipes normalisés ou harmonisés. Les équipes sont reconnues par l'index
+    (teams.py) : le filtre est une recherche dans un ensemble et les noms affichés sont
+    calculés une fois par équipe. Les matchs sont copiés : la liste d'origine est
+    partagée et ne doit pas être modifiée.
+    
+    Args:
+        matches: Liste des matchs de la manifestation ou de la poule
+        competition: La compétition (team_filter, normalize_names, rename)
+    
+    Returns:
+        List[Match]: Les matchs de la compétition
     """
-    try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": "4403"  # Elite Femmes Salle
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        if data.get("ResponseCode") != "200":
-            print(f"Erreur API: {data.get('ResponseMessage')}")
-            return []
-        
-        rencontres_array = data.get("Response", {}).get("RencontresArray", {})
-        
-        # Dictionnaire pour stocker les stats de chaque équipe
-        standings = {}
-        
-        for match_data in rencontres_array.values():
-            scores = match_data.get("Scores", {})
-            
-            # Vérifier si le match a un résultat saisi
-            if not scores.get("RencScoresSaisieDate"):
-                continue
-            
-            equipe1_nom = match_data.get("Equipe1", {}).get("EquipeNom", "")
-            equipe2_nom = match_data.get("Equipe2", {}).get("EquipeNom", "")
-            but1 = int(scores.get("RencButsEqp1") or 0)
-            but2 = int(scores.get("RencButsEqp2") or 0)
-            
-            # Initialiser les équipes si nécessaire
-            if equipe1_nom not in standings:
-                standings[equipe1_nom] = {
-                    "joues": 0, "gagnes": 0, "nuls": 0, "perdus": 0,
-                    "buts_pour": 0, "buts_contre": 0, "points": 0
-                }
-            if equipe2_nom not in standings:
-                standings[equipe2_nom] = {
-                    "joues": 0, "gagnes": 0, "nuls": 0, "perdus": 0,
-                    "buts_pour": 0, "buts_contre": 0, "points": 0
-                }
-            
-            # Mise à jour des statistiques
-            standings[equipe1_nom]["joues"] += 1
-            standings[equipe2_nom]["joues"] += 1
-            
-            standings[equipe1_nom]["buts_pour"] += but1
-            standings[equipe1_nom]["buts_contre"] += but2
-            
-            standings[equipe2_nom]["buts_pour"] += but2
-            standings[equipe2_nom]["buts_contre"] += but1
-            
-            if but1 > but2:
-                standings[equipe1_nom]["gagnes"] += 1
-                standings[equipe1_nom]["points"] += 3
-                standings[equipe2_nom]["perdus"] += 1
-            elif but2 > but1:
-                standings[equipe2_nom]["gagnes"] += 1
-                standings[equipe2_nom]["points"] += 3
-                standings[equipe1_nom]["perdus"] += 1
-            else:
-                standings[equipe1_nom]["nuls"] += 1
-                standings[equipe1_nom]["points"] += 1
-                standings[equipe2_nom]["nuls"] += 1
-                standings[equipe2_nom]["points"] += 1
-        
-        # Créer la liste de classement triée
-        classement = []
-        for position, (team_name, stats) in enumerate(
-            sorted(standings.items(), key=lambda x: (-x[1]["points"], -(x[1]["buts_pour"] - x[1]["buts_contre"]), -x[1]["buts_pour"])),
-            1
-        ):
-            classement.append({
-                "position": position,
-                "equipe": team_name,
-                "points": stats["points"],
-                "joues": stats["joues"],
-                "gagnes": stats["gagnes"],
-                "nuls": stats["nuls"],
-                "perdus": stats["perdus"],
-                "buts_pour": stats["buts_pour"],
-                "buts_contre": stats["buts_contre"],
-                "difference": stats["buts_pour"] - stats["buts_contre"]
-            })
-        
-        return classement
-        
-    except requests.exceptions.Timeout:
-        print(f"Erreur: Timeout lors de la récupération du classement Elite Femmes Salle")
-        return []
-    except requests.exceptions.ConnectionError:
-        print("Erreur: Impossible de se connecter à l'API de la FFH")
-        return []
-    except requests.exceptions.HTTPError as e:
-        print(f"Erreur HTTP: {e.response.status_code}")
-        return []
-    except (ValueError, KeyError) as e:
-        print(f"Erreur lors du parsing JSON: {e}")
-        return []
-    except Exception as e:
-        print(f"Erreur inattendue: {e}")
-        return []
-
-
-def get_matchs_salle_elite_femmes() -> List[Dict]:
-    """Récupère les matchs réels de l'Elite Femmes en Salle depuis la FFH."""
-    matches = _get_matches_by_manif("4403")
-    # Standardiser le nom Carquefou si présent dans les résultats
+    # Équipes dont le nom contient le filtre (avec ou sans suffixe), tenu à jour par identify()
+    members = team_index.members(competition.team_filter) if competition.team_filter else None
+    identify = team_index.identify
+    normalize, rename = competition.normalize_names, competition.rename
+    selected = []
     for match in matches:
-        if "CARQUEFOU" in str(match.get("equipe_domicile", "")).upper():
-            match["equipe_domicile"] = "Carquefou HC"
-        if "CARQUEFOU" in str(match.get("equipe_exterieur", "")).upper():
-            match["equipe_exterieur"] = "Carquefou HC"
-    return matches
-
-
-# ============================================
-# Elite Hommes Gazon (NEW)
-# ManifId: 4317 (Saison 2026)
-# ============================================
-
-def get_ranking_elite_hommes_gazon() -> List[Dict]:
-    """Récupère le classement de Elite Hommes Gazon en calculant à partir des matchs."""
-    # Récupérer les matchs et calculer le classement
-    matches = get_matches_elite_hommes_gazon()
-    return _calculate_ranking_from_matches(matches)
-
-
-def get_matches_elite_hommes_gazon() -> List[Dict]:
-    """Récupère les matchs de Elite Hommes Gazon."""
-    return _get_matches_by_manif("4317")
-
+        domicile = identify(match.domicile_id, match.equipe_domicile)
+        exterieur = identify(match.exterieur_id, match.equipe_exterieur)
+        if members is not None and domicile.key not in members and exterieur.key not in members:
+            continue
+        selected.append(match.with_teams(
+            domicile.display_name(normalize, rename), exterieur.display_name(normalize, rename)
+        ))
+    return selected
 
-# ============================================
-# Elite Femmes Gazon (NEW)
-# ManifId: 4318 (Saison 2026)
-# ============================================
 
-def get_ranking_elite_femmes_gazon() -> List[Dict]:
-    """Récupère le classement de Elite Femmes Gazon en calculant à partir des matchs."""
-    # Récupérer les matchs et calculer le classement
-    matches = get_matches_elite_femmes_gazon()
-    return _calculate_ranking_from_matches(matches)
+async def get_matchs(competition: Competition) -> List[Match]:
+    """
+    Récupère les matchs d'une compétition du registre.
+    
+    Args:
+        competition: La compétition (ex: get_competition("elite-hommes-gazon"))
+    
+    Returns:
+        List[Match]: Liste des matchs avec leurs informations.
+    """
+    if not competition.available:
+        return []
+    if competition.poule_id:
+        matches = await get_matchs_poule(competition.poule_id)
+    else:
+        matches = await _get_matches_by_manif(competition.manif_id)
+    
+    if not (competition.team_filter or competition.normalize_names or competition.rename):
+        return matches
+    return derive(("matchs", competition.id), matches, lambda m: _team_view(m, competition))
 
 
-def get_matches_elite_femmes_gazon() -> List[Dict]:
-    """Récupère les matchs de Elite Femmes Gazon."""
-    return _get_matches_by_manif("4318")
+def _fixtures_from_matches(matches: List[Match]) -> List[Fixture]:
+    """
+    Rencontres d'une liste de matchs pour une table de classement : seuls les matchs
+    terminés (résultat saisi) ont des buts, un score absent comptant pour 0.
+    """
+    fixtures = []
+    for index, match in enumerate(matches):
+        renc_id = match.renc_id or f"#{index}"
+        if match.statut == MatchStatus.FINISHED:
+            fixtures.append((renc_id, match.equipe_domicile, match.equipe_exterieur,
+                             match.score_domicile or 0, match.score_exterieur or 0))
+        else:
+            fixtures.append((renc_id, match.equipe_domicile, match.equipe_exterieur, None, None))
+    return fixtures
 
 
-# ============================================
-# Nationale 2 Hommes Salle - Zone 3 (NEW)
-# ManifId: 4430 (Saison 2026)
-# ============================================
+def _ranking_from_matches(competition: Competition, matches: List[Match]) -> List[Standing]:
+    """
+    Classement calculé d'une compétition (Victoire=3pts, Nul=1pt, Défaite=0pts),
+    départagé selon competition.tiebreakers.
 
-def get_ranking_n2_salle_zone3() -> List[Dict]:
-    """Récupère le classement de Nationale 2 Hommes Salle Zone 3."""
-    return _calculate_ranking("4430")
+    La table de la compétition (standings.py) n'applique que les résultats nouveaux,
+    corrigés ou retirés depuis la dernière réponse de la FFH ; une liste de matchs
+    inchangée n'est pas comparée à nouveau. Les résultats saisis en direct restent
+    pris en compte jusqu'à la publication du résultat officiel.
+    """
+    table = standings_table(competition.id, competition.tiebreakers)
+    if table.source is not matches:
+        table.sync(_fixtures_from_matches(matches))
+        table.source = matches
+    return table.rows()
 
 
-def get_matches_n2_salle_zone3() -> List[Dict]:
-    """Récupère les matchs de Nationale 2 Hommes Salle Zone 3."""
-    return _get_matches_by_manif("4430")
+async def get_classement(competition: Competition) -> List[Standing]:
+    """
+    Récupère le classement d'une compétition du registre, selon sa source :
+    - RANKING_FFH : classement publié par la FFH pour la poule
+    - RANKING_MATCHS / RANKING_RENCONTRES / RANKING_SALLE : calculé à partir des matchs
+      de la manifestation (Victoire=3pts, Nul=1pt, Défaite=0pts), départagé selon les
+      critères de la compétition (par défaut la différence de buts, puis en salle les
+      buts marqués)
+    
+    Args:
+        competition: La compétition
+    
+    Returns:
+        List[Standing]: Liste des équipes triées par classement (vide sans classement).
+    """
+    if not competition.available or competition.ranking is None:
+        return []
+    if competition.ranking == RANKING_FFH:
+        return await get_classement_poule(competition.poule_id)
+    matches = await _get_matches_by_manif(competition.manif_id)
+    return _ranking_from_matches(competition, matches)
 
 
-def _get_matches_by_manif(manif_id: str) -> List[Dict]:
+def get_head_to_head(competition: Competition) -> Optional[HeadToHead]:
     """
-    Fonction interne pour récupérer les matchs à partir d'un ManifId.
+    Confrontations directes d'une compétition à classement calculé : bilan de chaque
+    paire d'équipes, lu dans la table du classement (résultats saisis en direct compris),
+    sans appel à la FFH. Le classement doit avoir été lu (cache dynamique) auparavant ;
+    une table encore vide (instantané restauré) est remplie avec la dernière réponse connue.
     
     Args:
-        manif_id: L'identifiant de la manifestation (championnats)
+        competition: La compétition
     
     Returns:
-        List[Dict]: Liste des matchs avec leurs informations.
+        HeadToHead, ou None si le classement de la compétition n'est pas calculé (FFH).
     """
-    try:
-        url = "https://championnats.ffhockey.org/rest2/Championnats/ListerRencontres"
-        params = {
-            "SaisonAnnee": "2026",
-            "ManifId": manif_id
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        # Vérifier la structure de la réponse
-        if data.get("ResponseCode") != "200":
-            print(f"Erreur API: {data.get('ResponseMessage')}")
-            return []
-        
-        rencontres_data = data.get("Response", {})
-        rencontres_array = rencontres_data.get("RencontresArray", {})
-        
-        matches_list = []
-        
-        # Parcourir toutes les rencontres
-        for match_id, match_data in rencontres_array.items():
-            renc_id = match_data.get("RencId", "")
-            renc_date = match_data.get("RencDateDerog", "")
-            
-            equipe1_data = match_data.get("Equipe1", {})
-            equipe2_data = match_data.get("Equipe2", {})
-            
-            equipe1_name = equipe1_data.get("EquipeNom", "")
-            equipe2_name = equipe2_data.get("EquipeNom", "")
-            
-            scores = match_data.get("Scores", {})
-            but1 = int(scores.get("RencButsEqp1") or 0) if scores.get("RencButsEqp1") else None
-            but2 = int(scores.get("RencButsEqp2") or 0) if scores.get("RencButsEqp2") else None
-            
-            # Déterminer le statut du match
-            if scores.get("RencScoresSaisieDate"):
-                statut = "FINISHED"
-            elif match_data.get("RencNonJoue") == "O":
-                statut = "NOT_PLAYED"
-            else:
-                statut = "SCHEDULED"
-            
-            match_dict = {
-                "rencId": str(renc_id),
-                "date": str(renc_date),
-                "equipe_domicile": str(equipe1_name),
-                "equipe_exterieur": str(equipe2_name),
-                "score_domicile": but1 if but1 is not None else None,
-                "score_exterieur": but2 if but2 is not None else None,
-                "statut": statut
-            }
-            matches_list.append(match_dict)
-        
-        return matches_list
-        
-    except requests.exceptions.Timeout:
-        print("Erreur: Timeout lors de la récupération des matchs")
-        return []
-    except requests.exceptions.ConnectionError:
-        print("Erreur: Impossible de se connecter à l'API de la FFH")
-        return []
-    except requests.exceptions.HTTPError as e:
-        print(f"Erreur HTTP: {e.response.status_code}")
-        return []
-    except (ValueError, KeyError) as e:
-        print(f"Erreur lors du parsing JSON: {e}")
-        return []
-    except Exception as e:
-        print(f"Erreur inattendue: {e}")
-        return []
+    if not competition.available or competition.ranking in (None, RANKING_FFH):
+        return None
+    table = standings_table(competition.id, competition.tiebreakers)
+    if table.source is None:
+        payload = last_payload(manif_id=competition.manif_id)
+        if payload is not None:
+            _ranking_from_matches(competition, payload.matches)
+    return table.head_to_head
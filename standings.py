@@ -0,0 +1,566 @@
+"""
+Classements tenus à jour par différence
+Chaque table garde les compteurs de chaque équipe et les résultats déjà pris en compte :
+un résultat ajouté, corrigé ou retiré ne modifie que les compteurs des deux équipes du
+match, et seules leurs lignes sont replacées dans l'ordre du classement.
+Les résultats saisis en direct (live score) sont appliqués de la même façon, sans
+retélécharger le championnat, jusqu'à ce que la FFH publie le résultat officiel.
+
+C'est le seul calcul de classement de l'API (Victoire=3pts, Nul=1pt, Défaite=0pts) ;
+les critères de départage sont choisis par compétition (TIEBREAK_*).
+
+Les recalculs en masse (table vide à remplir, classements historiques via
+compute_standings) passent par un calcul vectorisé si NumPy est installé
+(voir bench_standings.py pour le seuil).
+"""
+
+import bisect
+import itertools
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from models import Standing
+
+try:
+    import numpy as np
+except ImportError:  # dépendance optionnelle
+    np = None
+
+
+# Points attribués : victoire, match nul, défaite
+POINTS_WIN = 3
+POINTS_DRAW = 1
+POINTS_LOSS = 0
+
+# Critères de départage, appliqués dans l'ordre après les points
+TIEBREAK_GOAL_DIFF = "difference"         # différence de buts
+TIEBREAK_GOALS_FOR = "buts_pour"          # buts marqués
+TIEBREAK_HEAD_TO_HEAD = "confrontations"  # mini-classement des matchs entre équipes à égalité
+TIEBREAKERS = (TIEBREAK_GOAL_DIFF, TIEBREAK_GOALS_FOR, TIEBREAK_HEAD_TO_HEAD)
+
+# Classements gardés par table, par empreinte de l'ensemble des résultats
+MEMO_SIZE = 4
+
+# Nombre de résultats à partir duquel un recalcul en masse est vectorisé (si NumPy est installé)
+VECTORIZE_MIN_RESULTS = int(os.environ.get("STANDINGS_VECTORIZE_MIN", "100"))
+
+# Rencontre : (RencId, équipe domicile, équipe extérieur, buts domicile, buts extérieur),
+# les buts valant None tant que le match n'est pas joué
+Fixture = Tuple[str, str, str, Optional[int], Optional[int]]
+# Résultat pris en compte : (équipe domicile, équipe extérieur, buts domicile, buts extérieur)
+Result = Tuple[str, str, int, int]
+
+
+class _TeamStats:
+    """Compteurs d'une équipe. order : rang d'apparition, départage final des égalités."""
+
+    __slots__ = ("equipe", "order", "points", "joues", "gagnes", "nuls", "perdus",
+                 "buts_pour", "buts_contre")
+
+    def __init__(self, equipe: str, order: int):
+        self.equipe = equipe
+        self.order = order
+        self.points = 0
+        self.joues = 0
+        self.gagnes = 0
+        self.nuls = 0
+        self.perdus = 0
+        self.buts_pour = 0
+        self.buts_contre = 0
+
+
+class HeadToHead:
+    """
+    Confrontations directes d'une compétition : pour chaque paire d'équipes, cumul des
+    matchs entre elles du point de vue de la première (joués, gagnés, nuls, perdus,
+    points, buts pour, buts contre). Tenu à jour par add() comme les compteurs d'équipes.
+    """
+
+    __slots__ = ("_pairs",)
+
+    def __init__(self):
+        # équipe -> adversaire -> [joues, gagnes, nuls, perdus, points, buts_pour, buts_contre]
+        self._pairs: Dict[str, Dict[str, List[int]]] = {}
+
+    @classmethod
+    def from_results(cls, results: Iterable[Result]) -> "HeadToHead":
+        matrix = cls()
+        for result in results:
+            matrix.add(result, 1)
+        return matrix
+
+    def add(self, result: Result, sign: int = 1) -> None:
+        """Ajoute (sign=1) ou retire (sign=-1) un résultat."""
+        home, away, but1, but2 = result
+        for team, opponent, scored, conceded in ((home, away, but1, but2), (away, home, but2, but1)):
+            row = self._pairs.setdefault(team, {})
+            record = row.get(opponent)
+            if record is None:
+                record = row[opponent] = [0, 0, 0, 0, 0, 0, 0]
+            record[0] += sign
+            if scored > conceded:
+                record[1] += sign
+                record[4] += sign * POINTS_WIN
+            elif scored < conceded:
+                record[3] += sign
+                record[4] += sign * POINTS_LOSS
+            else:
+                record[2] += sign
+                record[4] += sign * POINTS_DRAW
+            record[5] += sign * scored
+            record[6] += sign * conceded
+            if record[0] == 0:
+                del row[opponent]
+                if not row:
+                    del self._pairs[team]
+
+    def record(self, team: str, opponent: str) -> Optional[Dict[str, int]]:
+        """Bilan de team contre opponent, ou None s'ils ne se sont pas encore rencontrés."""
+        record = self._pairs.get(team, {}).get(opponent)
+        return _record_dict(team, opponent, record) if record is not None else None
+
+    def records(self, team: Optional[str] = None) -> List[Dict[str, int]]:
+        """Bilans de toutes les paires (ou de team contre chacun de ses adversaires)."""
+        teams = [team] if team is not None else list(self._pairs)
+        return [
+            _record_dict(name, opponent, record)
+            for name in teams
+            for opponent, record in self._pairs.get(name, {}).items()
+        ]
+
+    def mini_league(self, group: List[str]) -> Dict[str, Tuple[int, int, int]]:
+        """Clé de tri du mini-classement (points, différence, buts pour) des matchs entre les équipes du groupe."""
+        keys = {}
+        for team in group:
+            row = self._pairs.get(team, {})
+            points = buts_pour = buts_contre = 0
+            for opponent in group:
+                record = row.get(opponent)
+                if record is not None:
+                    points += record[4]
+                    buts_pour += record[5]
+                    buts_contre += record[6]
+            keys[team] = (-points, buts_contre - buts_pour, -buts_pour)
+        return keys
+
+
+def _record_dict(team: str, opponent: str, record: List[int]) -> Dict:
+    joues, gagnes, nuls, perdus, points, buts_pour, buts_contre = record
+    return {
+        "equipe": team,
+        "adversaire": opponent,
+        "joues": joues,
+        "gagnes": gagnes,
+        "nuls": nuls,
+        "perdus": perdus,
+        "points": points,
+        "buts_pour": buts_pour,
+        "buts_contre": buts_contre,
+        "difference": buts_pour - buts_contre
+    }
+
+
+class StandingsTable:
+    """
+    Classement d'une compétition, mis à jour par différence.
+
+    - sync() : remplace les rencontres par celles publiées par la FFH ; seuls les
+      résultats nouveaux, corrigés ou disparus sont appliqués
+    - set_live() : applique (ou retire) un résultat saisi en direct
+    - head_to_head : confrontations directes (HeadToHead), construites à la première
+      demande pour l'ensemble de résultats courant puis tenues à jour par différence
+    - rows() : le classement (liste de Standing), mémorisé par empreinte de l'ensemble
+      des résultats pris en compte : des résultats identiques (y compris après un aller-retour,
+      ex: score saisi en direct puis annulé) redonnent la même liste, sans recalcul
+
+    Tri : points, puis les critères tiebreakers (TIEBREAK_*) dans l'ordre, puis ordre
+    d'apparition des équipes. Les confrontations directes départagent les équipes encore à
+    égalité à ce stade par un mini-classement (points, différence, buts marqués) limité
+    à leurs matchs entre elles.
+    """
+
+    def __init__(self, tiebreakers: Sequence[str] = (TIEBREAK_GOAL_DIFF,),
+                 vectorize: Optional[bool] = None):
+        self.tiebreakers = tuple(tiebreakers)
+        # Critères par équipe avant / après les confrontations directes (clé de tri : points,
+        # critères avant, critères après, ordre d'apparition)
+        self._before, self._after, self._head_to_head = _split_tiebreakers(self.tiebreakers)
+        # Remplissage d'une table vide : vectorisé (True), boucle (False), selon la taille (None)
+        self.vectorize = vectorize
+        # Objet dont proviennent les dernières rencontres synchronisées (liste de matchs,
+        # réponse FFH) : une source identique n'a pas besoin d'être comparée à nouveau
+        self.source: Any = None
+        self._teams: Dict[str, _TeamStats] = {}
+        # Équipes triées : (clé de tri, équipe), et clé actuelle de chaque équipe
+        self._order: List[Tuple[Tuple, str]] = []
+        self._keys: Dict[str, Tuple] = {}
+        self._seen = itertools.count()
+        # RencId -> (domicile, extérieur) pour toutes les rencontres connues, jouées ou non
+        self._fixtures: Dict[str, Tuple[str, str]] = {}
+        # Résultats publiés par la FFH, saisis en direct, et effectivement pris en compte
+        self._upstream: Dict[str, Result] = {}
+        self._live: Dict[str, Result] = {}
+        self._applied: Dict[str, Result] = {}
+        # Équipes dont les compteurs ont changé depuis le dernier tri / la dernière liste
+        self._dirty: Set[str] = set()
+        self._stale_rows: Set[str] = set()
+        self._head_to_head_matrix: Optional[HeadToHead] = None
+        self._rows: Optional[List[Standing]] = []
+        self._row_cache: Dict[str, Standing] = {}
+        # Empreinte des résultats pris en compte (XOR des hash, tenue à jour par différence)
+        # et derniers classements calculés par empreinte
+        self._fingerprint = 0
+        self._memo: Dict[int, List[Standing]] = {0: self._rows}
+        self.stats = {"syncs": 0, "results_applied": 0, "live_results": 0,
+                      "rankings_computed": 0, "memo_hits": 0}
+
+    def sync(self, fixtures: Iterable[Fixture]) -> int:
+        """
+        Remplace les rencontres connues par celles publiées par la FFH et applique
+        les différences. Un résultat publié remplace le résultat saisi en direct.
+
+        Returns:
+            int: Nombre de résultats ajoutés, corrigés ou retirés
+        """
+        known: Dict[str, Tuple[str, str]] = {}
+        upstream: Dict[str, Result] = {}
+        for renc_id, home, away, but1, but2 in fixtures:
+            known[renc_id] = (home, away)
+            if but1 is not None and but2 is not None and home and away:
+                upstream[renc_id] = (home, away, but1, but2)
+        self._fixtures = known
+        self._upstream = upstream
+        for renc_id in [r for r in self._live if r in upstream or r not in known]:
+            del self._live[renc_id]
+        self.stats["syncs"] += 1
+
+        if not self._applied and upstream and _use_vectorized(self.vectorize, len(upstream)):
+            self._load(upstream)
+            return len(upstream)
+        changed = 0
+        for renc_id in [r for r in self._applied if r not in upstream and r not in self._live]:
+            changed += self._update(renc_id, None)
+        for renc_id, result in upstream.items():
+            if self._applied.get(renc_id) != result:
+                changed += self._update(renc_id, result)
+        return changed
+
+    def set_live(self, renc_id: str, scores: Optional[Tuple[int, int]]) -> bool:
+        """
+        Applique le résultat saisi en direct d'une rencontre connue, ou le retire (scores None).
+        Sans effet si la FFH a déjà publié le résultat de la rencontre.
+
+        Returns:
+            bool: True si le classement a changé
+        """
+        if renc_id in self._upstream or renc_id not in self._fixtures:
+            return False
+        if scores is None:
+            if self._live.pop(renc_id, None) is None:
+                return False
+            return self._update(renc_id, None) > 0
+        home, away = self._fixtures[renc_id]
+        if not home or not away:
+            return False
+        result = (home, away, int(scores[0]), int(scores[1]))
+        self._live[renc_id] = result
+        self.stats["live_results"] += 1
+        return self._update(renc_id, result) > 0
+
+    def knows(self, renc_id: str) -> bool:
+        """La rencontre fait partie de la compétition."""
+        return renc_id in self._fixtures
+
+    @property
+    def head_to_head(self) -> HeadToHead:
+        """Confrontations directes des résultats pris en compte."""
+        if self._head_to_head_matrix is None:
+            self._head_to_head_matrix = HeadToHead.from_results(self._applied.values())
+        return self._head_to_head_matrix
+
+    @property
+    def fingerprint(self) -> int:
+        """Empreinte de l'ensemble des résultats pris en compte."""
+        return self._fingerprint
+
+    def rows(self) -> List[Standing]:
+        """Classement actuel ; la même liste pour un même ensemble de résultats."""
+        if self._rows is not None:
+            return self._rows
+        self._resort()
+        rows = self._memo.get(self._fingerprint)
+        if rows is not None:
+            self.stats["memo_hits"] += 1
+            self._rows = rows
+            return rows
+
+        teams = [team for _, team in self._order]
+        if self._head_to_head:
+            teams = _break_ties_head_to_head(teams, self._keys, 1 + len(self._before),
+                                             self.head_to_head)
+        rows = []
+        cache = self._row_cache
+        for position, team in enumerate(teams, 1):
+            row = cache.get(team)
+            if row is None or row.position != position or team in self._stale_rows:
+                stats = self._teams[team]
+                row = cache[team] = Standing(
+                    position, stats.equipe, stats.points, stats.joues, stats.gagnes,
+                    stats.nuls, stats.perdus, stats.buts_pour, stats.buts_contre
+                )
+            rows.append(row)
+        self._stale_rows.clear()
+        self._rows = rows
+        self._memo[self._fingerprint] = rows
+        if len(self._memo) > MEMO_SIZE:
+            del self._memo[next(iter(self._memo))]
+        self.stats["rankings_computed"] += 1
+        return rows
+
+    def _update(self, renc_id: str, result: Optional[Result]) -> int:
+        """Remplace le résultat pris en compte pour une rencontre (None : le retire)."""
+        old = self._applied.get(renc_id)
+        if old == result:
+            return 0
+        if old is not None:
+            self._apply(old, -1)
+            del self._applied[renc_id]
+            self._fingerprint ^= hash((renc_id, old))
+        if result is not None:
+            self._apply(result, 1)
+            self._applied[renc_id] = result
+            self._fingerprint ^= hash((renc_id, result))
+        self.stats["results_applied"] += 1
+        self._rows = None
+        return 1
+
+    def _load(self, results: Dict[str, Result]) -> None:
+        """Remplit d'un coup une table vide : compteurs calculés par _accumulate()."""
+        names, totals = _accumulate(list(results.values()))
+        columns = totals.tolist()
+        for i, team in enumerate(names):
+            stats = self._teams[team] = _TeamStats(team, next(self._seen))
+            (stats.points, stats.joues, stats.gagnes, stats.nuls, stats.perdus,
+             stats.buts_pour, stats.buts_contre) = (column[i] for column in columns)
+            self._dirty.add(team)
+        self._applied = dict(results)
+        self._head_to_head_matrix = None
+        for renc_id, result in results.items():
+            self._fingerprint ^= hash((renc_id, result))
+        self.stats["results_applied"] += len(results)
+        self._rows = None
+
+    def _apply(self, result: Result, sign: int) -> None:
+        """Ajoute (sign=1) ou retire (sign=-1) un résultat des compteurs des deux équipes."""
+        if self._head_to_head_matrix is not None:
+            self._head_to_head_matrix.add(result, sign)
+        home, away, but1, but2 = result
+        for team, scored, conceded in ((home, but1, but2), (away, but2, but1)):
+            stats = self._teams.get(team)
+            if stats is None:
+                stats = self._teams[team] = _TeamStats(team, next(self._seen))
+            stats.joues += sign
+            stats.buts_pour += sign * scored
+            stats.buts_contre += sign * conceded
+            if scored > conceded:
+                stats.gagnes += sign
+                stats.points += sign * POINTS_WIN
+            elif scored < conceded:
+                stats.perdus += sign
+                stats.points += sign * POINTS_LOSS
+            else:
+                stats.nuls += sign
+                stats.points += sign * POINTS_DRAW
+            self._dirty.add(team)
+
+    def _sort_key(self, stats: _TeamStats) -> Tuple:
+        key = [-stats.points]
+        for rule in self._before + self._after:
+            if rule == TIEBREAK_GOAL_DIFF:
+                key.append(stats.buts_contre - stats.buts_pour)
+            else:
+                key.append(-stats.buts_pour)
+        key.append(stats.order)
+        return tuple(key)
+
+    def _resort(self) -> None:
+        """Replace dans l'ordre du classement les seules équipes dont les compteurs ont changé."""
+        for team in self._dirty:
+            key = self._keys.pop(team, None)
+            if key is not None:
+                del self._order[bisect.bisect_left(self._order, (key, team))]
+            stats = self._teams[team]
+            if stats.joues == 0:
+                # Plus aucun match pris en compte : l'équipe sort du classement
+                del self._teams[team]
+                self._row_cache.pop(team, None)
+                continue
+            key = self._keys[team] = self._sort_key(stats)
+            bisect.insort(self._order, (key, team))
+            self._stale_rows.add(team)
+        self._dirty.clear()
+
+
+def _split_tiebreakers(tiebreakers: Tuple[str, ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...], bool]:
+    """
+    Critères par équipe avant et après les confrontations directes, et présence de celles-ci.
+
+    Raises:
+        ValueError: Si un critère est inconnu
+    """
+    for rule in tiebreakers:
+        if rule not in TIEBREAKERS:
+            raise ValueError(f"Critère de départage inconnu: {rule}")
+    if TIEBREAK_HEAD_TO_HEAD not in tiebreakers:
+        return tiebreakers, (), False
+    split = tiebreakers.index(TIEBREAK_HEAD_TO_HEAD)
+    after = tuple(rule for rule in tiebreakers[split + 1:] if rule != TIEBREAK_HEAD_TO_HEAD)
+    return tiebreakers[:split], after, True
+
+
+def _break_ties_head_to_head(teams: List[str], keys: Dict[str, Tuple], width: int,
+                             head_to_head: HeadToHead) -> List[str]:
+    """
+    Départage par les confrontations directes les groupes d'équipes (consécutives dans
+    l'ordre du classement) dont les width premiers éléments de la clé de tri sont égaux
+    (points et critères précédents) ; le reste de la clé départage ensuite.
+    """
+    ordered: List[str] = []
+    start = 0
+    while start < len(teams):
+        tied = keys[teams[start]][:width]
+        end = start + 1
+        while end < len(teams) and keys[teams[end]][:width] == tied:
+            end += 1
+        group = teams[start:end]
+        if len(group) > 1:
+            mini = head_to_head.mini_league(group)
+            group.sort(key=lambda team: (mini[team], keys[team][width:]))
+        ordered.extend(group)
+        start = end
+    return ordered
+
+
+def _use_vectorized(vectorize: Optional[bool], count: int) -> bool:
+    if vectorize is None:
+        return np is not None and count >= VECTORIZE_MIN_RESULTS
+    if vectorize and np is None:
+        raise RuntimeError("Calcul vectorisé indisponible: NumPy n'est pas installé")
+    return vectorize
+
+
+def _accumulate(results: List[Result]):
+    """
+    Compteurs de chaque équipe, calculés en bloc avec NumPy : indices d'équipes domicile
+    et extérieur, tableaux de buts, puis np.add.at pour cumuler.
+
+    Returns:
+        (équipes dans l'ordre d'apparition, tableau (7, équipes) : points, joués, gagnés,
+        nuls, perdus, buts pour, buts contre)
+    """
+    index: Dict[str, int] = {}
+    ids = [index.setdefault(team, len(index)) for result in results for team in (result[0], result[1])]
+    teams = np.array(ids, dtype=np.intp).reshape(-1, 2)
+    goals = np.array([(result[2], result[3]) for result in results], dtype=np.int64).reshape(-1, 2)
+    home, away = teams[:, 0], teams[:, 1]
+    but1, but2 = goals[:, 0], goals[:, 1]
+    win = (but1 > but2).astype(np.int64)
+    draw = (but1 == but2).astype(np.int64)
+    loss = (but1 < but2).astype(np.int64)
+
+    totals = np.zeros((7, len(index)), dtype=np.int64)
+    for row, home_values, away_values in ((1, 1, 1), (2, win, loss), (3, draw, draw),
+                                          (4, loss, win), (5, but1, but2), (6, but2, but1)):
+        np.add.at(totals[row], home, home_values)
+        np.add.at(totals[row], away, away_values)
+    totals[0] = POINTS_WIN * totals[2] + POINTS_DRAW * totals[3] + POINTS_LOSS * totals[4]
+    return list(index), totals
+
+
+def compute_standings(results: Iterable[Result], tiebreakers: Sequence[str] = (TIEBREAK_GOAL_DIFF,),
+                      vectorized: Optional[bool] = None) -> List[Standing]:
+    """
+    Classement complet d'un ensemble de résultats, recalculé en une fois (classements
+    historiques, recalculs en masse). Même résultat qu'une StandingsTable.
+
+    Args:
+        results: Résultats (domicile, extérieur, buts domicile, buts extérieur)
+        tiebreakers: Critères de départage (TIEBREAK_*)
+        vectorized: True pour le calcul NumPy (np.add.at, np.lexsort), False pour la
+            boucle Python, None pour choisir selon VECTORIZE_MIN_RESULTS
+
+    Raises:
+        ValueError: Si un critère est inconnu
+        RuntimeError: Si vectorized=True sans NumPy installé
+    """
+    results = list(results)
+    tiebreakers = tuple(tiebreakers)
+    if not _use_vectorized(vectorized, len(results)):
+        table = StandingsTable(tiebreakers, vectorize=False)
+        table.sync((str(i), *result) for i, result in enumerate(results))
+        return table.rows()
+
+    before, after, head_to_head = _split_tiebreakers(tiebreakers)
+    names, totals = _accumulate(results)
+    points, joues, gagnes, nuls, perdus, buts_pour, buts_contre = totals
+    sort_keys = [-points]
+    for rule in before + after:
+        sort_keys.append(buts_contre - buts_pour if rule == TIEBREAK_GOAL_DIFF else -buts_pour)
+    sort_keys.append(np.arange(len(names)))
+    # np.lexsort trie sur la dernière clé d'abord
+    order = np.lexsort(sort_keys[::-1]).tolist()
+    teams = [names[i] for i in order]
+    if head_to_head:
+        columns = [key.tolist() for key in sort_keys]
+        keys = {team: tuple(column[i] for column in columns) for i, team in enumerate(names)}
+        teams = _break_ties_head_to_head(teams, keys, 1 + len(before), HeadToHead.from_results(results))
+
+    index = {team: i for i, team in enumerate(names)}
+    columns = totals.tolist()
+    return [
+        Standing(position, team, *(column[index[team]] for column in columns))
+        for position, team in enumerate(teams, 1)
+    ]
+
+
+# Tables des classements calculés : nom (ex: identifiant de compétition) -> table
+_tables: Dict[str, StandingsTable] = {}
+
+
+def standings_backend() -> str:
+    """Calcul utilisé pour les recalculs en masse ("numpy" ou "python")."""
+    return "numpy" if np is not None else "python"
+
+
+def standings_table(name: str, tiebreakers: Sequence[str] = (TIEBREAK_GOAL_DIFF,)) -> StandingsTable:
+    """Retourne la table de classement name, en la créant si nécessaire."""
+    table = _tables.get(name)
+    if table is None:
+        table = _tables[name] = StandingsTable(tiebreakers)
+    return table
+
+
+def apply_live_result(renc_id: str, scores: Optional[Tuple[int, int]]) -> List[str]:
+    """
+    Répercute un résultat saisi en direct sur tous les classements qui contiennent la rencontre.
+
+    Args:
+        renc_id: RencId FFH de la rencontre
+        scores: (buts domicile, buts extérieur), ou None pour retirer le résultat
+
+    Returns:
+        List[str]: Noms des tables dont le classement a changé
+    """
+    return [
+        name for name, table in list(_tables.items())
+        if table.knows(renc_id) and table.set_live(renc_id, scores)
+    ]
+
+
+def get_standings_stats() -> Dict[str, Dict]:
+    """Compteurs de chaque table (synchronisations, résultats appliqués, résultats en direct)."""
+    return {
+        name: {**table.stats, "tiebreakers": list(table.tiebreakers),
+               "teams": len(table._teams), "live": len(table._live)}
+        for name, table in _tables.items()
+    }
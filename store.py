@@ -0,0 +1,180 @@
+"""
+Stockage persistant du cache sur disque (SQLite)
+Une machine qui redémarre (scale-to-zero) répond immédiatement avec le dernier
+instantané pendant que les données sont rafraîchies en arrière-plan
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, Optional, Tuple
+
+from ffh_client import Payload
+from models import from_public, to_public
+
+
+# Emplacement de la base : un volume persistant en production (voir fly.toml)
+CACHE_DB_PATH = os.environ.get(
+    "CACHE_DB_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "ffh_cache.sqlite3")
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS payloads (
+    key TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    body BLOB NOT NULL,
+    fetched_at REAL NOT NULL,
+    changed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    changed_at REAL NOT NULL
+);
+"""
+
+
+def _payload_key(key: Tuple) -> str:
+    """(SaisonAnnee, ManifId, PouleId) -> "2026|4317|" """
+    return "|".join(key)
+
+
+class SnapshotStore:
+    """
+    Instantané du cache dans une base SQLite :
+    - payloads : réponses brutes ListerRencontres (corps et empreinte)
+    - responses : données calculées du cache dynamique (JSON, au format public des
+      matchs et classements ; les enregistrements sont reconstruits au chargement)
+
+    Les écritures sont faites sur un thread dédié pour ne pas bloquer la boucle asyncio.
+    Si la base ne peut pas être ouverte, le stockage est simplement désactivé.
+    """
+
+    def __init__(self, path: str = CACHE_DB_PATH):
+        self.path = path
+        self.enabled = False
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def open(self) -> bool:
+        """
+        Ouvre (ou crée) la base.
+
+        Returns:
+            bool: True si le stockage persistant est actif
+        """
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            print(f"⚠️  Cache persistant désactivé ({self.path}): {e}")
+            self._conn = None
+            return False
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot")
+        self.enabled = True
+        print(f"✅ Cache persistant: {self.path}")
+        return True
+
+    def close(self) -> None:
+        """Termine les écritures en attente et ferme la base."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self.enabled = False
+
+    def load_responses(self) -> Iterator[Tuple[str, Any, float, float]]:
+        """Données calculées sauvegardées : (key, valeur, stored_at, changed_at)."""
+        if not self.enabled:
+            return
+        rows = self._conn.execute("SELECT key, value, stored_at, changed_at FROM responses").fetchall()
+        for key, value, stored_at, changed_at in rows:
+            try:
+                yield key, from_public(json.loads(value)), stored_at, changed_at
+            except ValueError as e:
+                print(f"⚠️  Entrée '{key}' illisible dans le cache persistant: {e}")
+
+    def load_payloads(self) -> Iterator[Tuple[Tuple, bytes, str, float, float]]:
+        """
+        Réponses brutes sauvegardées : (key, corps, empreinte, fetched_at, changed_at).
+        Le corps n'est pas décodé ici : il ne l'est que s'il est réutilisé.
+        """
+        if not self.enabled:
+            return
+        rows = self._conn.execute("SELECT key, digest, body, fetched_at, changed_at FROM payloads").fetchall()
+        for key, digest, body, fetched_at, changed_at in rows:
+            yield tuple(key.split("|")), bytes(body), digest, fetched_at, changed_at
+
+    def save_response(self, key: str, value: Any, stored_at: float, changed_at: float, changed: bool) -> None:
+        """
+        Enregistre une donnée du cache dynamique (abonné de SWRCache.on_store).
+        Si la valeur n'a pas changé, seule la date de stockage est mise à jour.
+        """
+        if not self.enabled:
+            return
+        if changed:
+            self._write(
+                "INSERT OR REPLACE INTO responses (key, value, stored_at, changed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(to_public(value), ensure_ascii=False), stored_at, changed_at)
+            )
+        else:
+            self._write("UPDATE responses SET stored_at = ? WHERE key = ?", (stored_at, key))
+
+    def save_payload(self, key: Tuple, payload: Payload, body: Optional[bytes]) -> None:
+        """
+        Enregistre une réponse brute ListerRencontres (abonné de on_rencontres_stored).
+        Si le contenu n'a pas changé (body None), seule la date de téléchargement est mise à jour.
+        """
+        if not self.enabled:
+            return
+        if body is not None:
+            self._write(
+                "INSERT OR REPLACE INTO payloads (key, digest, body, fetched_at, changed_at) VALUES (?, ?, ?, ?, ?)",
+                (_payload_key(key), payload.digest, body, payload.fetched_at, payload.changed_at)
+            )
+        else:
+            self._write(
+                "UPDATE payloads SET fetched_at = ? WHERE key = ?",
+                (payload.fetched_at, _payload_key(key))
+            )
+
+    def _write(self, sql: str, params: Tuple) -> None:
+        """Exécute une écriture sur le thread dédié."""
+        self._executor.submit(self._execute, sql, params)
+
+    def _execute(self, sql: str, params: Tuple) -> None:
+        try:
+            self._conn.execute(sql, params)
+            self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"⚠️  Écriture du cache persistant échouée: {e}")
+
+    async def stats(self) -> dict:
+        """Nombre d'entrées sauvegardées et taille de la base."""
+        if not self.enabled:
+            return {"enabled": False, "path": self.path}
+        # Lecture sur le thread d'écriture (la connexion n'est jamais utilisée par deux threads
+        # à la fois), attendue sans bloquer la boucle d'événements
+        loop = asyncio.get_running_loop()
+        responses, payloads = await loop.run_in_executor(self._executor, self._count)
+        return {
+            "enabled": True,
+            "path": self.path,
+            "responses": responses,
+            "payloads": payloads,
+            "size_bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        }
+
+    def _count(self) -> Tuple[int, int]:
+        responses = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        payloads = self._conn.execute("SELECT COUNT(*) FROM payloads").fetchone()[0]
+        return responses, payloads
@@ -0,0 +1,267 @@
+"""
+Index des équipes et de leurs matchs
+Chaque équipe FFH est identifiée une seule fois, par son EquipeId (ou son nom si la
+FFH ne le fournit pas) : nom d'origine, nom canonique sans numéro de poule, alias
+(noms vus pour la même équipe) et noms affichés par compétition sont calculés à la
+première rencontre de l'équipe. Les filtres d'équipe des compétitions deviennent des
+recherches dans des ensembles, et la normalisation des noms est faite une fois par
+équipe au lieu d'une fois par match à chaque rafraîchissement.
+
+L'index des matchs (MatchIndex) associe chaque équipe à ses matchs dans toutes les
+réponses ListerRencontres chargées (championnats, poules régionales, U14) : le
+calendrier d'une équipe ou d'un club est lu sans appel à la FFH ni parcours des matchs.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from models import Match, intern_name
+
+
+# Numéro de poule en fin de nom : " X" où X est un chiffre SEUL (1-9)
+_POULE_SUFFIX = re.compile(r'\s+[1-9]\s*$')
+
+
+def normalize_team_name(team_name: str) -> str:
+    """
+    Normalise le nom d'une équipe en supprimant les numéros de poule.
+    Ex: "CARQUEFOU HC 3" -> "CARQUEFOU HC"
+    Mais garde les numéros qui font partie du nom: "CA MONTROUGE 92" -> "CA MONTROUGE 92"
+
+    Args:
+        team_name: Le nom de l'équipe à normaliser
+
+    Returns:
+        str: Le nom normalisé
+    """
+    if not team_name:
+        return team_name
+    return _POULE_SUFFIX.sub('', team_name.strip())
+
+
+class TeamIdentity:
+    """
+    Une équipe de l'index.
+
+    - key : identifiant dans l'index (EquipeId FFH, ou nom si absent)
+    - equipe_id : EquipeId FFH ("" si inconnu)
+    - nom, nom_upper : nom actuel publié par la FFH, et en majuscules pour les filtres
+    - canonical : nom sans numéro de poule
+    - aliases : tous les noms vus pour cette équipe (noms successifs, nom canonique)
+    """
+
+    __slots__ = ("key", "equipe_id", "nom", "nom_upper", "canonical", "aliases", "_display")
+
+    def __init__(self, key: str, equipe_id: str, nom: str):
+        self.key = key
+        self.equipe_id = equipe_id
+        self.aliases: Set[str] = set()
+        self._set_name(nom)
+
+    def _set_name(self, nom: str) -> None:
+        self.nom = nom
+        self.nom_upper = nom.upper()
+        self.canonical = intern_name(normalize_team_name(nom))
+        self.aliases.update((nom, self.canonical))
+        # (normalize_names, rename) -> nom affiché
+        self._display: Dict[Tuple, str] = {}
+
+    def display_name(self, normalize: bool = False, rename: Optional[Tuple[str, str]] = None) -> str:
+        """
+        Nom affiché dans une compétition, calculé une fois par équipe et par réglage :
+        sans numéro de poule (normalize), puis harmonisé (rename : motif, nom affiché).
+        """
+        setting = (normalize, rename)
+        name = self._display.get(setting)
+        if name is None:
+            name = self.canonical if normalize else self.nom
+            if rename and rename[0] in name.upper():
+                name = rename[1]
+            name = self._display[setting] = intern_name(name)
+        return name
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.key,
+            "equipe_id": self.equipe_id,
+            "nom": self.nom,
+            "canonical": self.canonical,
+            "aliases": sorted(self.aliases)
+        }
+
+    def __repr__(self) -> str:
+        return f"TeamIdentity({self.key}, {self.nom})"
+
+
+class TeamIndex:
+    """
+    Index des équipes rencontrées dans les réponses de la FFH.
+
+    - identify() : l'équipe d'un match (créée à la première rencontre)
+    - members(motif) : clés des équipes dont le nom contient le motif (en majuscules),
+      tenu à jour à chaque nouvelle équipe ou changement de nom
+    - find() : équipe par identifiant, nom ou alias
+    - club(nom) : clés des équipes d'un même club (même nom canonique)
+    """
+
+    __slots__ = ("_teams", "_aliases", "_patterns", "_clubs")
+
+    def __init__(self):
+        self._teams: Dict[str, TeamIdentity] = {}
+        # alias en majuscules -> clé (première équipe ayant porté ce nom)
+        self._aliases: Dict[str, str] = {}
+        # motif de filtre -> clés des équipes dont le nom le contient
+        self._patterns: Dict[str, Set[str]] = {}
+        # nom canonique en majuscules -> clés des équipes du club
+        self._clubs: Dict[str, Set[str]] = {}
+
+    def identify(self, equipe_id: str, nom: str) -> TeamIdentity:
+        """
+        Équipe d'un match, par EquipeId (ou par nom si l'EquipeId est inconnu).
+        Un changement de nom pour un même EquipeId est enregistré comme alias.
+        """
+        key = equipe_id or nom
+        identity = self._teams.get(key)
+        if identity is not None and identity.nom == nom:
+            return identity
+        if identity is None:
+            identity = self._teams[key] = TeamIdentity(key, equipe_id, nom)
+        else:
+            self._clubs.get(identity.canonical.upper(), set()).discard(key)
+            identity._set_name(nom)
+        self._clubs.setdefault(identity.canonical.upper(), set()).add(key)
+        for alias in identity.aliases:
+            self._aliases.setdefault(alias.upper(), key)
+        for pattern, members in self._patterns.items():
+            if pattern in identity.nom_upper:
+                members.add(key)
+            else:
+                members.discard(key)
+        return identity
+
+    def get(self, key: str) -> Optional[TeamIdentity]:
+        return self._teams.get(key)
+
+    def find(self, name_or_key: str) -> Optional[TeamIdentity]:
+        """Équipe par identifiant, nom ou alias (casse ignorée)."""
+        identity = self._teams.get(name_or_key)
+        if identity is not None:
+            return identity
+        key = self._aliases.get(name_or_key.upper())
+        return self._teams.get(key) if key is not None else None
+
+    def members(self, pattern: str) -> Set[str]:
+        """Clés des équipes dont le nom contient pattern (en majuscules)."""
+        members = self._patterns.get(pattern)
+        if members is None:
+            members = self._patterns[pattern] = {
+                key for key, identity in self._teams.items() if pattern in identity.nom_upper
+            }
+        return members
+
+    def club(self, name: str) -> Set[str]:
+        """Clés des équipes dont le nom canonique est name (casse et numéro de poule ignorés)."""
+        return self._clubs.get(normalize_team_name(name).upper(), set())
+
+    def teams(self) -> List[TeamIdentity]:
+        return list(self._teams.values())
+
+    def __len__(self) -> int:
+        return len(self._teams)
+
+    def stats(self) -> Dict:
+        return {"teams": len(self._teams), "aliases": len(self._aliases), "filters": len(self._patterns),
+                "clubs": len(self._clubs)}
+
+
+class MatchIndex:
+    """
+    Index inversé équipe -> matchs, sur toutes les listes de matchs chargées.
+
+    Une source est une réponse ListerRencontres (SaisonAnnee, ManifId, PouleId). À chaque
+    nouvelle liste de matchs d'une source, seules les entrées de cette source sont
+    remplacées ; une liste inchangée (même objet, voir ffh_client.Payload) n'est pas
+    réindexée. Les matchs sont les enregistrements partagés des réponses (non copiés).
+    """
+
+    __slots__ = ("_teams", "_sources", "_source_teams", "_by_team", "updates")
+
+    def __init__(self, teams: TeamIndex):
+        self._teams = teams
+        # source -> liste de matchs indexée
+        self._sources: Dict[Tuple, List[Match]] = {}
+        # source -> clés des équipes qui y jouent (pour retirer une ancienne liste)
+        self._source_teams: Dict[Tuple, Set[str]] = {}
+        # clé d'équipe -> source -> matchs de l'équipe dans cette source
+        self._by_team: Dict[str, Dict[Tuple, List[Match]]] = {}
+        self.updates = 0
+
+    def update(self, source: Tuple, matches: List[Match]) -> bool:
+        """
+        Indexe la liste de matchs d'une source, à la place de la précédente.
+
+        Returns:
+            bool: False si la liste était déjà indexée
+        """
+        if self._sources.get(source) is matches:
+            return False
+        self._remove(source)
+        identify = self._teams.identify
+        by_team = self._by_team
+        keys: Set[str] = set()
+        for match in matches:
+            domicile = identify(match.domicile_id, match.equipe_domicile).key
+            exterieur = identify(match.exterieur_id, match.equipe_exterieur).key
+            by_team.setdefault(domicile, {}).setdefault(source, []).append(match)
+            if exterieur != domicile:
+                by_team.setdefault(exterieur, {}).setdefault(source, []).append(match)
+            keys.add(domicile)
+            keys.add(exterieur)
+        self._sources[source] = matches
+        self._source_teams[source] = keys
+        self.updates += 1
+        return True
+
+    def _remove(self, source: Tuple) -> None:
+        self._sources.pop(source, None)
+        for key in self._source_teams.pop(source, ()):
+            sources = self._by_team.get(key)
+            if sources is not None:
+                sources.pop(source, None)
+                if not sources:
+                    del self._by_team[key]
+
+    def matches(self, keys: Iterable[str]) -> List[Tuple[Tuple, Match]]:
+        """
+        Matchs des équipes keys, (source, match) triés par date. Un match publié par
+        plusieurs sources (manifestation et poule) ou opposant deux des équipes
+        n'apparaît qu'une fois.
+        """
+        seen: Set = set()
+        selected = []
+        for key in keys:
+            for source, matches in self._by_team.get(key, {}).items():
+                for match in matches:
+                    marker = match.renc_id or id(match)
+                    if marker not in seen:
+                        seen.add(marker)
+                        selected.append((source, match))
+        selected.sort(key=lambda entry: (not entry[1].date, entry[1].date))
+        return selected
+
+    def sources(self, key: str) -> List[Tuple]:
+        """Sources dans lesquelles l'équipe key a des matchs."""
+        return list(self._by_team.get(key, {}))
+
+    def stats(self) -> Dict:
+        return {
+            "sources": len(self._sources),
+            "teams": len(self._by_team),
+            "matches": sum(len(matches) for matches in self._sources.values()),
+            "updates": self.updates
+        }
+
+
+# Index partagés par le scraper et l'API
+team_index = TeamIndex()
+match_index = MatchIndex(team_index)
@@ -1,19 +1,41 @@
 #!/usr/bin/env python
 """
 Script de test pour vérifier le fonctionnement des fonctions scraper
+(Elite Hommes Gazon). Pour tester sans l'API de la FFH, lancer le serveur de
+substitution (ffh_standin.py) et définir FFH_BASE_URL=http://127.0.0.1:8001/rest2/Championnats
 """
 
+import asyncio
 import sys
-from scraper import get_ranking, get_matches
+from ffh_client import close_client
+from models import to_public
+from competitions import get_competition
+from scraper import get_classement, get_matchs
+
+ELITE_HOMMES = get_competition("elite-hommes-gazon")
+
+
+def run(fetch):
+    """
+    Exécute une fonction asynchrone du scraper (résultat au format JSON public)
+    puis ferme le client HTTP partagé.
+    """
+    async def _run():
+        try:
+            return to_public(await fetch())
+        finally:
+            await close_client()
+    return asyncio.run(_run())
+
 
 print("=" * 60)
 print("TEST DE L'API HOCKEY SUR GAZON FRANCE")
 print("=" * 60)
 
-print("\n1️⃣  Test de get_ranking()...")
+print("\n1️⃣  Test de get_classement(elite-hommes-gazon)...")
 print("-" * 60)
 try:
-    ranking = get_ranking()
+    ranking = run(lambda: get_classement(ELITE_HOMMES))
     if ranking:
         print(f"✅ Succès ! {len(ranking)} équipes récupérées")
         print("\nTop 3 du classement :")
@@ -28,10 +50,10 @@ except Exception as e:
     traceback.print_exc()
     sys.exit(1)
 
-print("\n2️⃣  Test de get_matches()...")
+print("\n2️⃣  Test de get_matchs(elite-hommes-gazon)...")
 print("-" * 60)
 try:
-    matches = get_matches()
+    matches = run(lambda: get_matchs(ELITE_HOMMES))
     if matches:
         print(f"✅ Succès ! {len(matches)} matchs récupérés")
         # Afficher les 3 premiers matchs avec résultats